@@ -8,6 +8,7 @@ from sqlmodel import SQLModel
 from alembic import context
 from app import models  # noqa: F401
 from app.config import get_settings
+from app.core.migrations import include_name
 
 config = context.config
 _models = models
@@ -37,6 +38,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=database_url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -46,7 +48,16 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    if connection.dialect.name == "sqlite":
+        # Batch operations recreate tables, which fails with enforcement on
+        # as soon as another table references the one being rebuilt.
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
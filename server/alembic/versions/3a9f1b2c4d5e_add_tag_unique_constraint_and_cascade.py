@@ -21,6 +21,21 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     """Recreate tags table with CASCADE delete and unique(user_id, name)."""
+    if op.get_bind().dialect.name != "sqlite":
+        # Other backends can alter constraints in place; rebuilding the table
+        # would fail because task_tags references it.
+        op.drop_constraint("tags_user_id_fkey", "tags", type_="foreignkey")
+        op.create_foreign_key(
+            "fk_tags_user_id",
+            "tags",
+            "users",
+            ["user_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+        op.create_unique_constraint("uq_tags_user_name", "tags", ["user_id", "name"])
+        return
+
     with op.batch_alter_table("tags", recreate="always") as batch_op:
         batch_op.create_foreign_key(
             "fk_tags_user_id",
@@ -34,6 +49,18 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     """Revert to tags table without CASCADE or unique constraint."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint("uq_tags_user_name", "tags", type_="unique")
+        op.drop_constraint("fk_tags_user_id", "tags", type_="foreignkey")
+        op.create_foreign_key(
+            "tags_user_id_fkey",
+            "tags",
+            "users",
+            ["user_id"],
+            ["id"],
+        )
+        return
+
     with op.batch_alter_table("tags", recreate="always") as batch_op:
         batch_op.drop_constraint("uq_tags_user_name", type_="unique")
         batch_op.drop_constraint("fk_tags_user_id", type_="foreignkey")
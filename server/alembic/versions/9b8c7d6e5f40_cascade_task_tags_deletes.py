@@ -0,0 +1,100 @@
+"""cascade task_tags deletes and remove orphaned rows
+
+Revision ID: 9b8c7d6e5f40
+Revises: 7f6b5d4c3a21
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "9b8c7d6e5f40"
+down_revision: str | Sequence[str] | None = "7f6b5d4c3a21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _task_tags(ondelete: str | None) -> sa.Table:
+    return sa.Table(
+        "task_tags",
+        sa.MetaData(),
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", name="fk_task_tags_task_id", ondelete=ondelete),
+            primary_key=True,
+        ),
+        sa.Column(
+            "tag_id",
+            sa.Integer(),
+            sa.ForeignKey("tags.id", name="fk_task_tags_tag_id", ondelete=ondelete),
+            primary_key=True,
+        ),
+    )
+
+
+def upgrade() -> None:
+    """Add ON DELETE CASCADE to task_tags after deleting rows orphaned so far."""
+    # SQLite used to run with foreign_keys off, so earlier cascades never fired.
+    op.execute("DELETE FROM tasks WHERE user_id NOT IN (SELECT id FROM users)")
+    op.execute("DELETE FROM tags WHERE user_id NOT IN (SELECT id FROM users)")
+    op.execute(
+        "DELETE FROM task_tags"
+        " WHERE task_id NOT IN (SELECT id FROM tasks)"
+        " OR tag_id NOT IN (SELECT id FROM tags)"
+    )
+
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint("task_tags_task_id_fkey", "task_tags", type_="foreignkey")
+        op.drop_constraint("task_tags_tag_id_fkey", "task_tags", type_="foreignkey")
+        op.create_foreign_key(
+            "fk_task_tags_task_id",
+            "task_tags",
+            "tasks",
+            ["task_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+        op.create_foreign_key(
+            "fk_task_tags_tag_id",
+            "task_tags",
+            "tags",
+            ["tag_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+    else:
+        # The original foreign keys are unnamed, so describe the new table
+        # rather than dropping them one by one.
+        with op.batch_alter_table(
+            "task_tags", recreate="always", copy_from=_task_tags("CASCADE")
+        ):
+            pass
+
+    # Cascading a tag delete looks link rows up by tag_id.
+    op.create_index("ix_task_tags_tag_id", "task_tags", ["tag_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Restore task_tags foreign keys without ON DELETE CASCADE."""
+    op.drop_index("ix_task_tags_tag_id", table_name="task_tags")
+
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint("fk_task_tags_task_id", "task_tags", type_="foreignkey")
+        op.drop_constraint("fk_task_tags_tag_id", "task_tags", type_="foreignkey")
+        op.create_foreign_key(
+            "task_tags_task_id_fkey", "task_tags", "tasks", ["task_id"], ["id"]
+        )
+        op.create_foreign_key(
+            "task_tags_tag_id_fkey", "task_tags", "tags", ["tag_id"], ["id"]
+        )
+        return
+
+    with op.batch_alter_table(
+        "task_tags", recreate="always", copy_from=_task_tags(None)
+    ):
+        pass
@@ -0,0 +1,56 @@
+"""make tasks.completed_at timezone-aware
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a9b0c1d2e3f4"
+down_revision: str | Sequence[str] | None = "f8a9b0c1d2e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# completed_at has always been written in UTC. SQLite stores aware and naive
+# datetimes alike, and a batch rebuild of tasks would drop the full-text
+# search triggers, so only other backends change the column type.
+#
+# The completed_at sort index is rebuilt around the change: carried over,
+# its '-infinity' literal would keep the old type behind a cast that
+# PostgreSQL does not accept in an index.
+SORT_INDEX = "ix_tasks_user_id_completed_at_sort"
+SORT_KEY = "coalesce(completed_at, '-infinity')"
+
+
+def _alter_completed_at(type_: sa.DateTime, existing_type: sa.DateTime) -> None:
+    op.drop_index(SORT_INDEX, table_name="tasks")
+    op.alter_column(
+        "tasks",
+        "completed_at",
+        type_=type_,
+        existing_type=existing_type,
+        existing_nullable=True,
+        postgresql_using="completed_at AT TIME ZONE 'UTC'",
+    )
+    op.create_index(
+        SORT_INDEX, "tasks", ["user_id", sa.text(SORT_KEY), "id"], unique=False
+    )
+
+
+def upgrade() -> None:
+    """Store completed_at as timestamptz, which asyncpg needs for aware values."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    _alter_completed_at(sa.DateTime(timezone=True), sa.DateTime())
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    _alter_completed_at(sa.DateTime(), sa.DateTime(timezone=True))
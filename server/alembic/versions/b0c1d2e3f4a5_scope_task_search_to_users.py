@@ -0,0 +1,72 @@
+"""scope full-text task search to one user
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "b0c1d2e3f4a5"
+down_revision: str | Sequence[str] | None = "a9b0c1d2e3f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The SQLite DDL of app.models.tasks.SEARCH_DDL before and after this
+# revision. The FTS5 column list cannot be altered, so the table and its
+# triggers are rebuilt. PostgreSQL filters on the user_id index already.
+TOKENIZE = "tokenize='unicode61 remove_diacritics 2'"
+SEARCH_TABLES = {
+    "old": f"title, description, content='tasks', content_rowid='id', {TOKENIZE}",
+    "new": (
+        f"title, description, user_id, content='tasks', content_rowid='id', {TOKENIZE}"
+    ),
+}
+COLUMNS = {"old": ["title", "description"], "new": ["title", "description", "user_id"]}
+TRIGGERS = ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update")
+
+
+def _triggers(columns: list[str]) -> dict[str, str]:
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    row = f"(rowid, {names}) VALUES (new.id, {new})"
+    delete = f"(tasks_fts, rowid, {names}) VALUES ('delete', old.id, {old})"
+    return {
+        "tasks_fts_insert": (
+            f"AFTER INSERT ON tasks BEGIN INSERT INTO tasks_fts{row}; END"
+        ),
+        "tasks_fts_delete": (
+            f"AFTER DELETE ON tasks BEGIN INSERT INTO tasks_fts{delete}; END"
+        ),
+        "tasks_fts_update": (
+            "AFTER UPDATE OF title, description ON tasks BEGIN"
+            f" INSERT INTO tasks_fts{delete}; INSERT INTO tasks_fts{row}; END"
+        ),
+    }
+
+
+def _rebuild(version: str) -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER {name}")
+    op.execute("DROP TABLE tasks_fts")
+    op.execute(f"CREATE VIRTUAL TABLE tasks_fts USING fts5({SEARCH_TABLES[version]})")
+    for name, body in _triggers(COLUMNS[version]).items():
+        op.execute(f"CREATE TRIGGER {name} {body}")
+    op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    """Index each task's user_id in the search table."""
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild("new")
+
+
+def downgrade() -> None:
+    """Index only titles and descriptions again."""
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild("old")
@@ -0,0 +1,39 @@
+"""add revoked_tokens.revoked_at
+
+Revision ID: c1d2e3f4a5b6
+Revises: b0c1d2e3f4a5
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c1d2e3f4a5b6"
+down_revision: str | Sequence[str] | None = "b0c1d2e3f4a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record when each token was revoked."""
+    # Existing rows stay null: workers load every unexpired row on start.
+    op.add_column(
+        "revoked_tokens",
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_revoked_tokens_revoked_at"),
+        "revoked_tokens",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop revoked_tokens.revoked_at."""
+    op.drop_index(op.f("ix_revoked_tokens_revoked_at"), table_name="revoked_tokens")
+    op.drop_column("revoked_tokens", "revoked_at")
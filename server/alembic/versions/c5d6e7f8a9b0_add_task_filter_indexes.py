@@ -0,0 +1,39 @@
+"""add task filter indexes
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4e5f6a7c8d9
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "c5d6e7f8a9b0"
+down_revision: str | Sequence[str] | None = "b4e5f6a7c8d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the completed and deadline filters of the task list."""
+    op.create_index(
+        "ix_tasks_user_id_completed_position",
+        "tasks",
+        ["user_id", "completed", "position"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_user_id_deadline",
+        "tasks",
+        ["user_id", "deadline"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the task filter indexes."""
+    op.drop_index("ix_tasks_user_id_deadline", table_name="tasks")
+    op.drop_index("ix_tasks_user_id_completed_position", table_name="tasks")
@@ -49,4 +49,5 @@ def upgrade() -> None:
 def downgrade() -> None:
     """Downgrade schema."""
     with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_index("ix_tasks_position")
         batch_op.drop_column("position")
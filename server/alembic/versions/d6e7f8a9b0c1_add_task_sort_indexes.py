@@ -0,0 +1,38 @@
+"""add task sort indexes
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: str | Sequence[str] | None = "c5d6e7f8a9b0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match the sort keys in app.tasks.service.SORT_ORDERS exactly. id is
+# listed for PostgreSQL; SQLite already appends the rowid to every index.
+SORT_INDEXES = {
+    "ix_tasks_user_id_deadline_sort": "coalesce(deadline, '9999-12-31')",
+    "ix_tasks_user_id_title_sort": "lower(title)",
+    "ix_tasks_user_id_completed_at_sort": "coalesce(completed_at, '-infinity')",
+}
+
+
+def upgrade() -> None:
+    """Index the deadline, title and completed_at sort orders of the task list."""
+    for name, key in SORT_INDEXES.items():
+        op.create_index(name, "tasks", ["user_id", sa.text(key), "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the task sort indexes."""
+    for name in reversed(SORT_INDEXES):
+        op.drop_index(name, table_name="tasks")
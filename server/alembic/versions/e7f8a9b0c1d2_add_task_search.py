@@ -0,0 +1,68 @@
+"""add full-text search over tasks
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "e7f8a9b0c1d2"
+down_revision: str | Sequence[str] | None = "d6e7f8a9b0c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The DDL of app.models.tasks.SEARCH_DDL as of this revision.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, description), 'B')"
+)
+FTS_ROW = "(rowid, title, description) VALUES (new.id, new.title, new.description)"
+FTS_DELETE = (
+    "(tasks_fts, rowid, title, description)"
+    " VALUES ('delete', old.id, old.title, old.description)"
+)
+SQLITE_TRIGGERS = {
+    "tasks_fts_insert": f"AFTER INSERT ON tasks BEGIN INSERT INTO tasks_fts{FTS_ROW}; END",
+    "tasks_fts_delete": f"AFTER DELETE ON tasks BEGIN INSERT INTO tasks_fts{FTS_DELETE}; END",
+    "tasks_fts_update": (
+        "AFTER UPDATE OF title, description ON tasks BEGIN"
+        f" INSERT INTO tasks_fts{FTS_DELETE}; INSERT INTO tasks_fts{FTS_ROW}; END"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Index task titles and descriptions for full-text search."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute(
+            f"CREATE INDEX ix_tasks_search ON tasks USING gin (({SEARCH_VECTOR}))"
+        )
+        return
+
+    # External content: the index stores no copy of the text, and the
+    # triggers keep it in step with tasks. A later batch migration that
+    # recreates tasks drops the triggers and must create them again.
+    op.execute(
+        "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+        "title, description, content='tasks', content_rowid='id',"
+        " tokenize='unicode61 remove_diacritics 2')"
+    )
+    for name, body in SQLITE_TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {body}")
+    op.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop the full-text search index."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("DROP INDEX ix_tasks_search")
+        return
+
+    for name in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER {name}")
+    op.execute("DROP TABLE tasks_fts")
@@ -0,0 +1,73 @@
+"""add change versions and tombstones for sync
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlmodel.sql import sqltypes
+
+
+revision: str = "f8a9b0c1d2e3"
+down_revision: str | Sequence[str] | None = "e7f8a9b0c1d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Plain ADD COLUMN, not batch mode: rebuilding tasks on SQLite would drop
+# the full-text search triggers.
+VERSIONED_TABLES = ("users", "tasks", "tags", "task_tags")
+
+
+def _version(name: str = "version") -> sa.Column:
+    return sa.Column(name, sa.Integer(), server_default="0", nullable=False)
+
+
+def upgrade() -> None:
+    """Stamp rows with per-user change versions and record deletions."""
+    for table in VERSIONED_TABLES:
+        op.add_column(table, _version())
+    op.add_column("users", _version("purged_version"))
+    op.create_index(
+        "ix_tasks_user_id_version", "tasks", ["user_id", "version"], unique=False
+    )
+    op.create_index(
+        "ix_tags_user_id_version", "tags", ["user_id", "version"], unique=False
+    )
+
+    op.create_table(
+        "tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sqltypes.AutoString(length=8), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tombstones_user_id_version",
+        "tombstones",
+        ["user_id", "version"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_tombstones_deleted_at"), "tombstones", ["deleted_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the tombstones table and the version columns."""
+    op.drop_index(op.f("ix_tombstones_deleted_at"), table_name="tombstones")
+    op.drop_index("ix_tombstones_user_id_version", table_name="tombstones")
+    op.drop_table("tombstones")
+    op.drop_index("ix_tags_user_id_version", table_name="tags")
+    op.drop_index("ix_tasks_user_id_version", table_name="tasks")
+    op.drop_column("users", "purged_version")
+    for table in reversed(VERSIONED_TABLES):
+        op.drop_column(table, "version")
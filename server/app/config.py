@@ -1,8 +1,11 @@
+import os
 import secrets
+import warnings
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, ValidationInfo, field_validator, model_validator
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
@@ -11,6 +14,7 @@ from pydantic_settings import (
 APP_DIR = Path(__file__).resolve().parent
 STATIC_ROOT = APP_DIR / "static"
 DATA_DIR = APP_DIR.parent / "data"
+JWT_SECRET_FILE = "jwt_secret"
 
 
 class GrindboardBaseSettings(BaseSettings):
@@ -38,28 +42,186 @@ class AppConfig(GrindboardBaseSettings):
         default_factory=lambda: ["GET", "POST", "PUT", "PATCH", "DELETE"]
     )
     cors_allow_headers: list[str] = Field(default_factory=lambda: ["*"])
+    cors_expose_headers: list[str] = Field(
+        default_factory=lambda: ["X-Next-Cursor", "ETag"]
+    )
+
+    # Defaults to SQLite in data_dir; set a postgresql:// URL to use asyncpg.
+    database_url: str = ""
+
+    # Connection pool; with SQLite this sizes the read pool, writes always
+    # go through a single dedicated connection. Defaults depend on the backend.
+    database_pool_size: int | None = None
+    database_max_overflow: int = 0
+    database_pool_pre_ping: bool = False
+    database_pool_recycle_seconds: int = 30 * 60
+    database_write_retries: int = 5
+    database_write_backoff_ms: int = 20
+
+    # Schema migrations. Disable migrate_on_startup when deploys run
+    # `python -m app.migrate` before starting the server.
+    database_migrate_on_startup: bool = True
+    database_create_all_when_empty: bool = False
+
+    # Token-bucket rate limits. Sign-in is limited per client address and the
+    # rest of the API per user; 0 disables a limit. "sqlite" storage shares
+    # buckets between the workers on one host via data_dir/ratelimit.db.
+    # X-Forwarded-For is only believed from trusted_proxies (IPs or CIDRs).
+    rate_limit_enabled: bool = True
+    rate_limit_storage: Literal["memory", "sqlite"] = "memory"
+    rate_limit_auth_per_minute: int = 10
+    rate_limit_user_per_minute: int = 600
+    rate_limit_user_burst: int = 100
+    trusted_proxies: list[str] = Field(default_factory=list)
+
+    # Group commit: coalesce small writes arriving within a short window into
+    # one transaction (and one fsync). Opt-in.
+    group_commit_enabled: bool = False
+    group_commit_window_ms: float = 2.0
+    group_commit_max_batch: int = 64
+
+    # /metrics is unauthenticated and reveals traffic patterns (throttled
+    # clients, write batching), so it answers 404 unless enabled. Enable it
+    # only where the port is reachable by the scraper alone.
+    metrics_enabled: bool = False
+
+    # Incremental sync. Deletions are kept as tombstones for this long; a
+    # client that last synced before a purge is sent the whole board again.
+    sync_tombstone_retention_days: int = 30
+    sync_tombstone_purge_seconds: float = 60 * 60
+
+    # SQLite performance profile, applied to every new pooled connection.
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # bytes
+    sqlite_cache_size: int = -64_000  # negative values are KiB, i.e. ~64MB
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout_ms: int = 5_000
+    sqlite_foreign_keys: bool = True
+
+    @field_validator("database_url")
+    @classmethod
+    def validate_database_url(cls, v: str, info: ValidationInfo) -> str:
+        if not v:
+            return f"sqlite+aiosqlite:///{info.data['data_dir']}/grindboard.db"
+        for prefix in ("postgres://", "postgresql://"):
+            if v.startswith(prefix):
+                return "postgresql+asyncpg://" + v.removeprefix(prefix)
+        return v
+
+    @property
+    def database_backend(self) -> str:
+        return self.database_url.split(":", 1)[0].split("+", 1)[0]
 
     @property
-    def database_url(self) -> str:
-        return f"sqlite+aiosqlite:///{self.data_dir}/grindboard.db"
+    def engine_kwargs(self) -> dict[str, Any]:
+        cores = os.cpu_count() or 4
+        if self.database_backend == "postgresql":
+            # Queries spend most of their time waiting on the server.
+            default_pool_size = max(10, cores * 2)
+        else:
+            default_pool_size = cores
+        kwargs: dict[str, Any] = {
+            "pool_size": self.database_pool_size or default_pool_size,
+            "max_overflow": self.database_max_overflow,
+            "pool_pre_ping": self.database_pool_pre_ping,
+        }
+        if self.database_backend == "postgresql":
+            # Recycle before server/proxy idle timeouts; the JIT only adds
+            # planning latency to the short OLTP queries this app runs.
+            kwargs["pool_recycle"] = self.database_pool_recycle_seconds
+            kwargs["connect_args"] = {
+                "server_settings": {
+                    "application_name": self.project_name.lower(),
+                    "jit": "off",
+                }
+            }
+        return kwargs
+
+    @property
+    def sqlite_pragmas(self) -> dict[str, Any]:
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "mmap_size": self.sqlite_mmap_size,
+            "cache_size": self.sqlite_cache_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+            "foreign_keys": "ON" if self.sqlite_foreign_keys else "OFF",
+        }
 
 
 class ServerConfig(GrindboardBaseSettings):
     host: str = "127.0.0.1"
     port: int = 3000
 
+    # Production tuning. Each worker is a separate process with its own
+    # caches and pools; use rate_limit_storage="sqlite" to share limits.
+    # "auto" picks uvloop and httptools when they are installed.
+    workers: int = 1
+    loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http: Literal["auto", "h11", "httptools"] = "auto"
+    limit_concurrency: int | None = None
+    backlog: int = 2048
+    timeout_keep_alive_seconds: int = 5
+    timeout_graceful_shutdown_seconds: int = 30
+
+    @property
+    def uvicorn_kwargs(self) -> dict[str, Any]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "workers": self.workers,
+            "loop": self.loop,
+            "http": self.http,
+            "limit_concurrency": self.limit_concurrency,
+            "backlog": self.backlog,
+            "timeout_keep_alive": self.timeout_keep_alive_seconds,
+            "timeout_graceful_shutdown": self.timeout_graceful_shutdown_seconds,
+            # Client addresses behind proxies are resolved by the rate limiter
+            # against trusted_proxies; don't let uvicorn rewrite them first.
+            "proxy_headers": False,
+        }
+
 
 class AuthConfig(GrindboardBaseSettings):
     token_ttl_minutes: int = 60 * 24  # 24h by default
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
 
-    @field_validator("jwt_secret_key")
-    @classmethod
-    def validate_secret_key(cls, v: str) -> str:
-        if not v:
-            return secrets.token_urlsafe(32)
-        return v
+    # Password hashing runs in a pool off the event loop. Hashes beyond
+    # workers + max_pending are refused with 503 instead of queueing.
+    # hashlib releases the GIL, so threads are enough unless the host has
+    # other CPU-bound Python work competing for it.
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int | None = None  # defaults to the CPU count
+    password_hash_max_pending: int = 32
+
+    # New hashes use this scheme at a cost calibrated at startup to take
+    # about budget_ms, but never less than min_cost (PBKDF2 iterations or
+    # scrypt N; the scheme default when unset). 0 disables calibration.
+    # Older or cheaper hashes are upgraded on the user's next login.
+    password_hash_scheme: Literal["pbkdf2_sha256", "scrypt"] = "pbkdf2_sha256"
+    password_hash_budget_ms: int = 100
+    password_hash_min_cost: int | None = None
+
+    # Authenticated users are cached by id so requests skip the user lookup;
+    # a size of 0 disables the cache. In stateless mode the user is built
+    # from the verified token alone and the database is never consulted, so
+    # a deleted user's unrevoked tokens are only refused (401) by requests
+    # that read or write the user's board, until they expire.
+    principal_cache_size: int = 1024
+    principal_cache_ttl_seconds: float = 60.0
+    stateless_principals: bool = False
+
+    # Verified token claims are cached until the token expires, so repeated
+    # requests skip signature checks. 0 disables the cache.
+    token_cache_size: int = 4096
+
+    # Logged-out tokens are stored in the database; each worker pulls in
+    # revocations made by others this often, and purges expired ones.
+    revocation_sync_seconds: float = 5.0
+    revocation_purge_seconds: float = 60 * 60
 
 
 class Settings(GrindboardBaseSettings):
@@ -67,6 +229,45 @@ class Settings(GrindboardBaseSettings):
     server: ServerConfig = Field(default_factory=ServerConfig)
     auth: AuthConfig = Field(default_factory=AuthConfig)
 
+    @model_validator(mode="after")
+    def persist_jwt_secret(self) -> "Settings":
+        """Share one generated JWT secret across workers and restarts."""
+        if not self.auth.jwt_secret_key:
+            try:
+                self.auth.jwt_secret_key = load_or_create_secret(
+                    self.app.data_dir / JWT_SECRET_FILE
+                )
+            except OSError as exc:
+                warnings.warn(
+                    f"Cannot persist the JWT secret ({exc}); tokens will not "
+                    "survive a restart or work across workers",
+                    stacklevel=2,
+                )
+                self.auth.jwt_secret_key = secrets.token_urlsafe(32)
+        return self
+
+
+def load_or_create_secret(path: Path) -> str:
+    """Return the secret stored at ``path``, creating it on first use."""
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        candidate = path.with_name(f".{path.name}.{os.getpid()}")
+        # Left behind by a crashed process that had the same pid.
+        candidate.unlink(missing_ok=True)
+        # Created owner-only, so the secret is never readable by others.
+        fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        with os.fdopen(fd, "w") as file:
+            file.write(secrets.token_urlsafe(32))
+        try:
+            # link() never overwrites, so concurrently starting workers all
+            # end up reading whichever secret was linked first.
+            os.link(candidate, path)
+        except FileExistsError:
+            pass
+        finally:
+            candidate.unlink()
+    return path.read_text().strip()
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
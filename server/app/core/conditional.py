@@ -0,0 +1,48 @@
+import hashlib
+
+from fastapi import Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.versioning import current_version
+from app.models import User
+
+# Responses may be stored, but only by the user's own client, and must be
+# revalidated with If-None-Match before reuse.
+CACHE_CONTROL = "private, no-cache"
+
+
+async def list_cache_headers(
+    request: Request, session: AsyncSession, user: User
+) -> dict[str, str]:
+    """
+    Caching headers for a list of the user's tasks or tags, with a strong ETag.
+
+    A user's lists only change when their change version moves, so the
+    version, the user, the path and the query string identify the body
+    exactly. Working the ETag out costs one primary key lookup rather than
+    the list query.
+    """
+    version = await current_version(session, user.id)
+    variant = (
+        user.id,
+        version,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+    )
+    digest = hashlib.blake2b(repr(variant).encode(), digest_size=16).hexdigest()
+    return {
+        "ETag": f'"{digest}"',
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match matches ``etag``."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison (RFC 9110, section 13.1.2).
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
@@ -1,30 +1,146 @@
+import asyncio
 import contextlib
-from collections.abc import AsyncIterator, Mapping
-from typing import Any
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import Any, Concatenate
 
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from alembic import command, config
 from app.config import get_settings
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# SQLite has a single writer: give writes one dedicated connection to queue for.
+WRITER_POOL = {"pool_size": 1, "max_overflow": 0}
+
+
+def apply_sqlite_pragmas(engine: AsyncEngine, pragmas: Mapping[str, Any]) -> None:
+    """Run the given PRAGMAs on every new DBAPI connection the engine opens."""
+    if not pragmas:
+        return
+
+    statements = [f"PRAGMA {name}={value}" for name, value in pragmas.items()]
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def use_begin_immediate(engine: AsyncEngine, retries: int, backoff: float) -> None:
+    """
+    Start every transaction on the engine with BEGIN IMMEDIATE.
+
+    Taking the write lock up front means a transaction never fails half-way
+    while upgrading from a read lock. If another process holds the lock for
+    longer than busy_timeout, BEGIN is retried with exponential backoff.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, _connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_immediate(connection) -> None:
+        error_cls = connection.dialect.loaded_dbapi.OperationalError
+        cursor = connection.connection.cursor()
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    cursor.execute("BEGIN IMMEDIATE")
+                    return
+                except error_cls as exc:
+                    if attempt == retries or "locked" not in str(exc):
+                        raise
+                await_only(asyncio.sleep(backoff * 2**attempt))
+        finally:
+            cursor.close()
+
+
+def unit_of_work[**P, T](
+    method: Callable[Concatenate[Any, Session, P], T],
+) -> Callable[Concatenate[Any, P], Awaitable[T]]:
+    """
+    Turn a synchronous service method into one ``session.run_sync`` call.
+
+    The method receives the synchronous Session behind ``self.session`` and
+    issues all of its queries and the commit from a single greenlet, so the
+    async bridge is crossed once per operation rather than once per
+    statement. Statements are still awaited by the driver underneath, so the
+    event loop keeps serving other requests meanwhile.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        return await self.session.run_sync(
+            lambda session: method(self, session, *args, **kwargs)
+        )
 
-class DatabaseSessionManager:
-    """Manages async SQLAlchemy engine and sessions with proper lifecycle control."""
+    return wrapper
 
-    def __init__(self, url: str, engine_kwargs: Mapping[str, Any] | None = None):
+
+class DatabaseSessionManager:
+    """
+    Manages async SQLAlchemy engines and sessions with proper lifecycle control.
+
+    SQLite allows a single writer, so for SQLite URLs reads and writes use
+    separate engines: a read-only pool for queries and one dedicated write
+    connection. Writers queue for that connection on checkout and take the
+    write lock with BEGIN IMMEDIATE, so they never collide with each other.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        engine_kwargs: Mapping[str, Any] | None = None,
+        sqlite_pragmas: Mapping[str, Any] | None = None,
+        write_retries: int = 5,
+        write_backoff: float = 0.02,
+    ):
         """Initialize the database session manager."""
-        self._engine = create_async_engine(url, **(engine_kwargs or {}))
+        engine_kwargs = dict(engine_kwargs or {})
+        is_sqlite = make_url(url).get_backend_name() == "sqlite"
+        split_pools = is_sqlite and not _is_memory_database(url)
+
+        if split_pools:
+            self._engine = create_async_engine(url, **(engine_kwargs | WRITER_POOL))
+            self._read_engine = create_async_engine(url, **engine_kwargs)
+        else:
+            self._engine = create_async_engine(url, **engine_kwargs)
+            self._read_engine = self._engine
+
+        if is_sqlite:
+            pragmas = dict(sqlite_pragmas or {})
+            apply_sqlite_pragmas(self._engine, pragmas)
+            use_begin_immediate(self._engine, write_retries, write_backoff)
+            if split_pools:
+                apply_sqlite_pragmas(self._read_engine, pragmas | {"query_only": "ON"})
+
         self._sessionmaker = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
             class_=AsyncSession,
         )
+        self._read_sessionmaker = async_sessionmaker(
+            self._read_engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
         self._closed = False
 
     def _ensure_open(self) -> None:
@@ -34,15 +150,23 @@ class DatabaseSessionManager:
 
     @property
     def engine(self) -> AsyncEngine:
-        """Return the async engine instance."""
+        """Return the async engine used for writes."""
         self._ensure_open()
         return self._engine
 
+    @property
+    def read_engine(self) -> AsyncEngine:
+        """Return the async engine used for read-only sessions."""
+        self._ensure_open()
+        return self._read_engine
+
     async def close(self) -> None:
-        """Close the engine and mark this manager as closed."""
+        """Close the engines and mark this manager as closed."""
         if self._closed:
             return
         await self._engine.dispose()
+        if self._read_engine is not self._engine:
+            await self._read_engine.dispose()
         self._closed = True
 
     @contextlib.asynccontextmanager
@@ -57,34 +181,39 @@ class DatabaseSessionManager:
             yield connection
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self, read_only: bool = False) -> AsyncIterator[AsyncSession]:
         """
         Provide a database session.
 
+        Read-only sessions come from the read pool and never wait on the writer.
         The session is automatically closed after use and rolled back on error.
         """
         self._ensure_open()
-        async with self._sessionmaker() as session:
+        maker = self._read_sessionmaker if read_only else self._sessionmaker
+        async with maker() as session:
             yield session
 
 
-sessionmanager = DatabaseSessionManager(get_settings().app.database_url)
-
-
-async def get_database_session():
-    """FastAPI dependency that yields a managed AsyncSession."""
-    async with sessionmanager.session() as session:
-        yield session
+def _is_memory_database(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
 
 
-def _run_upgrade(connection, cfg):
-    cfg.attributes["connection"] = connection
-    command.upgrade(cfg, "head")
+_settings = get_settings().app
+sessionmanager = DatabaseSessionManager(
+    _settings.database_url,
+    engine_kwargs=_settings.engine_kwargs,
+    sqlite_pragmas=_settings.sqlite_pragmas,
+    write_retries=_settings.database_write_retries,
+    write_backoff=_settings.database_write_backoff_ms / 1000,
+)
 
 
-async def run_async_upgrade() -> None:
-    from pathlib import Path
-    cfg = config.Config(str(Path(__file__).parent.parent.parent / "alembic.ini"))
+async def get_database_session(request: Request):
+    """
+    FastAPI dependency that yields a managed AsyncSession.
 
-    async with sessionmanager.connect() as connection:
-        await connection.run_sync(_run_upgrade, cfg)
+    Safe methods get a read-only session; everything else gets a write session.
+    """
+    read_only = request.method in READ_ONLY_METHODS
+    async with sessionmanager.session(read_only=read_only) as session:
+        yield session
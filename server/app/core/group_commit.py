@@ -0,0 +1,198 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager, sessionmanager
+
+logger = logging.getLogger(__name__)
+
+Operation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+@dataclass
+class GroupCommitStats:
+    """Counters describing how well writes are being coalesced."""
+
+    batches: int = 0
+    operations: int = 0
+    failed_operations: int = 0
+    batch_sizes: Counter[int] = field(default_factory=Counter)
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.operations / self.batches if self.batches else 0.0
+
+    @property
+    def largest_batch(self) -> int:
+        return max(self.batch_sizes, default=0)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "operations": self.operations,
+            "failed_operations": self.failed_operations,
+            "mean_batch_size": round(self.mean_batch_size, 2),
+            "largest_batch": self.largest_batch,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+        }
+
+
+@dataclass
+class _Pending:
+    operation: Operation
+    future: asyncio.Future
+
+
+class GroupCommitter:
+    """
+    Coalesces small write operations into shared transactions.
+
+    Operations submitted within ``window`` seconds of each other run one after
+    another on a single connection, each inside its own SAVEPOINT, and are
+    committed together, so a batch pays for one fsync instead of one per write.
+    An operation failing with a database or HTTP error only rolls back its own
+    savepoint; its exception is raised to its caller while the rest of the
+    batch still commits. Any other exception rolls back the whole batch and is
+    raised to every caller in it.
+    """
+
+    def __init__(
+        self,
+        manager: DatabaseSessionManager,
+        window: float = 0.002,
+        max_batch: int = 64,
+    ):
+        self._manager = manager
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[_Pending] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self.stats = GroupCommitStats()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        if not self.running:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush queued operations and stop the worker."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+    async def submit[T](self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Queue ``operation`` for the next batch and wait for its result."""
+        if not self.running:
+            raise RuntimeError("GroupCommitter is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(operation, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            try:
+                await self._execute(batch)
+            except Exception:
+                # Already raised to the batch's callers; keep the worker alive.
+                logger.exception("Group commit batch failed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _execute(self, batch: list[_Pending]) -> None:
+        results: list[tuple[_Pending, Any]] = []
+        try:
+            async with self._manager.connect() as connection:
+                for pending in batch:
+                    session = AsyncSession(
+                        bind=connection,
+                        expire_on_commit=False,
+                        join_transaction_mode="create_savepoint",
+                    )
+                    try:
+                        result = await pending.operation(session)
+                    except (SQLAlchemyError, HTTPException) as exc:
+                        self.stats.failed_operations += 1
+                        _resolve(pending.future, error=exc)
+                    else:
+                        results.append((pending, result))
+                    finally:
+                        await session.close()
+        except SQLAlchemyError as exc:
+            # The shared commit failed, so none of the surviving writes landed.
+            for pending, _ in results:
+                _resolve(pending.future, error=exc)
+        except Exception as exc:
+            for pending in batch:
+                _resolve(pending.future, error=exc)
+            raise
+        else:
+            for pending, result in results:
+                _resolve(pending.future, result=result)
+        finally:
+            self.stats.batches += 1
+            self.stats.operations += len(batch)
+            self.stats.batch_sizes[len(batch)] += 1
+
+
+def _resolve(
+    future: asyncio.Future, result: Any = None, error: Exception | None = None
+) -> None:
+    # The caller may have gone away (e.g. client disconnect) while batched.
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+_settings = get_settings().app
+group_committer = GroupCommitter(
+    sessionmanager,
+    window=_settings.group_commit_window_ms / 1000,
+    max_batch=_settings.group_commit_max_batch,
+)
+
+
+async def run_grouped[T](
+    session: AsyncSession,
+    operation: Callable[[AsyncSession], Awaitable[T]],
+) -> T:
+    """
+    Run a small write through the group committer when it is enabled.
+
+    Otherwise the operation runs directly on the request's own session.
+    """
+    if not group_committer.running:
+        return await operation(session)
+    # Hand the single writer connection back before queueing for the batch.
+    await session.commit()
+    return await group_committer.submit(operation)
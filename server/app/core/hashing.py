@@ -0,0 +1,111 @@
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.core.security import (
+    DEFAULT_COSTS,
+    calibrate_cost,
+    hash_cost,
+    hash_password,
+    verify_password,
+)
+
+# Calibration reruns on every start and lands on a slightly different cost
+# each time; only hashes clearly below the current cost are worth replacing.
+REHASH_TOLERANCE = 0.8
+
+
+class PasswordHasher:
+    """
+    Runs password hashing in a dedicated pool so it never blocks the event loop.
+
+    At most ``workers`` hashes run at once and ``max_pending`` more may wait
+    for a worker. Anything beyond that is rejected straight away with a 503,
+    so a login storm sheds load instead of building an unbounded backlog.
+
+    New hashes use ``scheme`` at ``cost``; ``calibrate`` raises the cost to
+    fit a time budget on the current hardware.
+    """
+
+    def __init__(
+        self,
+        executor: Literal["thread", "process"] = "thread",
+        workers: int | None = None,
+        max_pending: int = 32,
+        scheme: str = "pbkdf2_sha256",
+        cost: int | None = None,
+    ):
+        self.scheme = scheme
+        self.cost = cost or DEFAULT_COSTS[scheme]
+        self._kind = executor
+        self._workers = workers or os.cpu_count() or 1
+        self._capacity = self._workers + max_pending
+        self._in_flight = 0
+        self._executor: Executor | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password, self.scheme, self.cost)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(verify_password, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Whether ``hashed`` uses another scheme or a clearly lower cost."""
+        scheme, cost = hash_cost(hashed)
+        return scheme != self.scheme or cost < REHASH_TOLERANCE * self.cost
+
+    async def calibrate(self, budget_ms: float) -> int:
+        """Raise the cost so one hash takes about ``budget_ms``; return it."""
+        loop = asyncio.get_running_loop()
+        self.cost = await loop.run_in_executor(
+            self._get_executor(), calibrate_cost, self.scheme, budget_ms, self.cost
+        )
+        return self.cost
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _submit[T](self, fn: Callable[..., T], *args) -> T:
+        if self._in_flight >= self._capacity:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+
+_settings = get_settings().auth
+password_hasher = PasswordHasher(
+    executor=_settings.password_hash_executor,
+    workers=_settings.password_hash_workers,
+    max_pending=_settings.password_hash_max_pending,
+    scheme=_settings.password_hash_scheme,
+    cost=_settings.password_hash_min_cost,
+)
@@ -1,4 +1,282 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import ipaddress
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Protocol
 
-limiter = Limiter(key_func=get_remote_address)
+import jwt
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import AppConfig, get_settings
+from app.core.database import WRITER_POOL, apply_sqlite_pragmas
+from app.core.security import decode_token
+
+AUTH_PATHS = frozenset({"/api/v1/auth/login", "/api/v1/auth/register"})
+
+
+class BucketStorage(Protocol):
+    async def take(self, key: str, rate: float, capacity: float) -> float:
+        """
+        Take one token from the bucket at ``key``.
+
+        Returns 0 when the token was granted, otherwise the number of seconds
+        until one becomes available.
+        """
+        ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryStorage:
+    """Token buckets in a bounded in-process dict; limits are per worker."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, rate: float, capacity: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        granted = tokens >= 1
+        self._buckets[key] = (tokens - 1 if granted else tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0 if granted else (1 - tokens) / rate
+
+    async def close(self) -> None:
+        self._buckets.clear()
+
+
+class SQLiteStorage:
+    """
+    Token buckets in a SQLite file shared by every worker on the host.
+
+    Each take is one atomic UPSERT that refills the bucket, takes a token if
+    one is available and reports the outcome. The data is disposable, so
+    the file runs without fsync.
+    """
+
+    PURGE_EVERY = 10_000
+
+    def __init__(self, path: str):
+        self._path = path
+        self._engine: AsyncEngine | None = None
+        self._takes = 0
+
+    async def take(self, key: str, rate: float, capacity: float) -> float:
+        engine = await self._get_engine()
+        now = time.time()
+        async with engine.begin() as connection:
+            row = (
+                await connection.execute(
+                    text(
+                        "INSERT INTO buckets (key, tokens, updated, granted)"
+                        " VALUES (:key, :capacity - 1, :now, 1)"
+                        " ON CONFLICT (key) DO UPDATE SET"
+                        "  granted = min(:capacity, tokens + (:now - updated) * :rate)"
+                        "   >= 1,"
+                        "  tokens = min(:capacity, tokens + (:now - updated) * :rate)"
+                        "   - (min(:capacity, tokens + (:now - updated) * :rate) >= 1),"
+                        "  updated = :now"
+                        " RETURNING tokens, granted"
+                    ),
+                    {"key": key, "capacity": capacity, "now": now, "rate": rate},
+                )
+            ).one()
+            self._takes += 1
+            if self._takes % self.PURGE_EVERY == 0:
+                # Idle buckets are full again; dropping them changes nothing.
+                await connection.execute(
+                    text("DELETE FROM buckets WHERE updated < :cutoff"),
+                    {"cutoff": now - 24 * 60 * 60},
+                )
+        return 0.0 if row.granted else (1 - row.tokens) / rate
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    async def _get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            engine = create_async_engine(
+                f"sqlite+aiosqlite:///{self._path}", **WRITER_POOL
+            )
+            apply_sqlite_pragmas(
+                engine,
+                {"journal_mode": "WAL", "synchronous": "OFF", "busy_timeout": 5_000},
+            )
+            async with engine.begin() as connection:
+                await connection.execute(
+                    text(
+                        "CREATE TABLE IF NOT EXISTS buckets ("
+                        " key TEXT PRIMARY KEY, tokens REAL NOT NULL,"
+                        " updated REAL NOT NULL, granted INTEGER NOT NULL"
+                        ") WITHOUT ROWID"
+                    )
+                )
+            self._engine = engine
+        return self._engine
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A token bucket: ``capacity`` requests at once, refilled at ``per_minute``."""
+
+    name: str
+    per_minute: float
+    capacity: float
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60
+
+
+@dataclass
+class RateLimitStats:
+    allowed: Counter[str] = field(default_factory=Counter)
+    throttled: Counter[str] = field(default_factory=Counter)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "allowed": dict(self.allowed),
+            "throttled": dict(self.throttled),
+        }
+
+
+class RateLimiter:
+    """
+    Applies token-bucket limits to API requests.
+
+    Sign-in endpoints are limited per client address; everything else under
+    /api/ is limited per authenticated user, falling back to the address for
+    anonymous requests. The client address is taken from X-Forwarded-For
+    only when the direct peer is one of ``trusted_proxies``.
+    """
+
+    def __init__(
+        self,
+        storage: BucketStorage,
+        auth_rule: Rule | None,
+        user_rule: Rule | None,
+        trusted_proxies: list[str] | None = None,
+    ):
+        self.storage = storage
+        self.enabled = True
+        self.auth_rule = auth_rule
+        self.user_rule = user_rule
+        self._trusted = [
+            ipaddress.ip_network(p, strict=False) for p in trusted_proxies or []
+        ]
+        self.stats = RateLimitStats()
+
+    async def check(self, scope: Scope) -> float:
+        """Return 0 if the request may proceed, else seconds to wait."""
+        path = scope["path"]
+        if path in AUTH_PATHS and scope["method"] == "POST":
+            rule, key = self.auth_rule, f"ip:{self.client_address(scope)}"
+        elif path.startswith("/api/"):
+            rule, key = self.user_rule, self._principal_key(scope)
+        else:
+            return 0.0
+        if rule is None:
+            return 0.0
+
+        retry_after = await self.storage.take(
+            f"{rule.name}:{key}", rule.rate, rule.capacity
+        )
+        if retry_after:
+            self.stats.throttled[rule.name] += 1
+        else:
+            self.stats.allowed[rule.name] += 1
+        return retry_after
+
+    def client_address(self, scope: Scope) -> str:
+        peer = scope["client"][0] if scope.get("client") else "unknown"
+        if not self._is_trusted(peer):
+            return peer
+        forwarded = [
+            address.strip()
+            for value in _header_values(scope, b"x-forwarded-for")
+            for address in value.split(",")
+        ]
+        # The rightmost address not added by one of our own proxies is the client.
+        for address in reversed(forwarded):
+            if not self._is_trusted(address):
+                return address
+        return forwarded[0] if forwarded else peer
+
+    async def close(self) -> None:
+        await self.storage.close()
+
+    def _principal_key(self, scope: Scope) -> str:
+        for value in _header_values(scope, b"authorization"):
+            scheme, _, token = value.partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    return f"user:{decode_token(token)['sub']}"
+                except (jwt.PyJWTError, KeyError):
+                    break
+        return f"ip:{self.client_address(scope)}"
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self._trusted)
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware answering 429 once a request's bucket is empty."""
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.limiter.enabled:
+            retry_after = await self.limiter.check(scope)
+            if retry_after:
+                response = JSONResponse(
+                    {"detail": "Rate limit exceeded"},
+                    status_code=429,
+                    headers={"Retry-After": str(max(1, round(retry_after)))},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def _header_values(scope: Scope, name: bytes) -> list[str]:
+    return [value.decode("latin-1") for key, value in scope["headers"] if key == name]
+
+
+def build_rate_limiter(settings: AppConfig) -> RateLimiter:
+    storage: BucketStorage
+    if settings.rate_limit_storage == "sqlite":
+        storage = SQLiteStorage(str(settings.data_dir / "ratelimit.db"))
+    else:
+        storage = MemoryStorage()
+    auth_rule = user_rule = None
+    if settings.rate_limit_auth_per_minute:
+        auth_rule = Rule(
+            "auth",
+            settings.rate_limit_auth_per_minute,
+            settings.rate_limit_auth_per_minute,
+        )
+    if settings.rate_limit_user_per_minute:
+        user_rule = Rule(
+            "user", settings.rate_limit_user_per_minute, settings.rate_limit_user_burst
+        )
+    limiter = RateLimiter(storage, auth_rule, user_rule, settings.trusted_proxies)
+    limiter.enabled = settings.rate_limit_enabled
+    return limiter
+
+
+limiter = build_rate_limiter(get_settings().app)
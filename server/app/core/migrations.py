@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Literal
+
+from sqlalchemy import Connection, inspect, pool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from app import models  # noqa: F401
+from app.models.tasks import SEARCH_INDEX, SEARCH_TABLE
+
+# The newest Alembic revision. Startup compares this against alembic_version
+# instead of loading the migration scripts; tests keep it in sync with them.
+SCHEMA_HEAD = "c1d2e3f4a5b6"
+
+ALEMBIC_INI = Path(__file__).parent.parent.parent / "alembic.ini"
+
+MigrationResult = Literal["current", "upgraded", "created"]
+
+
+def current_revision(connection: Connection) -> str | None:
+    """Return the revision recorded in alembic_version, or None if unversioned."""
+    if not inspect(connection).has_table("alembic_version"):
+        return None
+    return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    """Keep autogenerate away from full-text search objects outside the metadata."""
+    if type_ == "table":
+        # The FTS5 table and the shadow tables SQLite keeps for it.
+        return not (name and name.startswith(SEARCH_TABLE))
+    return not (type_ == "index" and name == SEARCH_INDEX)
+
+
+def _alembic_config(connection: Connection):
+    # Alembic is imported lazily: a database already at head never needs it.
+    from alembic.config import Config
+
+    cfg = Config(str(ALEMBIC_INI))
+    cfg.attributes["connection"] = connection
+    return cfg
+
+
+def _upgrade(connection: Connection) -> None:
+    from alembic import command
+
+    command.upgrade(_alembic_config(connection), "head")
+
+
+def _create_all_and_stamp(connection: Connection) -> None:
+    from alembic import command
+
+    SQLModel.metadata.create_all(connection)
+    command.stamp(_alembic_config(connection), "head")
+
+
+def _migrate(connection: Connection, create_all: bool) -> MigrationResult:
+    revision = current_revision(connection)
+    if revision == SCHEMA_HEAD:
+        return "current"
+    if revision is None and create_all and not inspect(connection).get_table_names():
+        _create_all_and_stamp(connection)
+        return "created"
+    _upgrade(connection)
+    return "upgraded"
+
+
+async def is_current(url: str) -> bool:
+    """Return whether the database at ``url`` is already at the head revision."""
+    engine = create_async_engine(url, poolclass=pool.NullPool)
+    try:
+        async with engine.connect() as connection:
+            return await connection.run_sync(current_revision) == SCHEMA_HEAD
+    finally:
+        await engine.dispose()
+
+
+async def migrate(url: str, create_all: bool = False) -> MigrationResult:
+    """
+    Bring the database at ``url`` to the head revision.
+
+    Nothing beyond a single alembic_version lookup runs when the schema is
+    already current. With ``create_all``, an empty database gets the schema
+    straight from the models and is stamped at head instead of replaying
+    every migration.
+    """
+    # Migrations toggle connection state (e.g. foreign_keys), so give them a
+    # private connection rather than one from the serving pools.
+    engine = create_async_engine(url, poolclass=pool.NullPool)
+    try:
+        async with engine.begin() as connection:
+            return await connection.run_sync(_migrate, create_all)
+    finally:
+        await engine.dispose()
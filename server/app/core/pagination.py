@@ -0,0 +1,72 @@
+import base64
+import json
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the cursor for the page after this one.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Integer cursor parts are bound as signed 64-bit database integers.
+CURSOR_INT_RANGE = range(-(2**63), 2**63)
+
+
+def encode_cursor(key: tuple[Any, ...]) -> str:
+    """
+    Serialise the sort key of the last row on a page into an opaque cursor.
+
+    Clients must treat the value as a token; its layout may change.
+    """
+    raw = json.dumps(key, separators=(",", ":"), default=_isoformat).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str, types: tuple[Callable[[Any], Any], ...]
+) -> tuple[Any, ...]:
+    """
+    Return the sort key in ``cursor``, each part converted with ``types``.
+
+    Raises 400 if the cursor is malformed or does not match ``types``;
+    converters signal a mismatch with TypeError or ValueError.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+        if not isinstance(key, list) or len(key) != len(types):
+            raise ValueError(cursor)
+        return tuple(convert(value) for convert, value in zip(types, key))
+    except (TypeError, ValueError, OverflowError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
+def cursor_int(value: Any) -> int:
+    """Cursor part converter for an integer column such as an id."""
+    if type(value) is not int or value not in CURSOR_INT_RANGE:
+        raise ValueError(value)
+    return value
+
+
+def cursor_str(value: Any) -> str:
+    """Cursor part converter for a text column."""
+    if not isinstance(value, str):
+        raise TypeError(value)
+    return value
+
+
+def nullable(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a cursor part converter so that null passes through."""
+    return lambda value: None if value is None else convert(value)
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, date):  # includes datetime
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
@@ -0,0 +1,128 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from app.config import get_settings
+from app.models import User
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache of authenticated users, keyed by user id.
+
+    Entries expire ``ttl`` seconds after they were stored, which bounds how
+    long another worker process may keep serving a user changed or deleted
+    elsewhere; in this process, UserService invalidates entries directly.
+    Cached users are detached from any session and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self.stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: int) -> User | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.stats.hits += 1
+        return entry[1]
+
+    def put(self, user: User) -> None:
+        if not self.enabled or user.id is None:
+            return
+        self._entries[user.id] = (time.monotonic() + self._ttl, user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, user_id: int | None) -> None:
+        if user_id is not None:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified JWT claims, keyed by a digest of the token.
+
+    A hit skips signature verification and JSON parsing. Entries are only
+    served until the token's ``exp``; revocation is checked by the caller on
+    every request, cached or not.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = _digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        if self._max_size <= 0 or not isinstance(exp, (int, float)):
+            return
+        key = _digest(token)
+        self._entries[key] = (exp, claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+_settings = get_settings().auth
+principal_cache = PrincipalCache(
+    max_size=_settings.principal_cache_size,
+    ttl=_settings.principal_cache_ttl_seconds,
+)
+token_cache = TokenCache(max_size=_settings.token_cache_size)
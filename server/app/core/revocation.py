@@ -0,0 +1,137 @@
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager, sessionmanager
+from app.models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# How far each sync reaches back before the previous one, for revocations
+# that committed late or were stamped by a host whose clock lags ours.
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+class RevocationStore:
+    """
+    Revoked token ids, persisted in the database and mirrored in memory.
+
+    Every process keeps the unexpired revoked JTIs in a dict, so checking a
+    token is a single lookup. The first sync loads every unexpired row;
+    after that, revocations made by other workers are pulled in every
+    ``sync_interval`` seconds by reading the rows revoked since the previous
+    sync, less ``SYNC_OVERLAP``. Ids are no use as a cursor because they are
+    reused after a purge and, on Postgres, may commit out of order. Until
+    the next sync those tokens may still be accepted here.
+    Expired entries are dropped from memory and purged from the table every
+    ``purge_interval`` seconds, which keeps both bounded by the number of
+    revocations within one token lifetime.
+    """
+
+    def __init__(
+        self,
+        manager: DatabaseSessionManager,
+        sync_interval: float = 5.0,
+        purge_interval: float = 3600.0,
+    ):
+        self._manager = manager
+        self._sync_interval = sync_interval
+        self._purge_interval = purge_interval
+        self._revoked: dict[str, float] = {}
+        self._synced_at: datetime | None = None
+        self._worker: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    async def revoke(self, session: AsyncSession, jti: str, expires_at: float) -> None:
+        """Record ``jti`` as revoked until ``expires_at`` (a Unix timestamp)."""
+        if jti in self._revoked:
+            return
+        connection = await session.connection()
+        try:
+            await connection.execute(
+                insert(RevokedToken).values(
+                    jti=jti,
+                    expires_at=datetime.fromtimestamp(expires_at, UTC),
+                    revoked_at=datetime.now(UTC),
+                )
+            )
+            await session.commit()
+        except IntegrityError:
+            # Already revoked by another worker.
+            await session.rollback()
+        self._revoked[jti] = expires_at
+
+    async def sync(self) -> None:
+        """Load unexpired revocations recorded since the last sync."""
+        started = datetime.now(UTC)
+        stmt = select(RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.expires_at > started
+        )
+        if self._synced_at is not None:
+            stmt = stmt.where(RevokedToken.revoked_at > self._synced_at - SYNC_OVERLAP)
+        async with self._manager.session(read_only=True) as session:
+            connection = await session.connection()
+            for row in await connection.execute(stmt):
+                self._revoked[row.jti] = _timestamp(row.expires_at)
+        self._synced_at = started
+
+    async def purge(self) -> None:
+        """Forget expired revocations, in memory and in the database."""
+        now = time.time()
+        self._revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        async with self._manager.connect() as connection:
+            await connection.execute(
+                delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(UTC))
+            )
+
+    async def start(self) -> None:
+        await self.sync()
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        next_purge = time.monotonic()
+        while True:
+            await asyncio.sleep(self._sync_interval)
+            try:
+                await self.sync()
+                if time.monotonic() >= next_purge:
+                    await self.purge()
+                    next_purge = time.monotonic() + self._purge_interval
+            except Exception:
+                logger.exception("Token revocation sync failed")
+
+
+def _timestamp(value: datetime) -> float:
+    # SQLite hands back naive datetimes; they are stored as UTC.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+_settings = get_settings().auth
+revocation_store = RevocationStore(
+    sessionmanager,
+    sync_interval=_settings.revocation_sync_seconds,
+    purge_interval=_settings.revocation_purge_seconds,
+)
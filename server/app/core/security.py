@@ -1,6 +1,7 @@
 import hashlib
 import hmac
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Any
 
@@ -8,52 +9,103 @@ import jwt
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import User
 from app.config import get_settings
 from app.core.dependencies import DBSessionDep
+from app.core.principals import principal_cache, token_cache
+from app.core.revocation import revocation_store
 
 PASSWORD_HASH_SCHEME = "pbkdf2_sha256"
 PASSWORD_ITERATIONS = 200_000
 PASSWORD_SALT_BYTES = 16
 
-bearer_scheme = HTTPBearer(auto_error=False)
+# scrypt hashes store N as their cost; r and p are fixed.
+SCRYPT_HASH_SCHEME = "scrypt"
+SCRYPT_COST = 2**14
+SCRYPT_MAX_COST = 2**17
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELISM = 1
+
+DEFAULT_COSTS = {
+    PASSWORD_HASH_SCHEME: PASSWORD_ITERATIONS,
+    SCRYPT_HASH_SCHEME: SCRYPT_COST,
+}
 
-_revoked_jtis: set[str] = set()
+bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def revoke_token(jti: str) -> None:
-    _revoked_jtis.add(jti)
+def _derive(password: str, salt: str, scheme: str, cost: int) -> bytes:
+    if scheme == SCRYPT_HASH_SCHEME:
+        return hashlib.scrypt(
+            password.encode("utf-8"),
+            salt=bytes.fromhex(salt),
+            n=cost,
+            r=SCRYPT_BLOCK_SIZE,
+            p=SCRYPT_PARALLELISM,
+            maxmem=256 * SCRYPT_BLOCK_SIZE * cost,
+        )
+    if scheme == PASSWORD_HASH_SCHEME:
+        return hashlib.pbkdf2_hmac(
+            "sha256",
+            password.encode("utf-8"),
+            bytes.fromhex(salt),
+            cost,
+        )
+    raise ValueError(f"Unknown password hash scheme: {scheme}")
 
 
-def hash_password(password: str) -> str:
+def hash_password(
+    password: str, scheme: str = PASSWORD_HASH_SCHEME, cost: int | None = None
+) -> str:
+    cost = cost or DEFAULT_COSTS[scheme]
     salt = secrets.token_hex(PASSWORD_SALT_BYTES)
-    dk = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        bytes.fromhex(salt),
-        PASSWORD_ITERATIONS,
-    )
-    return f"{PASSWORD_HASH_SCHEME}${PASSWORD_ITERATIONS}${salt}${dk.hex()}"
+    dk = _derive(password, salt, scheme, cost)
+    return f"{scheme}${cost}${salt}${dk.hex()}"
 
 
 def verify_password(password: str, hashed: str) -> bool:
     try:
-        scheme, iters_s, salt, stored_hex = hashed.split("$")
-        if scheme != PASSWORD_HASH_SCHEME:
-            return False
-
-        dk = hashlib.pbkdf2_hmac(
-            "sha256",
-            password.encode("utf-8"),
-            bytes.fromhex(salt),
-            int(iters_s),
-        )
+        scheme, cost, salt, stored_hex = hashed.split("$")
+        dk = _derive(password, salt, scheme, int(cost))
         return hmac.compare_digest(dk.hex(), stored_hex)
     except Exception:
         return False
 
 
+def hash_cost(hashed: str) -> tuple[str, int]:
+    """Return the scheme and cost a stored hash was made with."""
+    scheme, cost, _ = hashed.split("$", 2)
+    return scheme, int(cost)
+
+
+def calibrate_cost(scheme: str, budget_ms: float, minimum: int | None = None) -> int:
+    """
+    Pick the cost for ``scheme`` that takes about ``budget_ms`` on this machine.
+
+    The result is never below ``minimum`` (the scheme default if not given):
+    PBKDF2 iterations are rounded down to 10,000s; scrypt's N is a power of
+    two, capped at SCRYPT_MAX_COST to bound memory use.
+    """
+    cost = minimum or DEFAULT_COSTS[scheme]
+    salt = secrets.token_hex(PASSWORD_SALT_BYTES)
+
+    def elapsed_ms(cost: int) -> float:
+        started = time.perf_counter()
+        _derive("calibration", salt, scheme, cost)
+        return (time.perf_counter() - started) * 1000
+
+    if scheme == SCRYPT_HASH_SCHEME:
+        # Doubling N doubles the work, so stop once the next step overshoots.
+        while cost < SCRYPT_MAX_COST and elapsed_ms(cost) * 2 <= budget_ms:
+            cost *= 2
+        return cost
+
+    scaled = int(cost * budget_ms / elapsed_ms(cost)) // 10_000 * 10_000
+    return max(cost, scaled)
+
+
 def create_access_token(claims: dict[str, Any]) -> str:
     settings = get_settings().auth
     to_encode = claims.copy()
@@ -72,6 +124,20 @@ def create_access_token(claims: dict[str, Any]) -> str:
     )
 
 
+def decode_token(token: str) -> dict[str, Any]:
+    """Verify ``token`` and return its claims, reusing earlier verifications."""
+    claims = token_cache.get(token)
+    if claims is None:
+        settings = get_settings().auth
+        claims = jwt.decode(
+            token,
+            settings.jwt_secret_key,
+            algorithms=[settings.jwt_algorithm],
+        )
+        token_cache.put(token, claims)
+    return claims
+
+
 async def get_current_user(
     db: DBSessionDep,
     credentials: Annotated[
@@ -85,15 +151,10 @@ async def get_current_user(
         )
 
     try:
-        settings = get_settings().auth
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = decode_token(credentials.credentials)
 
         jti = payload.get("jti")
-        if jti and jti in _revoked_jtis:
+        if jti and revocation_store.is_revoked(jti):
             raise HTTPException(status_code=401, detail="Token has been revoked")
 
         user_id = payload.get("sub")
@@ -103,7 +164,7 @@ async def get_current_user(
                 detail="Invalid token subject",
             )
 
-        user = (await db.scalars(select(User).where(User.id == int(user_id)))).first()
+        user = await _load_principal(db, int(user_id), payload)
 
     except HTTPException:
         raise
@@ -122,14 +183,31 @@ async def get_current_user(
     return user
 
 
+async def _load_principal(
+    db: AsyncSession, user_id: int, payload: dict[str, Any]
+) -> User | None:
+    if get_settings().auth.stateless_principals:
+        return User(id=user_id, username=payload.get("name", ""), password_hash="")
+
+    user = principal_cache.get(user_id)
+    if user is None:
+        user = (await db.scalars(select(User).where(User.id == user_id))).first()
+        if user is not None:
+            db.expunge(user)
+            principal_cache.put(user)
+    return user
+
+
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_cost",
+    "calibrate_cost",
     "create_access_token",
+    "decode_token",
     "get_current_user",
-    "revoke_token",
     "bearer_scheme",
     "CurrentUserDep",
 ]
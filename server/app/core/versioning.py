@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import logging
+from datetime import UTC, datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import Insert, Update, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager, sessionmanager
+from app.models import Task, TaskTagLink, Tombstone, TombstoneKind, User
+
+logger = logging.getLogger(__name__)
+
+
+def next_version(user_id: int | None) -> Update:
+    """
+    Claim the user's next change version; the statement returns it.
+
+    Every write to a user's tasks, tags or task_tags runs this first in its
+    transaction and stamps the rows it touches with the result. The UPDATE
+    holds the user's row lock until commit, so versions become visible in
+    the order they were handed out and a client that has seen version N has
+    seen every change up to N.
+    """
+    return (
+        update(User)
+        .where(User.id == user_id)
+        .values(version=User.version + 1)
+        .returning(User.version)
+    )
+
+
+def require_user[T](value: T | None) -> T:
+    """
+    Return ``value``, read from the user's row, or refuse with 401 if the row
+    is gone. A token can outlive its account: stateless principals are never
+    looked up, and other workers may still have the user cached.
+    """
+    if value is None:
+        raise HTTPException(status_code=401, detail="Invalid user")
+    return value
+
+
+async def current_version(session: AsyncSession, user_id: int | None) -> int:
+    """The user's latest committed change version."""
+    connection = await session.connection()
+    stmt = select(User.version).where(User.id == user_id)
+    return require_user((await connection.execute(stmt)).scalar_one_or_none())
+
+
+def touch_tagged_tasks(tag_id: int | None, user_id: int | None, version: int) -> Update:
+    """Stamp the tasks carrying a tag, whose embedded tag list is changing."""
+    tagged = select(TaskTagLink.task_id).where(TaskTagLink.tag_id == tag_id)
+    return (
+        update(Task)
+        .where(Task.user_id == user_id, Task.id.in_(tagged))  # type: ignore[union-attr]
+        .values(version=version)
+    )
+
+
+def tombstone(
+    kind: TombstoneKind, entity_id: int | None, user_id: int | None, version: int
+) -> Insert:
+    return insert(Tombstone).values(
+        user_id=user_id,
+        kind=kind,
+        entity_id=entity_id,
+        version=version,
+        deleted_at=datetime.now(UTC),
+    )
+
+
+async def purge_tombstones(connection: AsyncConnection, before: datetime) -> None:
+    """
+    Delete tombstones recorded before ``before``.
+
+    Each affected user's ``purged_version`` is raised to the newest version
+    purged, so sync can tell a client whose ``since`` predates it that it
+    may have missed deletions.
+    """
+    expired = Tombstone.deleted_at < before
+    newest_expired = (
+        select(func.max(Tombstone.version))
+        .where(Tombstone.user_id == User.id, expired)
+        .scalar_subquery()
+    )
+    await connection.execute(
+        update(User)
+        .where(User.id.in_(select(Tombstone.user_id).where(expired)))  # type: ignore[union-attr]
+        .values(purged_version=newest_expired)
+    )
+    await connection.execute(delete(Tombstone).where(expired))
+
+
+class TombstonePurger:
+    """Purges tombstones older than ``retention`` every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        manager: DatabaseSessionManager,
+        retention: timedelta,
+        interval: float = 3600.0,
+    ):
+        self._manager = manager
+        self._retention = retention
+        self._interval = interval
+        self._worker: asyncio.Task | None = None
+
+    async def purge(self) -> None:
+        async with self._manager.connect() as connection:
+            await purge_tombstones(connection, datetime.now(UTC) - self._retention)
+
+    async def start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge()
+            except Exception:
+                logger.exception("Tombstone purge failed")
+            await asyncio.sleep(self._interval)
+
+
+_settings = get_settings().app
+tombstone_purger = TombstonePurger(
+    sessionmanager,
+    retention=timedelta(days=_settings.sync_tombstone_retention_days),
+    interval=_settings.sync_tombstone_purge_seconds,
+)
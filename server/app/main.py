@@ -1,17 +1,24 @@
+import asyncio
+import os
 import uvicorn
 from contextlib import asynccontextmanager
 from typing import Callable
 
-from fastapi import Depends, FastAPI, Request, Response
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
 
 from app.config import get_settings
-from app.core.database import get_database_session, sessionmanager, run_async_upgrade
-from app.core.limiter import limiter
+from app.core.database import get_database_session, sessionmanager
+from app.core.group_commit import group_committer
+from app.core.hashing import password_hasher
+from app.core.limiter import RateLimitMiddleware, limiter
+from app.core.migrations import migrate
+from app.core.security import calibrate_cost
+from app.core.revocation import revocation_store
+from app.core.versioning import tombstone_purger
+from app.sync.router import router as sync_router
 from app.tasks.router import router as tasks_router
 from app.users.router import router as users_router
 from app.tags.router import router as tags_router
@@ -22,8 +29,23 @@ from app.web.router import router as web_router
 async def lifespan(_app: FastAPI):
     settings = get_settings()
     settings.app.data_dir.mkdir(parents=True, exist_ok=True)
-    await run_async_upgrade()
+    if settings.app.database_migrate_on_startup:
+        await migrate(
+            settings.app.database_url,
+            create_all=settings.app.database_create_all_when_empty,
+        )
+    if settings.auth.password_hash_budget_ms:
+        await password_hasher.calibrate(settings.auth.password_hash_budget_ms)
+    await revocation_store.start()
+    await tombstone_purger.start()
+    if settings.app.group_commit_enabled:
+        await group_committer.start()
     yield
+    await group_committer.stop()
+    await tombstone_purger.stop()
+    await revocation_store.stop()
+    await limiter.close()
+    password_hasher.shutdown()
     if sessionmanager.engine is not None:
         await sessionmanager.close()
 
@@ -31,8 +53,7 @@ async def lifespan(_app: FastAPI):
 settings = get_settings()
 
 app = FastAPI(lifespan=lifespan, title=settings.app.project_name)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
+app.add_middleware(RateLimitMiddleware, limiter=limiter)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +61,7 @@ app.add_middleware(
     allow_origin_regex=settings.app.cors_allow_origin_regex,
     allow_methods=settings.app.cors_allow_methods,
     allow_headers=settings.app.cors_allow_headers,
+    expose_headers=settings.app.cors_expose_headers,
     allow_credentials=settings.app.cors_allow_credentials,
 )
 
@@ -70,14 +92,59 @@ async def healthcheck(
     return {"status": "ok"}
 
 
+def require_metrics_enabled() -> None:
+    """Hide /metrics unless the deployment opted in to exposing it."""
+    if not get_settings().app.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_enabled)],
+)
+async def metrics() -> dict[str, object]:
+    """Report rate limit counters and how well writes are group committed."""
+    return {
+        "rate_limits": limiter.stats.snapshot(),
+        "group_commit": group_committer.stats.snapshot(),
+    }
+
+
 app.include_router(users_router, prefix="/api/v1")
 app.include_router(tasks_router, prefix="/api/v1")
 app.include_router(tags_router, prefix="/api/v1")
+app.include_router(sync_router, prefix="/api/v1")
 app.include_router(web_router)
 
+
+def serve() -> None:
+    """Start uvicorn, preparing shared state once when running several workers."""
+    if settings.server.workers > 1:
+        # Each worker runs the lifespan; do the one-off work here so they
+        # neither race to migrate nor calibrate to slightly different costs.
+        settings.app.data_dir.mkdir(parents=True, exist_ok=True)
+        if settings.app.database_migrate_on_startup:
+            asyncio.run(
+                migrate(
+                    settings.app.database_url,
+                    create_all=settings.app.database_create_all_when_empty,
+                )
+            )
+            os.environ["GRINDBOARD__APP__DATABASE_MIGRATE_ON_STARTUP"] = "false"
+        if settings.auth.password_hash_budget_ms:
+            cost = calibrate_cost(
+                settings.auth.password_hash_scheme,
+                settings.auth.password_hash_budget_ms,
+                settings.auth.password_hash_min_cost,
+            )
+            os.environ["GRINDBOARD__AUTH__PASSWORD_HASH_MIN_COST"] = str(cost)
+            os.environ["GRINDBOARD__AUTH__PASSWORD_HASH_BUDGET_MS"] = "0"
+        # A generated secret is already persisted in data_dir; pass it on so
+        # workers need not read it back.
+        os.environ["GRINDBOARD__AUTH__JWT_SECRET_KEY"] = settings.auth.jwt_secret_key
+    uvicorn.run(app="app.main:app", **settings.server.uvicorn_kwargs)
+
+
 if __name__ == "__main__":
-    uvicorn.run(
-        app="app.main:app",
-        host=settings.server.host,
-        port=settings.server.port,
-    )
+    serve()
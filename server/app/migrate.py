@@ -0,0 +1,42 @@
+"""Bring the database schema to head: ``python -m app.migrate``."""
+
+import argparse
+import asyncio
+import sys
+
+from app.config import get_settings
+from app.core.migrations import is_current, migrate
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.migrate",
+        description="Apply pending database migrations.",
+    )
+    parser.add_argument(
+        "--create-all",
+        action="store_true",
+        help="create an empty database from the models and stamp it at head",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with status 1 if migrations are pending, without applying them",
+    )
+    args = parser.parse_args(argv)
+
+    settings = get_settings().app
+    if args.check:
+        current = asyncio.run(is_current(settings.database_url))
+        print("Database schema is current" if current else "Migrations are pending")
+        return 0 if current else 1
+
+    settings.data_dir.mkdir(parents=True, exist_ok=True)
+    create_all = args.create_all or settings.database_create_all_when_empty
+    result = asyncio.run(migrate(settings.database_url, create_all=create_all))
+    print(f"Database schema {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
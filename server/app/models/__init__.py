@@ -1,17 +1,37 @@
+from app.models.batch import BatchResult, TaskBatch
+from app.models.sync import SyncRead, Tombstone, TombstoneKind
 from app.models.tags import Tag, TagRead, TaskTagLink
-from app.models.tasks import Task, TaskCreate, TaskRead, TaskUpdate
+from app.models.tasks import (
+    Task,
+    TaskCreate,
+    TaskFilter,
+    TaskRead,
+    TaskSort,
+    TaskTagsUpdate,
+    TaskUpdate,
+)
+from app.models.tokens import RevokedToken
 from app.models.users import TokenOut, User, UserLogin, UserRead
 
 __all__ = [
+    "BatchResult",
+    "TaskBatch",
     "Tag",
     "TagRead",
     "TaskTagLink",
     "Task",
     "TaskCreate",
+    "TaskFilter",
+    "TaskSort",
+    "TaskTagsUpdate",
     "TaskUpdate",
     "TaskRead",
     "User",
     "UserRead",
     "UserLogin",
     "TokenOut",
+    "RevokedToken",
+    "SyncRead",
+    "Tombstone",
+    "TombstoneKind",
 ]
@@ -0,0 +1,93 @@
+from typing import Annotated, Literal
+
+from pydantic import Field as PydanticField
+from pydantic import model_validator
+from sqlmodel import Field, SQLModel
+
+from app.models.tasks import TaskCreate, TaskRead, TaskUpdate
+
+MAX_BATCH_OPERATIONS = 100
+
+# A task id, or the ref given to a task created earlier in the same batch.
+TaskRef = int | str
+
+
+class CreateOperation(SQLModel):
+    op: Literal["create"]
+    ref: str | None = Field(default=None, min_length=1, max_length=64)
+    task: TaskCreate
+    prepend: bool = False
+
+
+class UpdateOperation(SQLModel):
+    op: Literal["update"]
+    task_id: TaskRef
+    changes: TaskUpdate
+
+
+class ToggleOperation(SQLModel):
+    op: Literal["toggle"]
+    task_id: TaskRef
+
+
+class MoveOperation(SQLModel):
+    op: Literal["move"]
+    task_id: TaskRef
+    after_id: TaskRef | None = None
+
+
+class DeleteOperation(SQLModel):
+    op: Literal["delete"]
+    task_id: TaskRef
+
+
+class TagOperation(SQLModel):
+    op: Literal["add_tag", "remove_tag"]
+    task_id: TaskRef
+    tag_id: int
+
+
+BatchOperation = Annotated[
+    CreateOperation
+    | UpdateOperation
+    | ToggleOperation
+    | MoveOperation
+    | DeleteOperation
+    | TagOperation,
+    PydanticField(discriminator="op"),
+]
+
+
+class TaskBatch(SQLModel):
+    """Task operations applied in order, in one transaction."""
+
+    operations: list[BatchOperation] = Field(
+        min_length=1, max_length=MAX_BATCH_OPERATIONS
+    )
+
+    @model_validator(mode="after")
+    def check_refs(self) -> "TaskBatch":
+        defined: set[str] = set()
+        for index, operation in enumerate(self.operations):
+            targets = [getattr(operation, "task_id", None)]
+            if isinstance(operation, MoveOperation):
+                targets.append(operation.after_id)
+            for target in targets:
+                if isinstance(target, str) and target not in defined:
+                    raise ValueError(
+                        f"operation {index} refers to {target!r}, which no"
+                        " earlier create defines"
+                    )
+            if isinstance(operation, CreateOperation) and operation.ref is not None:
+                if operation.ref in defined:
+                    raise ValueError(f"ref {operation.ref!r} is defined twice")
+                defined.add(operation.ref)
+        return self
+
+
+class BatchResult(SQLModel):
+    """The outcome of one operation: the task as it stands afterwards."""
+
+    task_id: int
+    # None once the task has been deleted.
+    task: TaskRead | None
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any, ClassVar, Literal
+
+from sqlalchemy import DateTime, Index
+from sqlmodel import Field, SQLModel
+
+from app.models.tags import TagRead
+from app.models.tasks import TaskRead
+
+TombstoneKind = Literal["task", "tag"]
+
+
+class Tombstone(SQLModel, table=True):
+    """Marks a deleted task or tag, so sync can report the deletion."""
+
+    __tablename__: ClassVar[Any] = "tombstones"
+    __table_args__ = (Index("ix_tombstones_user_id_version", "user_id", "version"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id", ondelete="CASCADE")
+    kind: str = Field(max_length=8)
+    entity_id: int
+    version: int
+    deleted_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+
+
+class SyncRead(SQLModel):
+    """
+    Everything that changed for a user after the ``since`` version.
+
+    Apply ``deleted_*`` and then upsert ``tasks`` and ``tags``; pass
+    ``version`` as ``since`` next time. With ``reset`` set, the lists hold
+    the whole board and replace the client's copy instead.
+    """
+
+    version: int
+    reset: bool
+    tasks: list[TaskRead]
+    tags: list[TagRead]
+    deleted_tasks: list[int]
+    deleted_tags: list[int]
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -11,19 +11,35 @@ if TYPE_CHECKING:
 class TaskTagLink(SQLModel, table=True):
     __tablename__: ClassVar[Any] = "task_tags"
 
-    task_id: int | None = Field(default=None, foreign_key="tasks.id", primary_key=True)
-    tag_id: int | None = Field(default=None, foreign_key="tags.id", primary_key=True)
+    task_id: int | None = Field(
+        default=None, foreign_key="tasks.id", primary_key=True, ondelete="CASCADE"
+    )
+    tag_id: int | None = Field(
+        default=None,
+        foreign_key="tags.id",
+        primary_key=True,
+        index=True,
+        ondelete="CASCADE",
+    )
+    # Linking or unlinking also stamps the task, which is what sync reports.
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
 
 class Tag(SQLModel, table=True):
     __tablename__: ClassVar[Any] = "tags"
-    __table_args__ = (UniqueConstraint("user_id", "name", name="uq_tags_user_name"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_tags_user_name"),
+        Index("ix_tags_user_id_version", "user_id", "version"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(index=True, min_length=1, max_length=50)
     user_id: int = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
-    tasks: list["Task"] = Relationship(back_populates="tags", link_model=TaskTagLink)
+    tasks: list["Task"] = Relationship(
+        back_populates="tags", link_model=TaskTagLink, passive_deletes=True
+    )
     user: "User" = Relationship(back_populates="tags")
 
 
@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
-from sqlalchemy import Index
+from sqlalchemy import DDL, DateTime, Index, event, text
 from sqlalchemy.orm import Mapped
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -11,33 +11,141 @@ from app.models.users import User
 
 class Task(SQLModel, table=True):
     __tablename__: ClassVar[Any] = "tasks"
-    __table_args__ = (Index("ix_tasks_user_id_position", "user_id", "position"),)
+    __table_args__ = (
+        Index("ix_tasks_user_id_position", "user_id", "position"),
+        Index(
+            "ix_tasks_user_id_completed_position", "user_id", "completed", "position"
+        ),
+        Index("ix_tasks_user_id_deadline", "user_id", "deadline"),
+        Index("ix_tasks_user_id_version", "user_id", "version"),
+        # Expression indexes backing the list sort orders; the expressions
+        # must match the sort keys in TaskService exactly.
+        Index(
+            "ix_tasks_user_id_deadline_sort",
+            "user_id",
+            text("coalesce(deadline, '9999-12-31')"),
+            "id",
+        ),
+        Index("ix_tasks_user_id_title_sort", "user_id", text("lower(title)"), "id"),
+        Index(
+            "ix_tasks_user_id_completed_at_sort",
+            "user_id",
+            text("coalesce(completed_at, '-infinity')"),
+            "id",
+        ),
+    )
 
     id: int = Field(primary_key=True)
     title: str = Field(index=True)
     description: str = Field(default="")
     position: float = Field(default=0.0, index=True)
     completed: bool = Field(default=False)
-    completed_at: datetime | None = Field(default=None, nullable=True)
+    completed_at: datetime | None = Field(
+        default=None, nullable=True, sa_type=DateTime(timezone=True)
+    )
     deadline: date | None = Field(default=None, nullable=True)
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     tags: Mapped[list[Tag]] = Relationship(
-        back_populates="tasks", link_model=TaskTagLink
+        back_populates="tasks", link_model=TaskTagLink, passive_deletes=True
     )
     user_id: int = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
     user: "User" = Relationship(back_populates="tasks")
 
 
+# Full-text search over title and description. On SQLite an external
+# content FTS5 table mirrors tasks through triggers; on PostgreSQL a GIN
+# index covers a weighted tsvector. Neither is expressible as table
+# metadata, so create_all gets them from these DDL hooks and migrations
+# carry their own copy.
+#
+# The FTS5 table also indexes user_id as a token, so a search can match it
+# alongside the terms and only ever reads and ranks the caller's rows.
+SEARCH_TABLE = "tasks_fts"
+SEARCH_INDEX = "ix_tasks_search"
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A')"
+    " || setweight(to_tsvector('simple'::regconfig, description), 'B')"
+)
+SEARCH_DDL = {
+    "sqlite": [
+        (
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            "title, description, user_id, content='tasks', content_rowid='id',"
+            " tokenize='unicode61 remove_diacritics 2')"
+        ),
+        (
+            f"CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN"
+            f" INSERT INTO {SEARCH_TABLE}(rowid, title, description, user_id)"
+            " VALUES (new.id, new.title, new.description, new.user_id); END"
+        ),
+        (
+            f"CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN"
+            f" INSERT INTO {SEARCH_TABLE}"
+            f"({SEARCH_TABLE}, rowid, title, description, user_id) VALUES"
+            " ('delete', old.id, old.title, old.description, old.user_id); END"
+        ),
+        (
+            f"CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description"
+            f" ON tasks BEGIN"
+            f" INSERT INTO {SEARCH_TABLE}"
+            f"({SEARCH_TABLE}, rowid, title, description, user_id) VALUES"
+            " ('delete', old.id, old.title, old.description, old.user_id);"
+            f" INSERT INTO {SEARCH_TABLE}(rowid, title, description, user_id)"
+            " VALUES (new.id, new.title, new.description, new.user_id); END"
+        ),
+    ],
+    "postgresql": [
+        f"CREATE INDEX {SEARCH_INDEX} ON tasks USING gin (({SEARCH_VECTOR}))",
+    ],
+}
+
+for _dialect, _statements in SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            Task.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+
+
+# Upper bound on the tag ids sent with one task, which keeps the IN list
+# validating them short.
+MAX_TASK_TAGS = 100
+
+
 class TaskCreate(SQLModel):
     title: str = Field(min_length=1, max_length=500)
     description: str = Field(default="", max_length=5000)
     deadline: date | None = None
+    tag_ids: list[int] = Field(default_factory=list, max_length=MAX_TASK_TAGS)
 
 
 class TaskUpdate(SQLModel):
     title: str | None = Field(default=None, min_length=1, max_length=500)
     description: str | None = Field(default=None, max_length=5000)
     deadline: date | None = None
+    # Replaces the task's tags when set; null or absent leaves them alone.
+    tag_ids: list[int] | None = Field(default=None, max_length=MAX_TASK_TAGS)
+
+
+class TaskTagsUpdate(SQLModel):
+    tag_ids: list[int] = Field(max_length=MAX_TASK_TAGS)
+
+
+# Orders for listing tasks, each ending with id as a tiebreak:
+# manual by position, deadline soonest first, title case-insensitively,
+# completed_at most recent first. Tasks without a value come last.
+TaskSort = Literal["manual", "deadline", "title", "completed_at"]
+
+
+class TaskFilter(SQLModel):
+    """Narrows a task listing; unset fields match every task."""
+
+    completed: bool | None = None
+    q: str | None = None
+    deadline_after: date | None = None
+    deadline_before: date | None = None
 
 
 class TaskRead(SQLModel):
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Any, ClassVar
+
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+
+class RevokedToken(SQLModel, table=True):
+    __tablename__: ClassVar[Any] = "revoked_tokens"
+
+    id: int | None = Field(default=None, primary_key=True)
+    jti: str = Field(unique=True, max_length=64)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    # When the token was revoked, so workers can fetch only recent rows.
+    # Unknown (null) for rows that predate the column.
+    revoked_at: datetime | None = Field(
+        default=None, sa_type=DateTime(timezone=True), index=True
+    )
@@ -14,9 +14,14 @@ class User(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     username: str = Field(unique=True, max_length=150)
     password_hash: str = Field(max_length=256)
-
-    tasks: list["Task"] = Relationship(back_populates="user", cascade_delete=True)
-    tags: list["Tag"] = Relationship(back_populates="user", cascade_delete=True)
+    # Latest change version handed out for this user's tasks and tags, and
+    # the newest version whose tombstones have since been purged.
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    purged_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+    # Deleting a user is left to ON DELETE CASCADE; the ORM never loads these.
+    tasks: list["Task"] = Relationship(back_populates="user", passive_deletes="all")
+    tags: list["Tag"] = Relationship(back_populates="user", passive_deletes="all")
 
 
 class UserRead(SQLModel):
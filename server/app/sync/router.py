@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.dependencies import DBSessionDep
+from app.core.security import CurrentUserDep
+from app.models import SyncRead
+from app.sync.service import SyncService
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+async def get_service(db: DBSessionDep) -> SyncService:
+    return SyncService(db)
+
+
+@router.get("", response_model=SyncRead)
+async def sync(
+    current_user: CurrentUserDep,
+    service: Annotated[SyncService, Depends(get_service)],
+    since: Annotated[int, Query(ge=0, description="Version of the last sync")] = 0,
+):
+    """
+    Return the tasks and tags changed, and the ids deleted, after ``since``.
+
+    Start with 0 to fetch the whole board, then pass the returned version.
+    """
+    return await service.changes(current_user, since)
@@ -0,0 +1,54 @@
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.versioning import require_user
+from app.models import SyncRead, Tombstone, User
+from app.tags.service import TagService
+from app.tasks.service import TaskService
+
+
+class SyncService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def changes(self, user: User, since: int) -> SyncRead:
+        """
+        Collect what changed in the user's board after version ``since``.
+
+        Each read is an index range over (user_id, version), so a client
+        that syncs regularly pays for its changes, not its board. When
+        ``since`` is ahead of the user's version, or older than the newest
+        purged tombstone, deletions may have been missed and the whole board
+        is returned with ``reset`` set.
+        """
+        connection = await self.session.connection()
+        stmt = select(User.version, User.purged_version).where(User.id == user.id)
+        current = require_user((await connection.execute(stmt)).one_or_none())
+        reset = since > current.version or since < current.purged_version
+        if reset:
+            since = 0
+
+        tasks = await TaskService(self.session).changed(user, since)
+        tags = await TagService(self.session).changed(user, since)
+        deleted: dict[str, list[int]] = {"task": [], "tag": []}
+        if since:
+            rows = await connection.execute(
+                select(Tombstone.kind, Tombstone.entity_id).where(
+                    Tombstone.user_id == user.id, Tombstone.version > since
+                )
+            )
+            # SQLite may reuse the id of a deleted row; a live row is newer
+            # than its tombstone and wins.
+            live = {"task": {task["id"] for task in tasks}, "tag": {t.id for t in tags}}
+            for kind, entity_id in rows:
+                if entity_id not in live[kind]:
+                    deleted[kind].append(entity_id)
+
+        return SyncRead(
+            version=current.version,
+            reset=reset,
+            tasks=tasks,
+            tags=tags,
+            deleted_tasks=deleted["task"],
+            deleted_tags=deleted["tag"],
+        )
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from app.core.conditional import list_cache_headers, not_modified
 from app.core.dependencies import DBSessionDep
+from app.core.group_commit import run_grouped
 from app.core.security import CurrentUserDep
 from app.models import TagRead
 from app.tags.service import TagService
@@ -14,10 +16,16 @@ async def get_service(db: DBSessionDep) -> TagService:
 
 @router.get("/", response_model=list[TagRead])
 async def list_tags(
+    request: Request,
+    response: Response,
     current_user: CurrentUserDep,
     service: TagService = Depends(get_service),
 ):
-    """List all tags for the current user."""
+    """List all tags for the current user; honours If-None-Match like tasks."""
+    headers = await list_cache_headers(request, service.session, current_user)
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return await service.list(current_user)
 
 
@@ -39,7 +47,10 @@ async def rename_tag(
     name: str = Query(min_length=1, max_length=50),
 ):
     """Rename a tag."""
-    tag = await service.rename(tag_id, current_user, name)
+    tag = await run_grouped(
+        service.session,
+        lambda session: TagService(session).rename(tag_id, current_user, name),
+    )
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
     return tag
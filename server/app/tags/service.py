@@ -1,7 +1,18 @@
+from collections.abc import Sequence
+
 from fastapi import HTTPException
+from sqlalchemy import delete, insert, literal
+from sqlalchemy.orm import Session
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.database import unit_of_work
+from app.core.versioning import (
+    next_version,
+    require_user,
+    tombstone,
+    touch_tagged_tasks,
+)
 from app.models import Tag, TagRead, Task, TaskTagLink, User
 
 
@@ -10,7 +21,16 @@ class TagService:
         self.session = session
 
     async def list(self, user: User) -> list[TagRead]:
+        # Ordered, so that an unchanged list is byte-for-byte the same.
+        stmt = select(Tag).where(Tag.user_id == user.id).order_by(Tag.id)
+        tags = await self.session.scalars(stmt)
+        return [self._to_read(tag) for tag in tags.all()]
+
+    async def changed(self, user: User, since: int) -> Sequence[TagRead]:
+        """Return the user's tags stamped with a version after ``since``."""
         stmt = select(Tag).where(Tag.user_id == user.id)
+        if since:
+            stmt = stmt.where(Tag.version > since).order_by(Tag.version)
         tags = await self.session.scalars(stmt)
         return [self._to_read(tag) for tag in tags.all()]
 
@@ -24,7 +44,7 @@ class TagService:
         if existing_tag:
             return self._to_read(existing_tag)
 
-        tag = Tag(name=name, user_id=user.id)
+        tag = Tag(name=name, user_id=user.id, version=await self._next_version(user))
         self.session.add(tag)
         await self.session.commit()
         await self.session.refresh(tag)
@@ -46,20 +66,30 @@ class TagService:
             await self._merge_tags(tag, existing_tag)
             return self._to_read(existing_tag)
 
+        # Tasks embed their tags' names, so they change along with the tag.
+        tag.version = await self._next_version(user)
         tag.name = new_name
+        connection = await self.session.connection()
+        await connection.execute(touch_tagged_tasks(tag_id, user.id, tag.version))
         self.session.add(tag)
         await self.session.commit()
         await self.session.refresh(tag)
         return self._to_read(tag)
 
     async def delete(self, tag_id: int, user: User) -> bool:
-        stmt = select(Tag).where(Tag.id == tag_id, Tag.user_id == user.id)
-        tag = (await self.session.scalars(stmt)).first()
-
-        if not tag:
+        connection = await self.session.connection()
+        version = await self._next_version(user)
+        # The links go through ON DELETE CASCADE; stamp their tasks first.
+        await connection.execute(touch_tagged_tasks(tag_id, user.id, version))
+        result = await connection.execute(
+            delete(Tag)
+            .where(Tag.id == tag_id, Tag.user_id == user.id)
+            .returning(Tag.id)
+        )
+        if result.first() is None:
+            # Nothing is committed, so the version is not used up.
             return False
-
-        await self.session.delete(tag)
+        await connection.execute(tombstone("tag", tag_id, user.id, version))
         await self.session.commit()
         return True
 
@@ -86,8 +116,9 @@ class TagService:
         if existing_link:
             return self._to_read(tag)
 
-        link = TaskTagLink(task_id=task_id, tag_id=tag_id)
-        self.session.add(link)
+        task.version = await self._next_version(user)
+        link = TaskTagLink(task_id=task_id, tag_id=tag_id, version=task.version)
+        self.session.add_all([task, link])
         await self.session.commit()
         await self.session.refresh(tag)
         return self._to_read(tag)
@@ -111,33 +142,45 @@ class TagService:
         link = (await self.session.scalars(link_stmt)).first()
 
         if link:
+            task.version = await self._next_version(user)
+            self.session.add(task)
             await self.session.delete(link)
             await self.session.commit()
 
         return True
 
-    async def _merge_tags(self, old_tag: Tag, new_tag: Tag) -> None:
-        stmt = select(TaskTagLink).where(TaskTagLink.tag_id == old_tag.id)
-        links = (await self.session.scalars(stmt)).all()
-
-        if links:
-            task_ids = [link.task_id for link in links]
-            existing_stmt = select(TaskTagLink).where(
-                TaskTagLink.tag_id == new_tag.id,
-                TaskTagLink.task_id.in_(task_ids),  # type: ignore[attr-defined]
+    @unit_of_work
+    def _merge_tags(self, session: Session, old_tag: Tag, new_tag: Tag) -> None:
+        version = require_user(
+            session.execute(next_version(old_tag.user_id)).scalar_one_or_none()
+        )
+        session.execute(touch_tagged_tasks(old_tag.id, old_tag.user_id, version))
+        # Links are moved in SQL rather than through the session, so no link
+        # row is deleted twice once the old tag goes.
+        already_linked = select(TaskTagLink.task_id).where(
+            TaskTagLink.tag_id == new_tag.id
+        )
+        session.execute(
+            insert(TaskTagLink).from_select(
+                ["task_id", "tag_id", "version"],
+                select(
+                    TaskTagLink.task_id, literal(new_tag.id), literal(version)
+                ).where(
+                    TaskTagLink.tag_id == old_tag.id,
+                    TaskTagLink.task_id.not_in(already_linked),  # type: ignore[union-attr]
+                ),
             )
-            already_linked = {
-                link.task_id
-                for link in (await self.session.scalars(existing_stmt)).all()
-            }
-
-            for link in links:
-                if link.task_id not in already_linked:
-                    self.session.add(TaskTagLink(task_id=link.task_id, tag_id=new_tag.id))
-                await self.session.delete(link)
-
-        await self.session.delete(old_tag)
-        await self.session.commit()
+        )
+        session.execute(delete(TaskTagLink).where(TaskTagLink.tag_id == old_tag.id))
+        session.execute(delete(Tag).where(Tag.id == old_tag.id))
+        session.execute(tombstone("tag", old_tag.id, old_tag.user_id, version))
+        session.commit()
+
+    async def _next_version(self, user: User) -> int:
+        connection = await self.session.connection()
+        return require_user(
+            (await connection.execute(next_version(user.id))).scalar_one_or_none()
+        )
 
     def _to_read(self, tag: Tag) -> TagRead:
         if tag.id is None:
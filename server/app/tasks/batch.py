@@ -0,0 +1,110 @@
+from typing import Any
+
+from fastapi import HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import BatchResult, TaskBatch, TaskRead, User
+from app.models.batch import (
+    CreateOperation,
+    DeleteOperation,
+    MoveOperation,
+    TagOperation,
+    TaskRef,
+    ToggleOperation,
+    UpdateOperation,
+)
+from app.tags.service import TagService
+from app.tasks.service import TaskService
+
+
+class BatchService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(self, user: User, batch: TaskBatch) -> list[BatchResult]:
+        """
+        Apply the operations of ``batch`` in order, all or nothing.
+
+        Each operation runs through the regular services on its own session
+        inside a SAVEPOINT of this session's transaction, so the services'
+        commits only release their savepoint and the batch is committed, and
+        fsynced, once. The first operation that finds no task (or tag) rolls
+        the whole batch back with a 404 naming its index.
+        """
+        connection = await self.session.connection()
+        refs: dict[str, int] = {}
+        results = []
+        # Session.begin_nested() would defer its SAVEPOINT until the session
+        # is next used; the connection's is emitted now, so the operations'
+        # savepoints nest inside it.
+        async with connection.begin_nested():
+            for index, operation in enumerate(batch.operations):
+                session = AsyncSession(
+                    bind=connection,
+                    expire_on_commit=False,
+                    join_transaction_mode="create_savepoint",
+                )
+                try:
+                    task_id, task = await self._apply(session, user, operation, refs)
+                except HTTPException as exc:
+                    # e.g. a create or update naming an unknown tag.
+                    raise HTTPException(
+                        status_code=exc.status_code,
+                        detail={"operation": index, "message": exc.detail},
+                    ) from exc
+                finally:
+                    await session.close()
+                if task_id is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail={"operation": index, "message": _not_found(operation)},
+                    )
+                results.append(BatchResult(task_id=task_id, task=task))
+        await self.session.commit()
+        return results
+
+    async def _apply(
+        self, session: AsyncSession, user: User, operation: Any, refs: dict[str, int]
+    ) -> tuple[int | None, TaskRead | None]:
+        """Run one operation; a None task id means its target was not found."""
+        tasks = TaskService(session)
+        if isinstance(operation, CreateOperation):
+            task = await tasks.create(user, operation.task, prepend=operation.prepend)
+            if operation.ref is not None:
+                refs[operation.ref] = task.id
+            return task.id, task
+
+        task_id = _resolve(operation.task_id, refs)
+        task: TaskRead | None
+        if isinstance(operation, UpdateOperation):
+            task = await tasks.update(task_id, user, operation.changes)
+        elif isinstance(operation, ToggleOperation):
+            task = await tasks.toggle_complete(task_id, user)
+        elif isinstance(operation, MoveOperation):
+            after_id = None
+            if operation.after_id is not None:
+                after_id = _resolve(operation.after_id, refs)
+            task = await tasks.move_task(task_id, user, after_id)
+        elif isinstance(operation, DeleteOperation):
+            deleted = await tasks.delete(task_id, user)
+            return (task_id if deleted else None), None
+        elif isinstance(operation, TagOperation):
+            tags = TagService(session)
+            if operation.op == "add_tag":
+                tag = await tags.add_tag_to_task(task_id, operation.tag_id, user)
+                found = tag is not None
+            else:
+                found = await tags.remove_tag_from_task(task_id, operation.tag_id, user)
+            task = await tasks.get(task_id, user) if found else None
+        return (task_id if task else None), task
+
+
+def _resolve(target: TaskRef, refs: dict[str, int]) -> int:
+    # TaskBatch has already checked that every ref is defined earlier.
+    return refs[target] if isinstance(target, str) else target
+
+
+def _not_found(operation: Any) -> str:
+    if isinstance(operation, TagOperation):
+        return "Task or tag not found"
+    return "Task not found"
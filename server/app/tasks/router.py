@@ -1,10 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from datetime import date
+from typing import Annotated
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic_core import to_json
+
+from app.core.conditional import list_cache_headers, not_modified
 from app.core.dependencies import DBSessionDep
+from app.core.group_commit import run_grouped
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    cursor_int,
+    cursor_str,
+    decode_cursor,
+    encode_cursor,
+)
 from app.core.security import CurrentUserDep
-from app.models import TagRead, TaskCreate, TaskRead, TaskUpdate
+from app.models import (
+    BatchResult,
+    TagRead,
+    TaskBatch,
+    TaskCreate,
+    TaskFilter,
+    TaskRead,
+    TaskSort,
+    TaskTagsUpdate,
+    TaskUpdate,
+)
 from app.tags.service import TagService
-from app.tasks.service import TaskService
+from app.tasks.batch import BatchService
+from app.tasks.service import SORT_ORDERS, TaskService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -17,13 +43,100 @@ async def get_tag_service(db: DBSessionDep) -> TagService:
     return TagService(db)
 
 
+async def get_filters(
+    completed: bool | None = None,
+    q: Annotated[
+        str | None,
+        Query(
+            min_length=1,
+            max_length=200,
+            description="Case-insensitive substring of the title or description",
+        ),
+    ] = None,
+    deadline_after: Annotated[
+        date | None, Query(description="Only tasks due on or after this date")
+    ] = None,
+    deadline_before: Annotated[
+        date | None, Query(description="Only tasks due on or before this date")
+    ] = None,
+) -> TaskFilter:
+    return TaskFilter(
+        completed=completed,
+        q=q,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+    )
+
+
 @router.get("/", response_model=list[TaskRead])
 async def list_tasks(
+    request: Request,
     current_user: CurrentUserDep,
+    filters: Annotated[TaskFilter, Depends(get_filters)],
     service: TaskService = Depends(get_service),
+    sort: TaskSort = "manual",
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
 ):
-    """List all tasks for the current user, ordered by position."""
-    return await service.list(current_user)
+    """
+    List the current user's tasks matching the filters, in ``sort`` order.
+
+    Without ``limit`` or ``cursor`` every match is returned. Otherwise one
+    page is returned, and the X-Next-Cursor header holds the cursor for the
+    next page until the last one. Keep the filters unchanged across pages.
+
+    Send the ETag back in If-None-Match to get 304 Not Modified while the
+    user's tasks are unchanged.
+    """
+    headers = await list_cache_headers(request, service.session, current_user)
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if limit is None and cursor is None:
+        tasks = await service.list(current_user, filters, sort)
+    else:
+        after = None
+        if cursor:
+            cursor_sort, *key = decode_cursor(
+                cursor, (cursor_str, SORT_ORDERS[sort].decode, cursor_int)
+            )
+            if cursor_sort != sort:
+                raise HTTPException(
+                    status_code=400, detail="Cursor is for a different sort"
+                )
+            after = tuple(key)
+        tasks, next_key = await service.page(
+            current_user, limit or DEFAULT_PAGE_SIZE, after, filters, sort
+        )
+        if next_key is not None:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor((sort, *next_key))
+    # Rows already have the TaskRead shape; skip response_model re-validation.
+    return Response(
+        content=to_json(tasks), media_type="application/json", headers=headers
+    )
+
+
+@router.get("/search", response_model=list[TaskRead])
+async def search_tasks(
+    current_user: CurrentUserDep,
+    service: Annotated[TaskService, Depends(get_service)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+):
+    """
+    Search the current user's task titles and descriptions, best match first.
+
+    Each word of ``q`` matches words starting with it. Results are paged like
+    the task list, with the next cursor in the X-Next-Cursor header.
+    """
+    after = decode_cursor(cursor, (float, cursor_int)) if cursor else None
+    tasks, next_key = await service.search(current_user, q, limit, after)
+    headers = {}
+    if next_key is not None:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(next_key)
+    return Response(
+        content=to_json(tasks), media_type="application/json", headers=headers
+    )
 
 
 @router.post("/", response_model=TaskRead)
@@ -31,9 +144,27 @@ async def create_task(
     task_data: TaskCreate,
     current_user: CurrentUserDep,
     service: TaskService = Depends(get_service),
+    prepend: bool = False,
 ):
-    """Create a new task at the end of the user's list."""
-    return await service.create(current_user, task_data)
+    """Create a new task at the end of the user's list, or at the top with prepend."""
+    return await service.create(current_user, task_data, prepend=prepend)
+
+
+@router.post("/batch", response_model=list[BatchResult])
+async def apply_batch(
+    batch: TaskBatch,
+    current_user: CurrentUserDep,
+    db: DBSessionDep,
+):
+    """
+    Apply create/update/toggle/move/delete/add_tag/remove_tag operations in order.
+
+    The batch is one transaction: either every operation applies or, with a
+    404 naming the failing operation's index, none does. ``task_id`` and
+    ``after_id`` take a task id, or the ``ref`` of a task created earlier in
+    the batch. Each result holds the task as it stands after its operation.
+    """
+    return await BatchService(db).apply(current_user, batch)
 
 
 @router.put("/{task_id}", response_model=TaskRead)
@@ -43,8 +174,11 @@ async def update_task(
     current_user: CurrentUserDep,
     service: TaskService = Depends(get_service),
 ):
-    """Update a task's details."""
-    task = await service.update(task_id, current_user, task_data)
+    """Update a task's details; ``tag_ids``, when set, replaces its tags."""
+    task = await run_grouped(
+        service.session,
+        lambda session: TaskService(session).update(task_id, current_user, task_data),
+    )
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
@@ -57,7 +191,10 @@ async def toggle_task(
     service: TaskService = Depends(get_service),
 ):
     """Toggle the completed status of a task."""
-    task = await service.toggle_complete(task_id, current_user)
+    task = await run_grouped(
+        service.session,
+        lambda session: TaskService(session).toggle_complete(task_id, current_user),
+    )
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
@@ -94,6 +231,24 @@ async def move_task(
     return task
 
 
+@router.put("/{task_id}/tags", response_model=TaskRead)
+async def replace_task_tags(
+    task_id: int,
+    tags: TaskTagsUpdate,
+    current_user: CurrentUserDep,
+    service: Annotated[TaskService, Depends(get_service)],
+):
+    """Replace a task's tags with ``tag_ids``; an empty list removes them all."""
+    task_data = TaskUpdate(tag_ids=tags.tag_ids)
+    task = await run_grouped(
+        service.session,
+        lambda session: TaskService(session).update(task_id, current_user, task_data),
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
 @router.post("/{task_id}/tags/{tag_id}", response_model=TagRead)
 async def add_tag_to_task(
     task_id: int,
@@ -102,7 +257,12 @@ async def add_tag_to_task(
     service: TagService = Depends(get_tag_service),
 ):
     """Add an existing tag to a task."""
-    tag = await service.add_tag_to_task(task_id, tag_id, current_user)
+    tag = await run_grouped(
+        service.session,
+        lambda session: TagService(session).add_tag_to_task(
+            task_id, tag_id, current_user
+        ),
+    )
     if not tag:
         raise HTTPException(status_code=404, detail="Task or tag not found")
     return tag
@@ -116,7 +276,12 @@ async def remove_tag_from_task(
     service: TagService = Depends(get_tag_service),
 ):
     """Remove a tag from a task."""
-    success = await service.remove_tag_from_task(task_id, tag_id, current_user)
+    success = await run_grouped(
+        service.session,
+        lambda session: TagService(session).remove_tag_from_task(
+            task_id, tag_id, current_user
+        ),
+    )
     if not success:
         raise HTTPException(status_code=404, detail="Task or tag not found")
     return Response(status_code=204)
@@ -1,91 +1,330 @@
-from datetime import datetime, timezone
-from collections.abc import Sequence
-from sqlalchemy.orm import selectinload
-from sqlmodel import asc, func, select
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import (
+    JSON,
+    case,
+    cast,
+    column,
+    delete,
+    insert,
+    literal,
+    literal_column,
+    null,
+    table,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlmodel import asc, desc, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import TagRead, Task, TaskCreate, TaskRead, TaskUpdate, User
+from app.core.database import unit_of_work
+from app.core.pagination import cursor_str, nullable
+from app.core.versioning import next_version, require_user, tombstone
+from app.models import (
+    Tag,
+    TagRead,
+    Task,
+    TaskCreate,
+    TaskFilter,
+    TaskRead,
+    TaskSort,
+    TaskTagLink,
+    TaskUpdate,
+    User,
+)
+from app.models.tasks import SEARCH_TABLE, SEARCH_VECTOR
 
 REBALANCE_THRESHOLD = 1e-9
 
+TASK_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.position,
+    Task.completed,
+    Task.completed_at,
+    Task.deadline,
+)
+
+# Tasks as plain dicts shaped like TaskRead, and the (sort value, id) of a
+# task, which is where the next page starts.
+TaskRows = list[dict[str, Any]]
+PageKey = tuple[Any, int]
+
+
+@dataclass(frozen=True)
+class SortOrder:
+    """How the task list is ordered for one TaskSort option."""
+
+    column: InstrumentedAttribute
+    # Parses the column's value back out of a JSON cursor.
+    decode: Callable[[Any], Any]
+    # Maps the column, or a bound value, to the indexed sort key.
+    key: Callable[[Any], Any] = lambda value: value
+    descending: bool = False
+
+
+# Search terms are reduced to word characters, so user input can never
+# carry query syntax into FTS5 MATCH or to_tsquery.
+SEARCH_TERM = re.compile(r"\w+")
+
+# Title matches rank above description matches; the user_id token adds nothing.
+SEARCH_WEIGHTS = (10.0, 1.0, 0.0)
+
+search_table = table(SEARCH_TABLE, column("rowid"))
+
+
+def _nulls_as(sentinel: str) -> Callable[[Any], Any]:
+    # A literal rather than a bound parameter, so the expression matches
+    # the one in the index definition.
+    return lambda value: func.coalesce(value, literal_column(f"'{sentinel}'"))
+
+
+# Each key is backed by an index on tasks (see Task.__table_args__), so a
+# page is a range scan in index order rather than a sort of every match.
+SORT_ORDERS: dict[TaskSort, SortOrder] = {
+    "manual": SortOrder(Task.position, float),
+    "deadline": SortOrder(
+        Task.deadline, nullable(date.fromisoformat), key=_nulls_as("9999-12-31")
+    ),
+    "title": SortOrder(Task.title, cursor_str, key=func.lower),
+    "completed_at": SortOrder(
+        Task.completed_at,
+        nullable(datetime.fromisoformat),
+        key=_nulls_as("-infinity"),
+        descending=True,
+    ),
+}
+
 
 class TaskService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def list(self, user: User) -> list[TaskRead]:
+    async def list(
+        self,
+        user: User,
+        filters: TaskFilter | None = None,
+        sort: TaskSort = "manual",
+        limit: int | None = None,
+        after: PageKey | None = None,
+    ) -> TaskRows:
+        """
+        Return the user's tasks as plain dicts shaped like TaskRead.
+
+        A single Core query aggregates each task's tags into a JSON array,
+        so no ORM objects are hydrated and no second query loads tags.
+        Tasks are ordered by ``sort`` and then id; ``after`` skips to the
+        tasks following that key and ``limit`` caps how many are returned.
+        """
+        stmt = self._list_query(user, filters, sort, limit, after)
+        connection = await self.session.connection()
+        rows = await connection.execute(stmt)
+        return [row._asdict() for row in rows]
+
+    async def changed(self, user: User, since: int) -> TaskRows:
+        """
+        Return the user's tasks stamped with a version after ``since``.
+
+        The (user_id, version) index keeps this proportional to the number
+        of changes rather than to the size of the board.
+        """
+        if not since:
+            return await self.list(user)
+        connection = await self.session.connection()
+        rows = await connection.execute(self._changed_query(user, since))
+        return [row._asdict() for row in rows]
+
+    async def page(
+        self,
+        user: User,
+        limit: int,
+        after: PageKey | None = None,
+        filters: TaskFilter | None = None,
+        sort: TaskSort = "manual",
+    ) -> tuple[TaskRows, PageKey | None]:
+        """
+        Return up to ``limit`` tasks after the key ``after``, and the key to
+        continue from (None on the last page).
+
+        Pages are keyed on the last task's (sort value, id) rather than an
+        offset, so each page is an index range scan and moving or deleting
+        tasks between requests does not shift the tasks not yet seen. A task
+        moved from a later page to an earlier one is skipped, and a rebalance
+        renumbers positions, which can repeat or skip tasks for a cursor
+        issued before it.
+        """
+        tasks = await self.list(user, filters, sort, limit=limit + 1, after=after)
+        if len(tasks) <= limit:
+            return tasks, None
+        del tasks[limit:]
+        last = tasks[-1]
+        return tasks, (last[SORT_ORDERS[sort].column.key], last["id"])
+
+    async def search(
+        self,
+        user: User,
+        query: str,
+        limit: int,
+        after: PageKey | None = None,
+    ) -> tuple[TaskRows, PageKey | None]:
+        """
+        Return up to ``limit`` of the user's tasks matching ``query``, best
+        match first, and the (score, id) key to continue from.
+
+        Every word of ``query`` must prefix-match a word of the title or
+        description. Ranking scores every one of the user's matches, so
+        unlike the list a deep page costs the same as the first. Scores
+        shift as other tasks change, so pages are only approximately stable.
+        """
+        terms = SEARCH_TERM.findall(query)
+        if not terms:
+            return [], None
+        hits = self._search_hits(user, terms)
         stmt = (
-            select(Task)
+            select(*TASK_COLUMNS, self._tags_json().label("tags"), hits.c.score)
+            .join_from(hits, Task, Task.id == hits.c.id)
             .where(Task.user_id == user.id)
-            .order_by(asc(Task.position))
-            .options(selectinload(Task.tags))
+            .order_by(hits.c.score, Task.id)
+            .limit(limit + 1)
         )
-        tasks = await self.session.scalars(stmt)
-        return [self._to_read(task) for task in tasks.all()]
+        if after is not None:
+            score, task_id = after
+            stmt = stmt.where(
+                hits.c.score >= score,
+                (hits.c.score > score) | (Task.id > task_id),
+            )
+        connection = await self.session.connection()
+        tasks = [row._asdict() for row in await connection.execute(stmt)]
+        next_key = None
+        if len(tasks) > limit:
+            del tasks[limit:]
+            next_key = (tasks[-1]["score"], tasks[-1]["id"])
+        for task in tasks:
+            del task["score"]
+        return tasks, next_key
 
-    async def create(self, user: User, task_data: TaskCreate) -> TaskRead:
-        payload = task_data.model_dump(exclude_unset=True)
-        payload["user_id"] = user.id
+    async def create(
+        self, user: User, task_data: TaskCreate, prepend: bool = False
+    ) -> TaskRead:
+        """
+        Insert a task at the end (or, with ``prepend``, the top) of the list.
 
-        stmt = select(func.max(Task.position)).where(Task.user_id == user.id)
-        max_position = await self.session.scalar(stmt)
-        payload["position"] = (max_position or 0.0) + 1.0
+        The position is computed inside the INSERT from the user's current
+        MAX/MIN position, so there is no separate read to race against.
+        Tags in ``tag_ids`` are linked by one more INSERT.
+        """
+        connection = await self.session.connection()
+        # Claiming the version takes the user's row lock, which also keeps
+        # concurrent creates from reading the same MAX under READ COMMITTED.
+        version = require_user(
+            (await connection.execute(next_version(user.id))).scalar_one_or_none()
+        )
+        tags = await self._find_tags(user, task_data.tag_ids)
 
-        task = Task(**payload)
-        self.session.add(task)
+        payload = task_data.model_dump(exclude={"tag_ids"})
+        if prepend:
+            position = func.coalesce(func.min(Task.position), 1.0) - 1.0
+        else:
+            position = func.coalesce(func.max(Task.position), 0.0) + 1.0
+        columns = Task.__table__.c  # type: ignore[attr-defined]
+        values = [literal(value, columns[name].type) for name, value in payload.items()]
+        rows = select(*values, literal(user.id), literal(version), position).where(
+            Task.user_id == user.id
+        )
+        stmt = (
+            insert(Task)
+            .from_select([*payload, "user_id", "version", "position"], rows)
+            .returning(*TASK_COLUMNS)
+        )
+        row = (await connection.execute(stmt)).one()
+        if tags:
+            await connection.execute(self._insert_links(row.id, tags, version))
         await self.session.commit()
-        await self.session.refresh(task, attribute_names=["tags"])
-        return self._to_read(task)
+        return TaskRead(**row._asdict(), tags=tags)
+
+    async def get(self, task_id: int, user: User) -> TaskRead | None:
+        stmt = select(*TASK_COLUMNS, self._tags_json().label("tags")).where(
+            Task.id == task_id, Task.user_id == user.id
+        )
+        return await self._execute_for_read(stmt)
 
     async def update(
         self, task_id: int, user: User, task_data: TaskUpdate
     ) -> TaskRead | None:
+        """
+        Apply the set fields of ``task_data``.
+
+        A set ``tag_ids`` replaces the task's tags: links to tags not in it
+        are deleted and the missing ones inserted, leaving the rest as they
+        are. Unknown tag ids fail the whole update with a 404.
+        """
+        updates = task_data.model_dump(exclude_unset=True, exclude={"tag_ids"})
+        if not updates and task_data.tag_ids is None:
+            return await self.get(task_id, user)
+
+        version = await self._next_version(user)
         stmt = (
-            select(Task)
+            update(Task)
             .where(Task.id == task_id, Task.user_id == user.id)
-            .options(selectinload(Task.tags))
+            .values(**updates, version=version)
         )
-        task = (await self.session.scalars(stmt)).first()
-        if not task:
+        if task_data.tag_ids is None:
+            stmt = stmt.returning(*TASK_COLUMNS, self._tags_json().label("tags"))
+            return await self._execute_for_read(stmt, commit=True)
+
+        tags = await self._find_tags(user, task_data.tag_ids)
+        connection = await self.session.connection()
+        row = (await connection.execute(stmt.returning(*TASK_COLUMNS))).first()
+        if row is None:
             return None
-        updates = task_data.model_dump(exclude_unset=True)
-        for key, value in updates.items():
-            setattr(task, key, value)
-        self.session.add(task)
+        await self._replace_tags(task_id, tags, version)
         await self.session.commit()
-        await self.session.refresh(task, attribute_names=["tags"])
-        return self._to_read(task)
+        return TaskRead(**row._asdict(), tags=tags)
 
     async def toggle_complete(self, task_id: int, user: User) -> TaskRead | None:
+        # SET expressions see the pre-update row, so both columns flip together.
         stmt = (
-            select(Task)
+            update(Task)
             .where(Task.id == task_id, Task.user_id == user.id)
-            .options(selectinload(Task.tags))
+            .values(
+                completed=~Task.completed,
+                completed_at=case(
+                    (Task.completed, null()), else_=datetime.now(timezone.utc)
+                ),
+                version=await self._next_version(user),
+            )
+            .returning(*TASK_COLUMNS, self._tags_json().label("tags"))
         )
-        task = (await self.session.scalars(stmt)).first()
-        if not task:
-            return None
-        task.completed = not task.completed
-        task.completed_at = datetime.now(timezone.utc) if task.completed else None
-        self.session.add(task)
-        await self.session.commit()
-        await self.session.refresh(task, attribute_names=["tags"])
-        return self._to_read(task)
+        return await self._execute_for_read(stmt, commit=True)
 
     async def delete(self, task_id: int, user: User) -> bool:
-        stmt = (
-            select(Task)
+        # task_tags rows go with the task through ON DELETE CASCADE.
+        connection = await self.session.connection()
+        result = await connection.execute(
+            delete(Task)
             .where(Task.id == task_id, Task.user_id == user.id)
+            .returning(Task.id)
         )
-        task = (await self.session.scalars(stmt)).first()
-        if not task:
+        if result.first() is None:
             return False
-        await self.session.delete(task)
+        version = await self._next_version(user)
+        await connection.execute(tombstone("task", task_id, user.id, version))
         await self.session.commit()
         return True
 
-    async def move_task(
+    @unit_of_work
+    def move_task(
         self,
+        session: Session,
         task_id: int,
         user: User,
         after_id: int | None = None,
@@ -95,12 +334,13 @@ class TaskService:
             .where(Task.id == task_id, Task.user_id == user.id)
             .options(selectinload(Task.tags))
         )
-        task = (await self.session.scalars(stmt)).first()
+        task = session.scalars(stmt).first()
         if not task:
             return None
 
         if after_id is None:
-            first_task = await self._fetch_neighbor(
+            first_task = self._fetch_neighbor(
+                session,
                 user.id,
                 task_id,
                 order_by=asc(Task.position),
@@ -109,10 +349,10 @@ class TaskService:
             needs_rebalance = False
         else:
             if after_id == task_id:
-                await self.session.refresh(task, attribute_names=["tags"])
                 return self._to_read(task)
 
-            after_task = await self._fetch_neighbor(
+            after_task = self._fetch_neighbor(
+                session,
                 user.id,
                 task_id,
                 task_filter=Task.id == after_id,
@@ -121,7 +361,8 @@ class TaskService:
             if not after_task:
                 return None
 
-            next_task = await self._fetch_neighbor(
+            next_task = self._fetch_neighbor(
+                session,
                 user.id,
                 task_id,
                 task_filter=Task.position > after_task.position,
@@ -138,19 +379,23 @@ class TaskService:
                 and (next_task.position - after_task.position) < (REBALANCE_THRESHOLD * 2)
             )
 
-        self.session.add(task)
+        task.version = require_user(
+            session.execute(next_version(user.id)).scalar_one_or_none()
+        )
+        session.add(task)
 
         if needs_rebalance:
-            for i, t in enumerate(await self._list_tasks_for_rebalance(user.id), start=1):
+            for i, t in enumerate(self._list_tasks_for_rebalance(session, user.id), start=1):
                 t.position = float(i)
-                self.session.add(t)
+                t.version = task.version
+                session.add(t)
 
-        await self.session.commit()
-        await self.session.refresh(task, attribute_names=["tags"])
+        session.commit()
         return self._to_read(task)
 
-    async def _fetch_neighbor(
+    def _fetch_neighbor(
         self,
+        session: Session,
         user_id: int | None,
         task_id: int,
         *,
@@ -166,11 +411,176 @@ class TaskService:
         if task_filter is not None:
             stmt = stmt.where(task_filter)
 
-        return (await self.session.scalars(stmt)).first()
+        return session.scalars(stmt).first()
 
-    async def _list_tasks_for_rebalance(self, user_id: int | None) -> Sequence[Task]:
+    def _list_tasks_for_rebalance(
+        self, session: Session, user_id: int | None
+    ) -> Sequence[Task]:
         stmt = select(Task).where(Task.user_id == user_id).order_by(asc(Task.position))
-        return (await self.session.scalars(stmt)).all()
+        return session.scalars(stmt).all()
+
+    async def _find_tags(self, user: User, tag_ids: Sequence[int]) -> Sequence[TagRead]:
+        """The user's tags with ``tag_ids``, by id; a 404 if any is missing."""
+        if not tag_ids:
+            return []
+        wanted = set(tag_ids)
+        stmt = (
+            select(Tag.id, Tag.name)
+            .where(Tag.user_id == user.id, Tag.id.in_(wanted))  # type: ignore[attr-defined]
+            .order_by(Tag.id)
+        )
+        connection = await self.session.connection()
+        tags = [TagRead(**row._asdict()) for row in await connection.execute(stmt)]
+        if len(tags) < len(wanted):
+            raise HTTPException(status_code=404, detail="Tag not found")
+        return tags
+
+    async def _replace_tags(
+        self, task_id: int, tags: Sequence[TagRead], version: int
+    ) -> None:
+        """Make ``tags`` the task's tags with one DELETE and one INSERT."""
+        connection = await self.session.connection()
+        await connection.execute(
+            delete(TaskTagLink).where(
+                TaskTagLink.task_id == task_id,
+                TaskTagLink.tag_id.not_in([tag.id for tag in tags]),  # type: ignore[attr-defined]
+            )
+        )
+        if tags:
+            await connection.execute(self._insert_links(task_id, tags, version))
+
+    def _insert_links(self, task_id: int, tags: Sequence[TagRead], version: int):
+        """INSERT of task_tags rows that skips links which already exist."""
+        if self.session.bind.dialect.name == "postgresql":
+            insert_links = postgresql.insert(TaskTagLink)
+        else:
+            insert_links = sqlite.insert(TaskTagLink)
+        rows = [
+            {"task_id": task_id, "tag_id": tag.id, "version": version} for tag in tags
+        ]
+        return insert_links.values(rows).on_conflict_do_nothing()
+
+    async def _next_version(self, user: User) -> int:
+        connection = await self.session.connection()
+        return require_user(
+            (await connection.execute(next_version(user.id))).scalar_one_or_none()
+        )
+
+    async def _execute_for_read(self, stmt, commit: bool = False) -> TaskRead | None:
+        """Run a statement yielding TASK_COLUMNS and the tags of one task."""
+        connection = await self.session.connection()
+        row = (await connection.execute(stmt)).first()
+        if row is None:
+            return None
+        if commit:
+            await self.session.commit()
+        return TaskRead(**row._asdict())
+
+    def _list_query(
+        self,
+        user: User,
+        filters: TaskFilter | None = None,
+        sort: TaskSort = "manual",
+        limit: int | None = None,
+        after: PageKey | None = None,
+    ):
+        order = SORT_ORDERS[sort]
+        key = order.key(order.column)
+        direction = desc if order.descending else asc
+        stmt = (
+            select(*TASK_COLUMNS, self._tags_json().label("tags"))
+            .where(Task.user_id == user.id, *self._conditions(filters))
+            .order_by(direction(key), direction(Task.id))
+        )
+        if after is not None:
+            value, task_id = after
+            type_ = order.column.type
+            bound = order.key(
+                cast(null(), type_) if value is None else literal(value, type_)
+            )
+            # Spelled out rather than as a row-value comparison: SQLite only
+            # seeks an expression index on a plain comparison of its key.
+            if order.descending:
+                stmt = stmt.where(key <= bound, (key < bound) | (Task.id < task_id))
+            else:
+                stmt = stmt.where(key >= bound, (key > bound) | (Task.id > task_id))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def _changed_query(self, user: User, since: int):
+        return (
+            select(*TASK_COLUMNS, self._tags_json().label("tags"))
+            .where(Task.user_id == user.id, Task.version > since)
+            .order_by(Task.version, Task.id)
+        )
+
+    @staticmethod
+    def _conditions(filters: TaskFilter | None) -> Sequence[Any]:
+        """WHERE clauses for the set fields of ``filters``."""
+        if filters is None:
+            return []
+        conditions = []
+        if filters.completed is not None:
+            conditions.append(Task.completed == filters.completed)
+        if filters.q is not None:
+            conditions.append(
+                Task.title.icontains(filters.q, autoescape=True)
+                | Task.description.icontains(filters.q, autoescape=True)
+            )
+        if filters.deadline_after is not None:
+            conditions.append(Task.deadline >= filters.deadline_after)
+        if filters.deadline_before is not None:
+            conditions.append(Task.deadline <= filters.deadline_before)
+        return conditions
+
+    def _search_hits(self, user: User, terms: Sequence[str]):
+        """
+        Subquery of (id, score) for ``user``'s tasks matching all ``terms``;
+        low scores first. Only the user's matches are ranked.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            vector = literal_column(f"({SEARCH_VECTOR})")
+            tsquery = func.to_tsquery(
+                literal_column("'simple'::regconfig"),
+                " & ".join(f"{term}:*" for term in terms),
+            )
+            return (
+                select(Task.id, (-func.ts_rank(vector, tsquery)).label("score"))
+                .where(Task.user_id == user.id, vector.op("@@")(tsquery))
+                .subquery("hits")
+            )
+        fts = literal_column(SEARCH_TABLE)
+        # user_id is matched as a token; the terms only search the text.
+        match = " ".join(f'"{term}"*' for term in terms)
+        match = f'user_id : "{user.id}" AND {{title description}} : ({match})'
+        return (
+            select(
+                search_table.c.rowid.label("id"),
+                func.bm25(fts, *SEARCH_WEIGHTS).label("score"),
+            )
+            .where(fts.match(match))
+            .subquery("hits")
+        )
+
+    def _tags_json(self):
+        """Correlated subquery yielding a task's tags as a JSON array."""
+        if self.session.bind.dialect.name == "postgresql":
+            tag_object = func.json_build_object("id", Tag.id, "name", Tag.name)
+            aggregate = func.coalesce(
+                func.json_agg(tag_object), literal_column("'[]'::json")
+            )
+        else:
+            tag_object = func.json_object("id", Tag.id, "name", Tag.name)
+            aggregate = func.json_group_array(tag_object)
+        subquery = (
+            select(aggregate)
+            .select_from(TaskTagLink)
+            .join(Tag, Tag.id == TaskTagLink.tag_id)
+            .where(TaskTagLink.task_id == Task.id)
+            .scalar_subquery()
+        )
+        return type_coerce(subquery, JSON)
 
     def _to_read(self, task: Task) -> TaskRead:
         return TaskRead(
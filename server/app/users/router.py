@@ -1,13 +1,12 @@
 from typing import Annotated
 
-import jwt
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, Response
 from fastapi.security import HTTPAuthorizationCredentials
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.config import get_settings
 from app.core.dependencies import DBSessionDep
-from app.core.limiter import limiter
-from app.core.security import bearer_scheme, revoke_token
+from app.core.revocation import revocation_store
+from app.core.security import CurrentUserDep, bearer_scheme, decode_token
 from app.models import TokenOut, UserLogin
 from app.users.service import UserService
 
@@ -19,9 +18,7 @@ async def get_service(db: DBSessionDep) -> UserService:
 
 
 @router.post("/register", response_model=TokenOut, status_code=201)
-@limiter.limit("10/minute")
 async def register(
-    request: Request,
     payload: UserLogin,
     service: UserService = Depends(get_service),
 ):
@@ -32,9 +29,7 @@ async def register(
 
 
 @router.post("/login", response_model=TokenOut)
-@limiter.limit("10/minute")
 async def login(
-    request: Request,
     payload: UserLogin,
     service: UserService = Depends(get_service),
 ):
@@ -46,22 +41,38 @@ async def login(
 
 @router.post("/logout", status_code=204, response_model=None)
 async def logout(
+    db: DBSessionDep,
     credentials: Annotated[
         HTTPAuthorizationCredentials | None, Depends(bearer_scheme)
     ] = None,
 ):
     """Invalidate the current access token."""
+    await _revoke(db, credentials)
+    return Response(status_code=204)
+
+
+@router.delete("/me", status_code=204, response_model=None)
+async def delete_account(
+    current_user: CurrentUserDep,
+    service: Annotated[UserService, Depends(get_service)],
+    credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(bearer_scheme)
+    ] = None,
+):
+    """Delete the current user together with all of their tasks and tags."""
+    await service.delete(current_user)
+    await _revoke(service.session, credentials)
+    return Response(status_code=204)
+
+
+async def _revoke(
+    db: AsyncSession, credentials: HTTPAuthorizationCredentials | None
+) -> None:
     if credentials:
         try:
-            settings = get_settings().auth
-            payload = jwt.decode(
-                credentials.credentials,
-                settings.jwt_secret_key,
-                algorithms=[settings.jwt_algorithm],
-            )
-            jti = payload.get("jti")
-            if jti:
-                revoke_token(jti)
+            payload = decode_token(credentials.credentials)
         except Exception:
-            pass
-    return Response(status_code=204)
+            return
+        jti, exp = payload.get("jti"), payload.get("exp")
+        if jti and exp:
+            await revocation_store.revoke(db, jti, exp)
@@ -1,9 +1,13 @@
 from fastapi import HTTPException, status
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import User
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.hashing import password_hasher
+from app.core.principals import principal_cache
+from app.core.security import create_access_token
 
 
 class UserService:
@@ -25,19 +29,58 @@ class UserService:
 
     async def authenticate(self, username: str, password: str) -> User:
         user = await self.get_by_username(username)
-        if not user or not verify_password(password, user.password_hash):
+        # End the transaction so no connection (or SQLite write lock) is held
+        # while the hash is computed.
+        await self.session.commit()
+        if not user or not await password_hasher.verify(password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
             )
+        if password_hasher.needs_rehash(user.password_hash):
+            await self._rehash(user, password)
         return user
 
+    async def delete(self, user: User) -> None:
+        """
+        Delete the user with all of their tasks, tags and task links.
+
+        A single DELETE; the database cascades it, so however many tasks the
+        user has, none of them are loaded.
+        """
+        connection = await self.session.connection()
+        await connection.execute(delete(User).where(User.id == user.id))
+        await self.session.commit()
+        principal_cache.invalidate(user.id)
+
+    async def _rehash(self, user: User, password: str) -> None:
+        """Store the password again under the current scheme and cost."""
+        password_hash = await password_hasher.hash(password)
+        connection = await self.session.connection()
+        await connection.execute(
+            update(User)
+            .where(User.id == user.id, User.password_hash == user.password_hash)
+            .values(password_hash=password_hash)
+        )
+        await self.session.commit()
+        principal_cache.invalidate(user.id)
+
     async def _create_user(self, username: str, password: str) -> User:
-        user = User(username=username, password_hash=hash_password(password))
-        self.session.add(user)
         await self.session.commit()
+        password_hash = await password_hasher.hash(password)
+        user = User(username=username, password_hash=password_hash)
+        self.session.add(user)
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Registered by a concurrent request while this one was hashing.
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Username already taken",
+            )
         await self.session.refresh(user)
         return user
 
     def issue_token(self, user: User) -> str:
-        return create_access_token({"sub": str(user.id)})
+        return create_access_token({"sub": str(user.id), "name": user.username})
@@ -0,0 +1 @@
+"""Ad-hoc performance benchmarks. Run modules with ``python -m benchmarks.<name>``."""
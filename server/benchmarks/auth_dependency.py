@@ -0,0 +1,58 @@
+"""Cost of the get_current_user dependency with and without the auth caches.
+
+python -m benchmarks.auth_dependency [--calls 20000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import insert
+
+from app.core import security
+from app.core.principals import PrincipalCache, TokenCache
+from app.core.security import create_access_token, get_current_user
+from app.models import User
+
+from benchmarks.harness import report, temporary_database
+
+
+async def measure(manager, credentials, calls: int) -> float:
+    """Return microseconds per get_current_user call."""
+    async with manager.session(read_only=True) as session:
+        await get_current_user(session, credentials)
+        started = time.perf_counter()
+        for _ in range(calls):
+            await get_current_user(session, credentials)
+        return (time.perf_counter() - started) / calls * 1e6
+
+
+async def main(calls: int) -> None:
+    token = create_access_token({"sub": "1", "name": "bench"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    configurations = {
+        "no caches (decode + SELECT)": (0, 0),
+        "principal cache only": (1024, 0),
+        "principal + token cache": (1024, 4096),
+    }
+
+    rows = {}
+    async with temporary_database() as manager:
+        async with manager.connect() as connection:
+            await connection.execute(
+                insert(User).values(id=1, username="bench", password_hash="-")
+            )
+        for label, (principal_size, token_size) in configurations.items():
+            security.principal_cache = PrincipalCache(max_size=principal_size)
+            security.token_cache = TokenCache(max_size=token_size)
+            rows[label] = f"{await measure(manager, credentials, calls):8.1f} us/call"
+
+    report(f"get_current_user, {calls} calls with one token", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,118 @@
+"""Polling an unchanged board with and without If-None-Match.
+
+Each poll fetches the task list and the tag list, the way the SPA refreshes.
+Reports response bytes, SQL statements and latency per poll.
+
+python -m benchmarks.conditional_polling [--tasks 5000] [--polls 200]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import time
+from collections.abc import Iterator
+
+from sqlalchemy import event, insert, update
+
+from app.config import get_settings
+from app.models import Tag, Task, User
+
+from benchmarks.harness import app_client, register, report, temporary_database
+
+LISTS = ("/api/v1/tasks/", "/api/v1/tags/")
+
+
+async def seed(manager, tasks: int) -> None:
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"task {i}",
+                    "description": "x" * 40,
+                    "position": float(i),
+                    "user_id": 1,
+                    "version": 1,
+                }
+                for i in range(tasks)
+            ],
+        )
+        await connection.execute(
+            insert(Tag), [{"name": f"tag{i}", "user_id": 1} for i in range(20)]
+        )
+        await connection.execute(update(User).values(version=1))
+
+
+@contextlib.contextmanager
+def counting_statements(manager) -> Iterator[list[int]]:
+    count = [0]
+
+    def _count(*_args) -> None:
+        count[0] += 1
+
+    engines = {manager.engine.sync_engine, manager.read_engine.sync_engine}
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield count
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _count)
+
+
+async def poll(client, manager, headers, polls: int, conditional: bool) -> dict:
+    etags = {}
+    for url in LISTS:
+        response = await client.get(url, headers=headers)
+        etags[url] = response.headers["ETag"]
+
+    received = 0
+    timings = []
+    with counting_statements(manager) as statements:
+        for _ in range(polls):
+            started = time.perf_counter()
+            for url in LISTS:
+                extra = {"If-None-Match": etags[url]} if conditional else {}
+                response = await client.get(url, headers={**headers, **extra})
+                assert response.status_code == (304 if conditional else 200)
+                received += len(response.content)
+            timings.append(time.perf_counter() - started)
+    return {
+        "bytes": received / polls,
+        "statements": statements[0] / polls,
+        "p50": statistics.median(timings) * 1e3,
+    }
+
+
+async def main(tasks: int, polls: int) -> None:
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        async with app_client(manager) as client:
+            headers = await register(client, "bench")
+            await seed(manager, tasks)
+            full = await poll(client, manager, headers, polls, conditional=False)
+            revalidated = await poll(client, manager, headers, polls, conditional=True)
+
+    def row(result: dict) -> str:
+        return (
+            f"{result['bytes'] / 1024:9.1f} KiB  {result['statements']:4.1f} statements"
+            f"  p50 {result['p50']:7.2f} ms"
+        )
+
+    report(
+        f"Polling an unchanged board ({tasks} tasks, {polls} polls of tasks + tags)",
+        {
+            "plain GET": row(full),
+            "If-None-Match (304)": row(revalidated),
+            "speedup (p50)": f"{full['p50'] / revalidated['p50']:.1f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=5_000)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.polls))
@@ -0,0 +1,74 @@
+"""Toggles/sec under many concurrent clients, with and without group commit.
+
+python -m benchmarks.group_commit [--clients 200] [--per-client 10]
+"""
+
+import argparse
+import asyncio
+
+from app.config import get_settings
+from app.core import group_commit
+
+from benchmarks.harness import (
+    app_client,
+    register,
+    report,
+    run_concurrently,
+    temporary_database,
+)
+
+USERS = 20
+
+
+async def measure(clients: int, per_client: int, grouped: bool) -> tuple[float, dict]:
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        committer = group_commit.GroupCommitter(manager)
+        group_commit.group_committer = committer
+        if grouped:
+            await committer.start()
+        try:
+            async with app_client(manager) as client:
+                users = [await register(client, f"bench{n}") for n in range(USERS)]
+                targets = []
+                for n in range(clients):
+                    headers = users[n % USERS]
+                    response = await client.post(
+                        "/api/v1/tasks/", json={"title": f"task {n}"}, headers=headers
+                    )
+                    targets.append((response.json()["id"], headers))
+
+                async def toggle(worker: int, _: int) -> None:
+                    task_id, headers = targets[worker]
+                    response = await client.patch(
+                        f"/api/v1/tasks/{task_id}/complete", headers=headers
+                    )
+                    response.raise_for_status()
+
+                rate = await run_concurrently(clients, per_client, toggle)
+        finally:
+            await committer.stop()
+        return rate, committer.stats.snapshot()
+
+
+async def main(clients: int, per_client: int) -> None:
+    direct, _ = await measure(clients, per_client, grouped=False)
+    grouped, stats = await measure(clients, per_client, grouped=True)
+    report(
+        f"PATCH /api/v1/tasks/{{id}}/complete ({clients} clients x {per_client})",
+        {
+            "commit per request": f"{direct:8.1f} toggles/s",
+            "group commit": f"{grouped:8.1f} toggles/s",
+            "batches": str(stats["batches"]),
+            "mean batch size": str(stats["mean_batch_size"]),
+            "largest batch": str(stats["largest_batch"]),
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--per-client", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.per_client))
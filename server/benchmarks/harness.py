@@ -0,0 +1,100 @@
+"""Shared helpers for driving the ASGI app against a throwaway database."""
+
+import asyncio
+import contextlib
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request
+from httpx import ASGITransport, AsyncClient
+
+from alembic import command, config
+from app.core.database import (
+    READ_ONLY_METHODS,
+    DatabaseSessionManager,
+    get_database_session,
+)
+from app.core.limiter import limiter
+from app.main import app
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def _upgrade(connection, cfg) -> None:
+    cfg.attributes["connection"] = connection
+    command.upgrade(cfg, "head")
+
+
+@contextlib.asynccontextmanager
+async def temporary_database(
+    **manager_kwargs: Any,
+) -> AsyncIterator[DatabaseSessionManager]:
+    """Yield a migrated DatabaseSessionManager backed by a file in a temp dir."""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{tmp}/bench.db"
+        manager = DatabaseSessionManager(url, **manager_kwargs)
+        async with manager.connect() as connection:
+            await connection.run_sync(_upgrade, config.Config(str(ALEMBIC_INI)))
+        await manager.engine.dispose()
+        try:
+            yield manager
+        finally:
+            await manager.close()
+
+
+@contextlib.asynccontextmanager
+async def app_client(manager: DatabaseSessionManager) -> AsyncIterator[AsyncClient]:
+    """Yield an HTTP client whose requests use sessions from ``manager``."""
+
+    async def override_get_db(request: Request):
+        read_only = request.method in READ_ONLY_METHODS
+        async with manager.session(read_only=read_only) as session:
+            yield session
+
+    app.dependency_overrides[get_database_session] = override_get_db
+    limiter.enabled = False
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            yield client
+    finally:
+        limiter.enabled = True
+        app.dependency_overrides.clear()
+
+
+async def register(client: AsyncClient, username: str) -> dict[str, str]:
+    """Register a user and return its Authorization header."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "password": "benchmark"},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+async def run_concurrently(
+    workers: int,
+    per_worker: int,
+    operation: Callable[[int, int], Awaitable[None]],
+) -> float:
+    """Run ``operation(worker, i)`` from ``workers`` tasks; return ops/second."""
+
+    async def worker(n: int) -> None:
+        for i in range(per_worker):
+            await operation(n, i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(workers)))
+    elapsed = time.perf_counter() - started
+    return workers * per_worker / elapsed
+
+
+def report(title: str, rows: Mapping[str, str]) -> None:
+    print(title)
+    width = max(len(label) for label in rows)
+    for label, value in rows.items():
+        print(f"  {label:<{width}}  {value}")
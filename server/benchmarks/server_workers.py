@@ -0,0 +1,127 @@
+"""Requests/second of GET /api/v1/tasks/ as the number of uvicorn workers grows.
+
+Each configuration runs ``python -m app.main`` as a real server on a fresh
+data directory, so this measures the whole stack including the HTTP parser
+and event loop. Rate limiting is disabled; throughput is bounded by the CPU
+count, so expect scaling to flatten beyond it.
+
+python -m benchmarks.server_workers [--workers 1 2 4] [--clients 32] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+
+from benchmarks.harness import report
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def running_server(workers: int, port: int) -> Iterator[str]:
+    """Run the production entry point with ``workers`` processes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "GRINDBOARD__APP__DATA_DIR": tmp,
+            "GRINDBOARD__APP__DATABASE_URL": f"sqlite+aiosqlite:///{tmp}/app.db",
+            "GRINDBOARD__APP__RATE_LIMIT_ENABLED": "false",
+            "GRINDBOARD__SERVER__PORT": str(port),
+            "GRINDBOARD__SERVER__WORKERS": str(workers),
+            "GRINDBOARD__AUTH__PASSWORD_HASH_BUDGET_MS": "0",
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "app.main"],
+            cwd=SERVER_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            process.send_signal(signal.SIGINT)
+            process.wait(timeout=60)
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/healthz")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("server did not become ready")
+        await asyncio.sleep(0.1)
+
+
+async def measure(base_url: str, clients: int, seconds: float) -> float:
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        await wait_ready(client)
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={"username": "bench", "password": "benchmark"},
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        for i in range(20):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"task {i}"}, headers=headers
+            )
+
+        completed = 0
+        deadline = time.perf_counter() + seconds
+
+        async def worker() -> None:
+            nonlocal completed
+            while time.perf_counter() < deadline:
+                (await client.get("/api/v1/tasks/", headers=headers)).raise_for_status()
+                completed += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        return completed / (time.perf_counter() - started)
+
+
+def main(workers: list[int], clients: int, seconds: float) -> None:
+    rows = {}
+    baseline = None
+    for count in workers:
+        with running_server(count, free_port()) as base_url:
+            rate = asyncio.run(measure(base_url, clients, seconds))
+        baseline = baseline or rate
+        rows[f"{count} worker(s)"] = f"{rate:8.0f} req/s  ({rate / baseline:.2f}x)"
+
+    report(
+        f"GET /api/v1/tasks/ throughput ({clients} clients, {os.cpu_count()} CPUs)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    main(args.workers, args.clients, args.seconds)
@@ -0,0 +1,133 @@
+"""Editing a task and its tags: one request per change vs POST /tasks/batch.
+
+Each edit updates a task and adds ``--tags`` tags to it, which is what saving
+TaskDialog sends. Reports edits/second and commits per edit. The requests run
+in-process, so the round trips a batch saves are not part of the timing; pass
+``--synchronous FULL`` to make every commit fsync.
+
+python -m benchmarks.task_batch [--workers 20] [--per-worker 20] [--tags 3]
+    [--synchronous NORMAL]
+"""
+
+import argparse
+import asyncio
+import contextlib
+from collections.abc import Iterator
+
+from sqlalchemy import event
+
+from app.config import get_settings
+
+from benchmarks.harness import (
+    app_client,
+    register,
+    report,
+    run_concurrently,
+    temporary_database,
+)
+
+
+@contextlib.contextmanager
+def counting_commits(manager) -> Iterator[list[int]]:
+    count = [0]
+
+    def _count(_connection) -> None:
+        count[0] += 1
+
+    event.listen(manager.engine.sync_engine, "commit", _count)
+    try:
+        yield count
+    finally:
+        event.remove(manager.engine.sync_engine, "commit", _count)
+
+
+async def measure(
+    pragmas: dict, workers: int, per_worker: int, tags: int, batched: bool
+) -> dict:
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        async with app_client(manager) as client:
+            headers, task_ids, tag_ids = [], [], []
+            for n in range(workers):
+                headers.append(await register(client, f"bench{n}"))
+                response = await client.post(
+                    "/api/v1/tasks/", json={"title": "task"}, headers=headers[n]
+                )
+                task_ids.append(response.json()["id"])
+                tag_ids.append(
+                    [
+                        (
+                            await client.post(
+                                f"/api/v1/tags/?name=tag{t}", headers=headers[n]
+                            )
+                        ).json()["id"]
+                        for t in range(tags * per_worker)
+                    ]
+                )
+
+            async def edit(worker: int, i: int) -> None:
+                task_id = task_ids[worker]
+                new_tags = tag_ids[worker][i * tags : (i + 1) * tags]
+                title = {"title": f"edit {i}"}
+                if batched:
+                    operations = [
+                        {"op": "update", "task_id": task_id, "changes": title},
+                        *(
+                            {"op": "add_tag", "task_id": task_id, "tag_id": tag_id}
+                            for tag_id in new_tags
+                        ),
+                    ]
+                    response = await client.post(
+                        "/api/v1/tasks/batch",
+                        json={"operations": operations},
+                        headers=headers[worker],
+                    )
+                    response.raise_for_status()
+                    return
+                response = await client.put(
+                    f"/api/v1/tasks/{task_id}", json=title, headers=headers[worker]
+                )
+                response.raise_for_status()
+                responses = await asyncio.gather(
+                    *(
+                        client.post(
+                            f"/api/v1/tasks/{task_id}/tags/{tag_id}",
+                            headers=headers[worker],
+                        )
+                        for tag_id in new_tags
+                    )
+                )
+                for response in responses:
+                    response.raise_for_status()
+
+            with counting_commits(manager) as commits:
+                rate = await run_concurrently(workers, per_worker, edit)
+    return {"rate": rate, "commits": commits[0] / (workers * per_worker)}
+
+
+async def main(workers: int, per_worker: int, tags: int, synchronous: str) -> None:
+    pragmas = {**get_settings().app.sqlite_pragmas, "synchronous": synchronous}
+    separate = await measure(pragmas, workers, per_worker, tags, batched=False)
+    batched = await measure(pragmas, workers, per_worker, tags, batched=True)
+
+    def row(result: dict) -> str:
+        return f"{result['rate']:8.1f} edits/s  {result['commits']:4.1f} commits/edit"
+
+    report(
+        f"Task edit with {tags} tag changes ({workers} clients x {per_worker} edits,"
+        f" synchronous={synchronous})",
+        {
+            f"{tags + 1} requests": row(separate),
+            "POST /tasks/batch": row(batched),
+            "speedup": f"{batched['rate'] / separate['rate']:8.2f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--per-worker", type=int, default=20)
+    parser.add_argument("--tags", type=int, default=3)
+    parser.add_argument("--synchronous", default="NORMAL", choices=["NORMAL", "FULL"])
+    args = parser.parse_args()
+    asyncio.run(main(args.workers, args.per_worker, args.tags, args.synchronous))
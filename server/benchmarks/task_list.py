@@ -0,0 +1,132 @@
+"""Latency and peak memory of listing a large board: ORM path vs Core fast path.
+
+python -m benchmarks.task_list [--tasks 20000] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import asc, select
+
+from app.config import get_settings
+from app.models import Tag, TagRead, Task, TaskRead, TaskTagLink, User
+from app.tasks.service import TaskService
+
+from benchmarks.harness import report, temporary_database
+
+TAGS = 10
+task_list_adapter = TypeAdapter(list[TaskRead])
+
+
+async def seed(manager, tasks: int) -> User:
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(User).values(id=1, username="bench", password_hash="-")
+        )
+        await connection.execute(
+            insert(Tag),
+            [{"id": i, "name": f"tag{i}", "user_id": 1} for i in range(1, TAGS + 1)],
+        )
+        await connection.execute(
+            insert(Task),
+            [
+                {
+                    "id": i,
+                    "title": f"task {i}",
+                    "description": "x" * 40,
+                    "position": float(i),
+                    "completed": i % 3 == 0,
+                    "user_id": 1,
+                }
+                for i in range(1, tasks + 1)
+            ],
+        )
+        await connection.execute(
+            insert(TaskTagLink),
+            [
+                {"task_id": i, "tag_id": tag}
+                for i in range(1, tasks + 1)
+                for tag in {i % TAGS + 1, i % 7 + 1}
+            ],
+        )
+    return User(id=1, username="bench", password_hash="-")
+
+
+async def orm_list(session, user: User) -> bytes:
+    """The previous implementation: ORM load + selectinload + TaskRead validation."""
+    stmt = (
+        select(Task)
+        .where(Task.user_id == user.id)
+        .order_by(asc(Task.position))
+        .options(selectinload(Task.tags))
+    )
+    tasks = (await session.scalars(stmt)).all()
+    payload = [
+        TaskRead(
+            id=t.id,
+            title=t.title,
+            description=t.description,
+            position=t.position,
+            completed=t.completed,
+            completed_at=t.completed_at,
+            deadline=t.deadline,
+            tags=[TagRead(id=tag.id, name=tag.name) for tag in t.tags],
+        )
+        for t in tasks
+    ]
+    return task_list_adapter.dump_json(task_list_adapter.validate_python(payload))
+
+
+async def core_list(session, user: User) -> bytes:
+    return to_json(await TaskService(session).list(user))
+
+
+async def profile(
+    manager, user: User, runs: int, fn: Callable[..., Awaitable[bytes]]
+) -> tuple[float, float]:
+    timings = []
+    for _ in range(runs):
+        async with manager.session(read_only=True) as session:
+            started = time.perf_counter()
+            await fn(session, user)
+            timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    async with manager.session(read_only=True) as session:
+        await fn(session, user)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings) * 1000, peak / 2**20
+
+
+async def main(tasks: int, runs: int) -> None:
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        user = await seed(manager, tasks)
+        orm_ms, orm_mb = await profile(manager, user, runs, orm_list)
+        core_ms, core_mb = await profile(manager, user, runs, core_list)
+
+    report(
+        f"GET /api/v1/tasks/ payload for {tasks} tasks (median of {runs})",
+        {
+            "ORM + TaskRead": f"{orm_ms:8.1f} ms  {orm_mb:7.1f} MiB peak",
+            "Core fast path": f"{core_ms:8.1f} ms  {core_mb:7.1f} MiB peak",
+            "speedup": f"{orm_ms / core_ms:8.2f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.runs))
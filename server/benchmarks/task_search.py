@@ -0,0 +1,125 @@
+"""Search latency over one user's tasks: full-text index vs a LIKE substring scan.
+
+Tasks are spread evenly over ``--users`` users and the first one searches,
+so other users' matches in the shared index are part of the measurement.
+
+python -m benchmarks.task_search [--tasks 100000] [--users 10] [--queries 200]
+    [--vocabulary 20000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import string
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import insert
+
+from app.config import get_settings
+from app.models import Task, TaskFilter, User
+from app.tasks.service import TaskService
+
+from benchmarks.harness import report, temporary_database
+
+PAGE = 50
+
+
+def vocabulary(rng: random.Random, size: int) -> list[str]:
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+        for _ in range(size)
+    ]
+
+
+async def seed(
+    manager, tasks: int, users: int, words: list[str], rng: random.Random
+) -> User:
+    def text(n: int) -> str:
+        return " ".join(rng.choices(words, k=n))
+
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(User),
+            [
+                {"id": n, "username": f"bench{n}", "password_hash": "-"}
+                for n in range(1, users + 1)
+            ],
+        )
+        await connection.execute(
+            insert(Task),
+            [
+                {
+                    "title": text(rng.randint(2, 6)),
+                    "description": text(rng.randint(5, 25)),
+                    "position": float(i),
+                    "user_id": i % users + 1,
+                }
+                for i in range(tasks)
+            ],
+        )
+    return User(id=1, username="bench", password_hash="-")
+
+
+async def full_text(service: TaskService, user: User, term: str) -> None:
+    await service.search(user, term, PAGE)
+
+
+async def like_scan(service: TaskService, user: User, term: str) -> None:
+    await service.page(user, PAGE, filters=TaskFilter(q=term))
+
+
+async def measure(
+    manager,
+    user: User,
+    terms: list[str],
+    search: Callable[[TaskService, User, str], Awaitable[None]],
+) -> list[float]:
+    timings = []
+    for term in terms:
+        async with manager.session(read_only=True) as session:
+            started = time.perf_counter()
+            await search(TaskService(session), user, term)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summary(timings: list[float]) -> str:
+    p50 = statistics.median(timings) * 1e3
+    p99 = statistics.quantiles(timings, n=100)[98] * 1e3
+    return f"p50 {p50:8.2f} ms  p99 {p99:8.2f} ms"
+
+
+async def main(tasks: int, users: int, queries: int, words: int) -> None:
+    rng = random.Random(0)
+    words = vocabulary(rng, words)
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        user = await seed(manager, tasks, users, words, rng)
+        terms = rng.sample(words, queries)
+        # Warm the page cache for both paths.
+        await measure(manager, user, terms[:20], full_text)
+        await measure(manager, user, terms[:20], like_scan)
+        indexed = await measure(manager, user, terms, full_text)
+        scanned = await measure(manager, user, terms, like_scan)
+
+    report(
+        f"Task search, first page of {PAGE}"
+        f" ({tasks} tasks over {users} users, {queries} queries)",
+        {
+            "LIKE '%term%' scan": summary(scanned),
+            "FTS5 MATCH, ranked": summary(indexed),
+            "speedup (p50)": f"{statistics.median(scanned) / statistics.median(indexed):.1f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.users, args.queries, args.vocabulary))
@@ -0,0 +1,103 @@
+"""Cost of refreshing a large board: full task list vs incremental sync.
+
+Each round changes a few tasks through the API, then refreshes both ways.
+
+python -m benchmarks.task_sync [--tasks 20000] [--changes 5] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import insert, update
+
+from app.config import get_settings
+from app.models import Task, User
+
+from benchmarks.harness import app_client, register, report, temporary_database
+
+
+async def seed(manager, tasks: int) -> None:
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(Task),
+            [
+                {
+                    "title": f"task {i}",
+                    "description": "x" * 40,
+                    "position": float(i),
+                    "user_id": 1,
+                    "version": 1,
+                }
+                for i in range(tasks)
+            ],
+        )
+        await connection.execute(update(User).values(version=1))
+
+
+async def timed_get(client, url: str, headers, **params) -> tuple[float, int, dict]:
+    started = time.perf_counter()
+    response = await client.get(url, params=params, headers=headers)
+    elapsed = time.perf_counter() - started
+    response.raise_for_status()
+    return elapsed, len(response.content), response.json()
+
+
+def summary(timings: list[float], sizes: list[int]) -> str:
+    p50 = statistics.median(timings) * 1e3
+    return f"p50 {p50:8.2f} ms  {statistics.mean(sizes) / 1024:9.1f} KiB/refresh"
+
+
+async def main(tasks: int, changes: int, rounds: int) -> None:
+    rng = random.Random(0)
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        async with app_client(manager) as client:
+            headers = await register(client, "bench")
+            await seed(manager, tasks)
+            ids = [
+                t["id"]
+                for t in (await client.get("/api/v1/tasks/", headers=headers)).json()
+            ]
+            *_, state = await timed_get(client, "/api/v1/sync", headers, since=0)
+            version = state["version"]
+
+            full, full_sizes, delta, delta_sizes = [], [], [], []
+            for round_ in range(rounds):
+                for task_id in rng.sample(ids, changes):
+                    response = await client.put(
+                        f"/api/v1/tasks/{task_id}",
+                        json={"title": f"edited {round_}"},
+                        headers=headers,
+                    )
+                    response.raise_for_status()
+                elapsed, size, _ = await timed_get(client, "/api/v1/tasks/", headers)
+                full.append(elapsed)
+                full_sizes.append(size)
+                elapsed, size, state = await timed_get(
+                    client, "/api/v1/sync", headers, since=version
+                )
+                assert len(state["tasks"]) <= changes
+                version = state["version"]
+                delta.append(elapsed)
+                delta_sizes.append(size)
+
+    report(
+        f"Board refresh ({tasks} tasks, {changes} changed per round, {rounds} rounds)",
+        {
+            "GET /tasks/ (whole board)": summary(full, full_sizes),
+            "GET /sync?since=<version>": summary(delta, delta_sizes),
+            "speedup (p50)": f"{statistics.median(full) / statistics.median(delta):.1f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--changes", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.changes, args.rounds))
@@ -0,0 +1,104 @@
+"""Creating a tagged task: POST plus one request per tag vs inline tag_ids.
+
+Reports tasks/second and SQL statements per task.
+
+python -m benchmarks.task_tags [--workers 20] [--per-worker 20] [--tags 5]
+"""
+
+import argparse
+import asyncio
+import contextlib
+from collections.abc import Iterator
+
+from sqlalchemy import event
+
+from app.config import get_settings
+
+from benchmarks.harness import (
+    app_client,
+    register,
+    report,
+    run_concurrently,
+    temporary_database,
+)
+
+
+@contextlib.contextmanager
+def counting_statements(manager) -> Iterator[list[int]]:
+    count = [0]
+
+    def _count(*_args) -> None:
+        count[0] += 1
+
+    event.listen(manager.engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        yield count
+    finally:
+        event.remove(manager.engine.sync_engine, "before_cursor_execute", _count)
+
+
+async def measure(workers: int, per_worker: int, tags: int, inline: bool) -> dict:
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        async with app_client(manager) as client:
+            headers, tag_ids = [], []
+            for n in range(workers):
+                headers.append(await register(client, f"bench{n}"))
+                tag_ids.append(
+                    [
+                        (
+                            await client.post(
+                                f"/api/v1/tags/?name=tag{t}", headers=headers[n]
+                            )
+                        ).json()["id"]
+                        for t in range(tags)
+                    ]
+                )
+
+            async def create(worker: int, i: int) -> None:
+                task = {"title": f"task {i}"}
+                if inline:
+                    task["tag_ids"] = tag_ids[worker]
+                response = await client.post(
+                    "/api/v1/tasks/", json=task, headers=headers[worker]
+                )
+                response.raise_for_status()
+                if inline:
+                    return
+                task_id = response.json()["id"]
+                for tag_id in tag_ids[worker]:
+                    response = await client.post(
+                        f"/api/v1/tasks/{task_id}/tags/{tag_id}",
+                        headers=headers[worker],
+                    )
+                    response.raise_for_status()
+
+            with counting_statements(manager) as statements:
+                rate = await run_concurrently(workers, per_worker, create)
+    return {"rate": rate, "statements": statements[0] / (workers * per_worker)}
+
+
+async def main(workers: int, per_worker: int, tags: int) -> None:
+    separate = await measure(workers, per_worker, tags, inline=False)
+    inline = await measure(workers, per_worker, tags, inline=True)
+
+    def row(result: dict) -> str:
+        return f"{result['rate']:8.1f} tasks/s  {result['statements']:5.1f} statements/task"
+
+    report(
+        f"Create a task with {tags} tags ({workers} clients x {per_worker} tasks)",
+        {
+            f"{tags + 1} requests": row(separate),
+            "tag_ids inline": row(inline),
+            "speedup": f"{inline['rate'] / separate['rate']:8.2f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--per-worker", type=int, default=20)
+    parser.add_argument("--tags", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.workers, args.per_worker, args.tags))
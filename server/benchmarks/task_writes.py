@@ -0,0 +1,61 @@
+"""Write throughput of POST /api/v1/tasks/ with and without the SQLite profile.
+
+python -m benchmarks.task_writes [--workers 50] [--per-worker 40]
+"""
+
+import argparse
+import asyncio
+
+from app.config import get_settings
+
+from benchmarks.harness import (
+    app_client,
+    register,
+    report,
+    run_concurrently,
+    temporary_database,
+)
+
+# SQLite's compiled-in defaults: rollback journal, FULL sync, ~2MB cache.
+BASELINE_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "foreign_keys": "OFF",
+}
+
+
+async def measure(pragmas: dict, workers: int, per_worker: int) -> float:
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        async with app_client(manager) as client:
+            headers = [await register(client, f"bench{n}") for n in range(workers)]
+
+            async def create(worker: int, i: int) -> None:
+                response = await client.post(
+                    "/api/v1/tasks/",
+                    json={"title": f"task {i}"},
+                    headers=headers[worker],
+                )
+                response.raise_for_status()
+
+            return await run_concurrently(workers, per_worker, create)
+
+
+async def main(workers: int, per_worker: int) -> None:
+    baseline = await measure(BASELINE_PRAGMAS, workers, per_worker)
+    tuned = await measure(get_settings().app.sqlite_pragmas, workers, per_worker)
+    report(
+        f"POST /api/v1/tasks/ ({workers} clients x {per_worker} requests)",
+        {
+            "default journal": f"{baseline:8.1f} req/s",
+            "performance profile": f"{tuned:8.1f} req/s",
+            "speedup": f"{tuned / baseline:8.2f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--per-worker", type=int, default=40)
+    args = parser.parse_args()
+    asyncio.run(main(args.workers, args.per_worker))
@@ -0,0 +1,122 @@
+"""Latency of move_task: one await per statement vs a single run_sync unit of work.
+
+python -m benchmarks.unit_of_work [--tasks 200] [--moves 2000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import asc, select
+
+from app.config import get_settings
+from app.models import Task, User
+from app.tasks.service import TaskService
+
+from benchmarks.harness import report, temporary_database
+
+
+async def seed(manager, tasks: int) -> User:
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(User).values(id=1, username="bench", password_hash="-")
+        )
+        await connection.execute(
+            insert(Task),
+            [
+                {"id": i, "title": f"task {i}", "position": float(i), "user_id": 1}
+                for i in range(1, tasks + 1)
+            ],
+        )
+    return User(id=1, username="bench", password_hash="-")
+
+
+async def per_statement_move(session, task_id: int, user: User, after_id: int) -> None:
+    """The previous implementation: every query awaited from the event loop."""
+
+    async def neighbor(task_filter):
+        stmt = (
+            select(Task)
+            .where(Task.user_id == user.id, Task.id != task_id, task_filter)
+            .order_by(asc(Task.position))
+            .limit(1)
+        )
+        return (await session.scalars(stmt)).first()
+
+    stmt = (
+        select(Task)
+        .where(Task.id == task_id, Task.user_id == user.id)
+        .options(selectinload(Task.tags))
+    )
+    task = (await session.scalars(stmt)).first()
+    after_task = await neighbor(Task.id == after_id)
+    next_task = await neighbor(Task.position > after_task.position)
+    task.position = (
+        (after_task.position + next_task.position) / 2
+        if next_task
+        else after_task.position + 1.0
+    )
+    session.add(task)
+    await session.commit()
+    await session.refresh(task, attribute_names=["tags"])
+
+
+async def unit_of_work_move(session, task_id: int, user: User, after_id: int) -> None:
+    await TaskService(session).move_task(task_id, user, after_id)
+
+
+async def measure(
+    manager,
+    user: User,
+    tasks: int,
+    moves: int,
+    move: Callable[..., Awaitable[None]],
+) -> list[float]:
+    rng = random.Random(0)
+    timings = []
+    for _ in range(moves):
+        task_id, after_id = rng.sample(range(1, tasks + 1), 2)
+        async with manager.session() as session:
+            started = time.perf_counter()
+            await move(session, task_id, user, after_id)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summary(timings: list[float]) -> str:
+    p50 = statistics.median(timings) * 1e6
+    p99 = statistics.quantiles(timings, n=100)[98] * 1e6
+    return f"p50 {p50:7.0f} us  p99 {p99:7.0f} us"
+
+
+async def main(tasks: int, moves: int) -> None:
+    pragmas = get_settings().app.sqlite_pragmas
+    async with temporary_database(sqlite_pragmas=pragmas) as manager:
+        user = await seed(manager, tasks)
+        # Warm up the pools and statement caches for both paths.
+        await measure(manager, user, tasks, 100, per_statement_move)
+        await measure(manager, user, tasks, 100, unit_of_work_move)
+        awaited = await measure(manager, user, tasks, moves, per_statement_move)
+        batched = await measure(manager, user, tasks, moves, unit_of_work_move)
+
+    report(
+        f"POST /api/v1/tasks/{{id}}/move service latency ({moves} moves)",
+        {
+            "await per statement": summary(awaited),
+            "unit of work": summary(batched),
+            "speedup (p50)": f"{statistics.median(awaited) / statistics.median(batched):.2f}x",
+        },
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.moves))
@@ -1,11 +1,16 @@
 """Test configuration with in-memory database and transaction rollback."""
 
 import asyncio
+import contextlib
+import os
+from collections.abc import AsyncIterator
 from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from fastapi import Request
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -15,10 +20,23 @@ from sqlalchemy.ext.asyncio import (
 
 from alembic import command
 from alembic.config import Config
-from app.core.database import get_database_session
+from app.config import get_settings
+from app.core.database import (
+    READ_ONLY_METHODS,
+    DatabaseSessionManager,
+    apply_sqlite_pragmas,
+    get_database_session,
+)
 from app.core.limiter import limiter
+from app.core.migrations import migrate
+from app.core.principals import principal_cache, token_cache
 from app.main import app
 
+# Point at a throwaway PostgreSQL database to run the suite against asyncpg, e.g.
+# GRINDBOARD_TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/grindboard_test
+TEST_DATABASE_URL = os.environ.get(
+    "GRINDBOARD_TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:"
+)
 
 # ============================================================================
 # Event Loop Setup
@@ -32,6 +50,16 @@ def disable_rate_limiter():
     limiter.enabled = True
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    # Rolled-back tests reuse user ids, so cached users must not leak across.
+    principal_cache.clear()
+    token_cache.clear()
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create event loop for async tests."""
@@ -48,30 +76,46 @@ def event_loop():
 @pytest_asyncio.fixture(scope="session")
 async def engine() -> AsyncGenerator[AsyncEngine, None]:
     """
-    Create in-memory SQLite database and run migrations once.
+    Create the test database and run migrations once.
     This is shared across all tests in the session.
     """
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         echo=False,
         future=True,
     )
+    is_sqlite = engine.dialect.name == "sqlite"
+    if is_sqlite:
+        apply_sqlite_pragmas(engine, get_settings().app.sqlite_pragmas)
 
     # Run migrations once for the entire test session
     async with engine.begin() as conn:
         await conn.run_sync(_run_migrations)
 
+    if is_sqlite:
+        # Migrations disable foreign key enforcement on the shared in-memory connection
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
     yield engine
 
+    if not is_sqlite:
+        # Leave the external database empty, which also exercises every downgrade
+        async with engine.begin() as conn:
+            await conn.run_sync(_run_migrations, "base")
+
     await engine.dispose()
 
 
-def _run_migrations(connection):
+def _run_migrations(connection, revision: str = "head"):
     """Run alembic migrations synchronously."""
     from pathlib import Path
     cfg = Config(str(Path(__file__).parent.parent / "alembic.ini"))
     cfg.attributes["connection"] = connection
-    command.upgrade(cfg, "head")
+    if revision == "base":
+        command.downgrade(cfg, revision)
+    else:
+        command.upgrade(cfg, revision)
 
 
 @pytest_asyncio.fixture
@@ -98,11 +142,37 @@ async def db(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
             await transaction.rollback()
 
 
+@pytest.fixture
+def statements(engine: AsyncEngine):
+    """Record every SQL statement sent to the test database."""
+    executed: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
 # ============================================================================
 # HTTP Client Setup
 # ============================================================================
 
 
+@contextlib.asynccontextmanager
+async def _app_client(override_get_db) -> AsyncIterator[AsyncClient]:
+    """HTTP client for the app with its database dependency overridden."""
+    app.dependency_overrides[get_database_session] = override_get_db
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
 @pytest_asyncio.fixture
 async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
@@ -113,14 +183,37 @@ async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_db():
         yield db
 
-    app.dependency_overrides[get_database_session] = override_get_db
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
+    async with _app_client(override_get_db) as client:
         yield client
 
-    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture
+async def file_client(tmp_path) -> AsyncIterator[AsyncClient]:
+    """
+    Provide an HTTP client backed by a migrated SQLite file.
+
+    Each request gets its own session from real connection pools, so requests
+    can overlap; nothing is rolled back, the file is thrown away instead.
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path}/app.db"
+    await migrate(url)
+    manager = DatabaseSessionManager(url)
+
+    async def override_get_db(request: Request):
+        async with manager.session(request.method in READ_ONLY_METHODS) as session:
+            yield session
+
+    try:
+        async with _app_client(override_get_db) as client:
+            yield client
+    finally:
+        await manager.close()
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve /metrics, which is hidden by default."""
+    monkeypatch.setattr(get_settings().app, "metrics_enabled", True)
 
 
 # ============================================================================
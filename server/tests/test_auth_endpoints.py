@@ -1,5 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Tag, Task, TaskTagLink
 
 
 class TestHealthcheck:
@@ -95,6 +99,47 @@ class TestLogin:
         assert r1.status_code == 200
 
 
+class TestDeleteAccount:
+    """Tests for DELETE /auth/me endpoint."""
+
+    async def test_deletes_large_account_without_loading_rows(
+        self, client: AsyncClient, db: AsyncSession, auth_headers, statements
+    ):
+        """Tasks, tags and links should go through database cascades."""
+        tag = await client.post("/api/v1/tags/?name=bulk", headers=auth_headers)
+        task = await client.post(
+            "/api/v1/tasks/", json={"title": "seed"}, headers=auth_headers
+        )
+        user_id = await db.scalar(
+            select(Task.user_id).where(Task.id == task.json()["id"])
+        )
+        tag_id = tag.json()["id"]
+        await db.execute(
+            insert(Task),
+            [
+                {"title": f"task {i}", "position": float(i), "user_id": user_id}
+                for i in range(100_000)
+            ],
+        )
+        await db.execute(
+            insert(TaskTagLink).from_select(
+                ["task_id", "tag_id"],
+                select(Task.id, tag_id).where(Task.user_id == user_id),
+            )
+        )
+        statements.clear()
+
+        response = await client.delete("/api/v1/auth/me", headers=auth_headers)
+
+        assert response.status_code == 204
+        assert not any(s.lstrip().startswith("SELECT tasks") for s in statements)
+        for model in (Task, Tag, TaskTagLink):
+            assert await db.scalar(select(func.count()).select_from(model)) == 0
+
+        after = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert after.status_code == 401
+
+
 class TestLoginValidation:
     """Tests for login/register input validation."""
 
@@ -0,0 +1,59 @@
+import os
+import stat
+
+from app.config import (
+    JWT_SECRET_FILE,
+    AppConfig,
+    AuthConfig,
+    ServerConfig,
+    Settings,
+    load_or_create_secret,
+)
+
+
+def _settings(data_dir, secret: str = "") -> Settings:
+    return Settings(
+        app=AppConfig(data_dir=data_dir), auth=AuthConfig(jwt_secret_key=secret)
+    )
+
+
+class TestJwtSecret:
+    """A generated JWT secret must be shared by every worker and restart."""
+
+    def test_generated_secret_is_persisted_and_reused(self, tmp_path):
+        first = _settings(tmp_path).auth.jwt_secret_key
+        second = _settings(tmp_path).auth.jwt_secret_key
+
+        assert first
+        assert first == second
+        path = tmp_path / JWT_SECRET_FILE
+        assert path.read_text() == first
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_configured_secret_is_not_persisted(self, tmp_path):
+        assert _settings(tmp_path, "configured").auth.jwt_secret_key == "configured"
+        assert not (tmp_path / JWT_SECRET_FILE).exists()
+
+    def test_existing_file_wins_over_a_new_candidate(self, tmp_path):
+        path = tmp_path / JWT_SECRET_FILE
+        path.write_text("from-another-worker\n")
+
+        assert load_or_create_secret(path) == "from-another-worker"
+        assert os.listdir(tmp_path) == [JWT_SECRET_FILE]
+
+
+class TestServerConfig:
+    """Tests for the uvicorn options derived from ServerConfig."""
+
+    def test_uvicorn_kwargs(self):
+        kwargs = ServerConfig(
+            workers=4, loop="uvloop", http="httptools", limit_concurrency=512
+        ).uvicorn_kwargs
+
+        assert kwargs["workers"] == 4
+        assert kwargs["loop"] == "uvloop"
+        assert kwargs["http"] == "httptools"
+        assert kwargs["limit_concurrency"] == 512
+        assert kwargs["timeout_graceful_shutdown"] == 30
+        # X-Forwarded-For is resolved by the rate limiter, not uvicorn.
+        assert kwargs["proxy_headers"] is False
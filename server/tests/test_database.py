@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    """File-backed manager with split read/write pools and a small schema."""
+    manager = DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/test.db",
+        engine_kwargs=get_settings().app.engine_kwargs,
+        sqlite_pragmas=get_settings().app.sqlite_pragmas,
+    )
+    async with manager.connect() as connection:
+        await connection.execute(
+            text("CREATE TABLE counters (id INTEGER PRIMARY KEY, value INTEGER)")
+        )
+        await connection.execute(text("INSERT INTO counters VALUES (1, 0)"))
+    yield manager
+    await manager.close()
+
+
+class TestSessionManager:
+    """Tests for the SQLite read/write split in DatabaseSessionManager."""
+
+    async def test_applies_performance_profile(self, manager: DatabaseSessionManager):
+        async with manager.session(read_only=True) as session:
+            journal_mode = await session.scalar(text("PRAGMA journal_mode"))
+            foreign_keys = await session.scalar(text("PRAGMA foreign_keys"))
+
+        assert journal_mode == "wal"
+        assert foreign_keys == 1
+
+    async def test_read_session_rejects_writes(self, manager: DatabaseSessionManager):
+        async with manager.session(read_only=True) as session:
+            with pytest.raises(OperationalError):
+                await session.execute(text("UPDATE counters SET value = 1"))
+
+    async def test_concurrent_writers_do_not_collide(
+        self, manager: DatabaseSessionManager
+    ):
+        """Read-modify-write from many sessions must not lose updates or lock."""
+
+        async def increment() -> None:
+            async with manager.session() as session:
+                value = await session.scalar(text("SELECT value FROM counters"))
+                await asyncio.sleep(0)
+                await session.execute(
+                    text("UPDATE counters SET value = :value"), {"value": value + 1}
+                )
+                await session.commit()
+
+        await asyncio.gather(*(increment() for _ in range(50)))
+
+        async with manager.session(read_only=True) as session:
+            assert await session.scalar(text("SELECT value FROM counters")) == 50
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager
+from app.core.group_commit import GroupCommitter
+
+
+@pytest.fixture
+async def committer(tmp_path):
+    manager = DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/test.db",
+        sqlite_pragmas=get_settings().app.sqlite_pragmas,
+    )
+    async with manager.connect() as connection:
+        await connection.execute(text("CREATE TABLE items (name TEXT UNIQUE)"))
+
+    committer = GroupCommitter(manager, window=0.01)
+    await committer.start()
+    yield committer
+    await committer.stop()
+    await manager.close()
+
+
+def insert(name: str):
+    async def operation(session) -> str:
+        await session.execute(text("INSERT INTO items VALUES (:name)"), {"name": name})
+        await session.commit()
+        return name
+
+    return operation
+
+
+async def count_items(committer: GroupCommitter) -> int:
+    async def operation(session) -> int:
+        return await session.scalar(text("SELECT count(*) FROM items"))
+
+    return await committer.submit(operation)
+
+
+class TestGroupCommitter:
+    """Tests for batching concurrent writes into shared transactions."""
+
+    async def test_concurrent_writes_share_batches(self, committer: GroupCommitter):
+        names = [f"item{i}" for i in range(20)]
+
+        results = await asyncio.gather(*(committer.submit(insert(n)) for n in names))
+
+        assert results == names
+        assert await count_items(committer) == 20
+        assert committer.stats.largest_batch > 1
+        assert committer.stats.batches < committer.stats.operations
+
+    async def test_failure_is_reported_only_to_its_caller(
+        self, committer: GroupCommitter
+    ):
+        await committer.submit(insert("taken"))
+
+        results = await asyncio.gather(
+            committer.submit(insert("a")),
+            committer.submit(insert("taken")),
+            committer.submit(insert("b")),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "a" and results[2] == "b"
+        assert isinstance(results[1], Exception)
+        assert committer.stats.failed_operations == 1
+        assert await count_items(committer) == 3
+
+    async def test_http_error_is_reported_only_to_its_caller(
+        self, committer: GroupCommitter
+    ):
+        async def not_found(session) -> None:
+            await session.execute(text("INSERT INTO items VALUES ('rolled back')"))
+            raise HTTPException(status_code=404)
+
+        results = await asyncio.gather(
+            committer.submit(insert("a")),
+            committer.submit(not_found),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "a"
+        assert isinstance(results[1], HTTPException)
+        assert await count_items(committer) == 1
+
+    async def test_unexpected_error_fails_the_whole_batch(
+        self, committer: GroupCommitter
+    ):
+        async def broken(session) -> None:
+            raise RuntimeError("bug")
+
+        results = await asyncio.gather(
+            committer.submit(insert("a")),
+            committer.submit(broken),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # The worker survives and the batch left nothing behind.
+        assert committer.running
+        assert await count_items(committer) == 0
+
+    async def test_stats_are_exposed_in_metrics(
+        self, client: AsyncClient, metrics_enabled: None
+    ):
+        metrics = (await client.get("/metrics")).json()
+
+        assert set(metrics["group_commit"]) >= {"batches", "failed_operations"}
+
+    async def test_metrics_are_hidden_unless_enabled(self, client: AsyncClient):
+        response = await client.get("/metrics")
+
+        assert response.status_code == 404
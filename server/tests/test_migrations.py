@@ -0,0 +1,166 @@
+import asyncio
+import sys
+import textwrap
+from pathlib import Path
+
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.migrations import (
+    ALEMBIC_INI,
+    SCHEMA_HEAD,
+    current_revision,
+    include_name,
+    migrate,
+)
+from tests.conftest import _run_migrations
+
+# Wall-clock budget for the schema check on a restart against a current database.
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def _schema_diff(connection) -> list:
+    context = MigrationContext.configure(
+        connection, opts={"include_name": include_name}
+    )
+    return compare_metadata(context, SQLModel.metadata)
+
+
+class TestMigrations:
+    """Migrations must produce the schema the models describe, on every backend."""
+
+    async def test_head_matches_models(self, engine: AsyncEngine):
+        async with engine.connect() as connection:
+            assert await connection.run_sync(_schema_diff) == []
+
+    async def test_downgrade_and_upgrade_roundtrip(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/roundtrip.db")
+        try:
+            for revision in ("head", "base", "head"):
+                async with engine.begin() as connection:
+                    await connection.run_sync(_run_migrations, revision)
+
+            async with engine.connect() as connection:
+                assert await connection.run_sync(_schema_diff) == []
+        finally:
+            await engine.dispose()
+
+    async def test_cascade_migration_removes_orphans(self, tmp_path):
+        """Rows left behind while SQLite ran without foreign keys are cleaned up."""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/orphans.db")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(_run_migrations, "7f6b5d4c3a21")
+                await connection.execute(
+                    text(
+                        "INSERT INTO users (id, username, password_hash)"
+                        " VALUES (1, 'kept', '-')"
+                    )
+                )
+                await connection.execute(
+                    text(
+                        "INSERT INTO tasks (id, title, description, position,"
+                        " completed, user_id) VALUES"
+                        " (1, 'kept', '', 1, 0, 1), (2, 'orphan', '', 1, 0, 99)"
+                    )
+                )
+                await connection.execute(
+                    text("INSERT INTO tags (id, name, user_id) VALUES (1, 'kept', 1)")
+                )
+                await connection.execute(
+                    text("INSERT INTO task_tags VALUES (1, 1), (2, 1), (1, 42)")
+                )
+
+            async with engine.begin() as connection:
+                await connection.run_sync(_run_migrations, "head")
+                tasks = await connection.scalar(text("SELECT count(*) FROM tasks"))
+                links = (
+                    await connection.execute(
+                        text("SELECT task_id, tag_id FROM task_tags")
+                    )
+                ).all()
+
+            assert tasks == 1
+            assert links == [(1, 1)]
+        finally:
+            await engine.dispose()
+
+
+class TestStartupMigration:
+    """Tests for the startup schema check and the migrate command."""
+
+    def test_schema_head_matches_scripts(self):
+        """SCHEMA_HEAD must be bumped with every new revision."""
+        script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+        assert script.get_current_head() == SCHEMA_HEAD
+
+    async def test_skips_upgrade_when_current(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path}/app.db"
+
+        assert await migrate(url) == "upgraded"
+        assert await migrate(url) == "current"
+
+    async def test_create_all_stamps_empty_database(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path}/app.db"
+
+        assert await migrate(url, create_all=True) == "created"
+
+        engine = create_async_engine(url)
+        try:
+            async with engine.connect() as connection:
+                assert await connection.run_sync(current_revision) == SCHEMA_HEAD
+                assert await connection.run_sync(_schema_diff) == []
+                # Search objects come from DDL hooks rather than table metadata.
+                await connection.execute(
+                    text(
+                        "INSERT INTO users (id, username, password_hash)"
+                        " VALUES (1, 'u', '-')"
+                    )
+                )
+                await connection.execute(
+                    text(
+                        "INSERT INTO tasks (title, description, position, completed,"
+                        " user_id) VALUES ('Indexed title', '', 1, 0, 1)"
+                    )
+                )
+                matches = await connection.execute(
+                    text("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'indexed'")
+                )
+                assert matches.all() == [(1,)]
+        finally:
+            await engine.dispose()
+
+    async def test_restart_stays_within_budget(self, tmp_path):
+        """A restart against a current schema must not load Alembic at all."""
+        url = f"sqlite+aiosqlite:///{tmp_path}/app.db"
+        await migrate(url)
+
+        script = textwrap.dedent(
+            f"""
+            import asyncio, sys, time
+            from app.core.migrations import migrate
+            start = time.perf_counter()
+            result = asyncio.run(migrate({url!r}))
+            print(result, time.perf_counter() - start, "alembic" in sys.modules)
+            """
+        )
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            script,
+            cwd=Path(__file__).parent.parent,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await process.communicate()
+        assert process.returncode == 0
+        output = stdout.decode().split()
+
+        result, elapsed, loaded_alembic = output[0], float(output[1]), output[2]
+        assert result == "current"
+        assert loaded_alembic == "False"
+        assert elapsed < STARTUP_BUDGET_SECONDS
@@ -0,0 +1,145 @@
+import asyncio
+import statistics
+import time
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.hashing import PasswordHasher
+from app.core.security import (
+    PASSWORD_ITERATIONS,
+    SCRYPT_HASH_SCHEME,
+    calibrate_cost,
+    hash_cost,
+    hash_password,
+    verify_password,
+)
+from app.models import User
+
+STORM_LOGINS = 24
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    hasher = PasswordHasher(workers=2, max_pending=STORM_LOGINS)
+    monkeypatch.setattr("app.users.service.password_hasher", hasher)
+    yield hasher
+    hasher.shutdown()
+
+
+def _hash_time(samples: int = 5) -> float:
+    """Median time of one hash; a single cold timing is too noisy to compare."""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hash_password("password123")
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def _latencies(
+    client: AsyncClient, headers, until: asyncio.Future
+) -> list[float]:
+    timings = []
+    while not until.done() or len(timings) < 20:
+        started = time.perf_counter()
+        response = await client.get("/api/v1/tasks/", headers=headers)
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200
+    return timings
+
+
+class TestPasswordHasher:
+    """Password hashing must not stall the event loop for other requests."""
+
+    async def test_task_list_latency_stays_flat_during_login_storm(
+        self, file_client: AsyncClient, hasher: PasswordHasher
+    ):
+        credentials = {"username": "stormy", "password": "password123"}
+        registered = await file_client.post("/api/v1/auth/register", json=credentials)
+        headers = {"Authorization": f"Bearer {registered.json()['token']}"}
+
+        one_hash = _hash_time()
+
+        storm = asyncio.gather(
+            *(
+                file_client.post("/api/v1/auth/login", json=credentials)
+                for _ in range(STORM_LOGINS)
+            )
+        )
+        timings = await _latencies(file_client, headers, storm)
+        responses = await storm
+
+        assert all(r.status_code == 200 for r in responses)
+        p99 = statistics.quantiles(timings, n=100)[98]
+        # Hashing on the loop makes requests wait behind several whole hashes;
+        # the margin absorbs CPU contention from the hashing threads.
+        assert p99 < 2 * one_hash
+
+    async def test_rejects_logins_beyond_queue_with_503(self):
+        hasher = PasswordHasher(workers=1, max_pending=1)
+        stored = hash_password("password123")
+        try:
+            results = await asyncio.gather(
+                *(hasher.verify("password123", stored) for _ in range(5)),
+                return_exceptions=True,
+            )
+        finally:
+            hasher.shutdown()
+
+        assert results[:2] == [True, True]
+        assert all(
+            isinstance(r, HTTPException) and r.status_code == 503 for r in results[2:]
+        )
+        assert hasher.in_flight == 0
+
+
+class TestPasswordCost:
+    """Tests for hash cost calibration, scrypt and rehash on login."""
+
+    def test_calibration_never_goes_below_minimum(self):
+        assert calibrate_cost("pbkdf2_sha256", budget_ms=0.001) == PASSWORD_ITERATIONS
+
+    def test_calibration_scales_to_budget(self):
+        cost = calibrate_cost("pbkdf2_sha256", budget_ms=50, minimum=1_000)
+
+        assert cost > 1_000
+        assert cost % 10_000 == 0
+
+    def test_scrypt_roundtrip(self):
+        hashed = hash_password("password123", scheme=SCRYPT_HASH_SCHEME)
+
+        assert hash_cost(hashed) == (SCRYPT_HASH_SCHEME, 2**14)
+        assert verify_password("password123", hashed)
+        assert not verify_password("wrong", hashed)
+
+    def test_small_cost_increase_does_not_rehash(self):
+        """Recalibrating a little higher keeps existing hashes."""
+        hashed = hash_password("password123", "pbkdf2_sha256", 100_000)
+        assert not PasswordHasher(cost=110_000).needs_rehash(hashed)
+        assert PasswordHasher(cost=200_000).needs_rehash(hashed)
+
+    async def test_login_upgrades_outdated_hash(
+        self, client: AsyncClient, db: AsyncSession, monkeypatch
+    ):
+        """A hash below the current cost or scheme is replaced on login."""
+        credentials = {"username": "upgrader", "password": "password123"}
+        old = PasswordHasher(cost=1_000)
+        monkeypatch.setattr("app.users.service.password_hasher", old)
+        await client.post("/api/v1/auth/register", json=credentials)
+
+        new = PasswordHasher(scheme=SCRYPT_HASH_SCHEME)
+        monkeypatch.setattr("app.users.service.password_hasher", new)
+        response = await client.post("/api/v1/auth/login", json=credentials)
+
+        assert response.status_code == 200
+        stored = await db.scalar(
+            select(User.password_hash).where(User.username == "upgrader")
+        )
+        assert hash_cost(stored) == (SCRYPT_HASH_SCHEME, 2**14)
+        assert not new.needs_rehash(stored)
+        old.shutdown()
+        new.shutdown()
@@ -0,0 +1,120 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+from app.core.principals import (
+    PrincipalCache,
+    TokenCache,
+    principal_cache,
+    token_cache,
+)
+from app.core.security import create_access_token, decode_token
+from app.models import User
+
+
+def _user_lookups(statements: list[str]) -> int:
+    # Loads of the whole row; list endpoints also read users.version alone.
+    return sum("users.password_hash" in s for s in statements)
+
+
+class TestPrincipalCache:
+    """Tests for the LRU/TTL cache behind get_current_user."""
+
+    def test_evicts_least_recently_used(self):
+        cache = PrincipalCache(max_size=2)
+        for user_id in (1, 2):
+            cache.put(User(id=user_id, username=f"u{user_id}", password_hash="-"))
+        cache.get(1)
+        cache.put(User(id=3, username="u3", password_hash="-"))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire(self, monkeypatch):
+        cache = PrincipalCache(ttl=10)
+        cache.put(User(id=1, username="u1", password_hash="-"))
+        later = time.monotonic() + 11
+        monkeypatch.setattr("app.core.principals.time.monotonic", lambda: later)
+
+        assert cache.get(1) is None
+        assert cache.stats.misses == 1
+        assert len(cache) == 0
+
+    async def test_requests_reuse_cached_user(
+        self, client: AsyncClient, auth_headers: dict[str, str], statements
+    ):
+        """Only the first authenticated request should look the user up."""
+        for _ in range(3):
+            response = await client.get("/api/v1/tasks/", headers=auth_headers)
+            assert response.status_code == 200
+
+        assert _user_lookups(statements) == 1
+        assert principal_cache.stats.hits >= 2
+
+    async def test_stateless_mode_skips_database(
+        self, client: AsyncClient, auth_headers: dict[str, str], statements, monkeypatch
+    ):
+        monkeypatch.setattr(get_settings().auth, "stateless_principals", True)
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert _user_lookups(statements) == 0
+        assert len(principal_cache) == 0
+
+    @pytest.mark.parametrize("stateless", [False, True])
+    async def test_tokens_outliving_their_account_are_refused(
+        self, client: AsyncClient, auth_headers: dict[str, str], monkeypatch, stateless
+    ):
+        """Both modes answer 401, not a failed lookup of the missing user."""
+        monkeypatch.setattr(get_settings().auth, "stateless_principals", stateless)
+        login = await client.post(
+            "/api/v1/auth/login",
+            json={"username": "testuser", "password": "password123"},
+        )
+        old = {"Authorization": f"Bearer {login.json()['token']}"}
+        # Cached as another worker would still have it.
+        assert (await client.get("/api/v1/tasks/", headers=old)).status_code == 200
+
+        await client.delete("/api/v1/auth/me", headers=auth_headers)
+
+        for response in [
+            await client.get("/api/v1/tasks/", headers=old),
+            await client.post("/api/v1/tasks/", json={"title": "x"}, headers=old),
+            await client.get("/api/v1/sync", headers=old),
+        ]:
+            assert response.status_code == 401
+
+
+class TestTokenCache:
+    """Tests for reusing verified JWT claims."""
+
+    def test_second_decode_is_a_hit(self):
+        token = create_access_token({"sub": "1"})
+        hits, misses = token_cache.stats.hits, token_cache.stats.misses
+
+        assert decode_token(token) == decode_token(token)
+        assert token_cache.stats.hits == hits + 1
+        assert token_cache.stats.misses == misses + 1
+
+    def test_expired_entries_are_not_served(self):
+        cache = TokenCache()
+        cache.put("token", {"sub": "1", "exp": time.time() - 1})
+
+        assert cache.get("token") is None
+
+    async def test_revocation_applies_to_cached_tokens(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        assert (
+            await client.get("/api/v1/tasks/", headers=auth_headers)
+        ).status_code == 200
+        await client.post("/api/v1/auth/logout", headers=auth_headers)
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 401
+        assert token_cache.stats.hits >= 2
@@ -0,0 +1,103 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.limiter import MemoryStorage, RateLimiter, Rule, SQLiteStorage, limiter
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    """Enable small limits on the app's limiter for one test."""
+    monkeypatch.setattr(limiter, "enabled", True)
+    monkeypatch.setattr(limiter, "storage", MemoryStorage())
+    monkeypatch.setattr(limiter, "auth_rule", Rule("auth", per_minute=1, capacity=2))
+    monkeypatch.setattr(limiter, "user_rule", Rule("user", per_minute=1, capacity=3))
+    return limiter
+
+
+def _scope(peer: str, forwarded: str | None = None) -> dict:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return {"client": (peer, 1234), "headers": headers}
+
+
+class TestBucketStorage:
+    """Tests for the token bucket storage backends."""
+
+    async def test_memory_bucket_refuses_when_empty(self):
+        storage = MemoryStorage()
+
+        results = [await storage.take("k", rate=1, capacity=2) for _ in range(3)]
+
+        assert results[:2] == [0.0, 0.0]
+        assert 0 < results[2] <= 1
+
+    async def test_sqlite_buckets_are_shared(self, tmp_path):
+        """Two workers pointing at the same file must share one bucket."""
+        first = SQLiteStorage(str(tmp_path / "ratelimit.db"))
+        second = SQLiteStorage(str(tmp_path / "ratelimit.db"))
+        try:
+            assert await first.take("k", rate=0.01, capacity=2) == 0
+            assert await second.take("k", rate=0.01, capacity=2) == 0
+            assert await first.take("k", rate=0.01, capacity=2) > 0
+            assert await second.take("other", rate=0.01, capacity=2) == 0
+        finally:
+            await first.close()
+            await second.close()
+
+
+class TestRateLimitMiddleware:
+    """Tests for limits applied to API requests."""
+
+    async def test_sign_in_is_limited_per_address(
+        self, client: AsyncClient, limits: RateLimiter, metrics_enabled: None
+    ):
+        credentials = {"username": "limited", "password": "password123"}
+        statuses = [
+            (await client.post("/api/v1/auth/register", json=credentials)).status_code,
+            (await client.post("/api/v1/auth/login", json=credentials)).status_code,
+        ]
+        throttled = await client.post("/api/v1/auth/login", json=credentials)
+
+        assert statuses == [201, 200]
+        assert throttled.status_code == 429
+        assert int(throttled.headers["Retry-After"]) >= 1
+        metrics = (await client.get("/metrics")).json()
+        assert metrics["rate_limits"]["throttled"]["auth"] >= 1
+
+    async def test_api_is_limited_per_user(
+        self, client: AsyncClient, make_user, limits: RateLimiter
+    ):
+        """Users behind one address must not share a bucket."""
+        limits.auth_rule = None
+        alice = {"Authorization": f"Bearer {await make_user('alice')}"}
+        bob = {"Authorization": f"Bearer {await make_user('bob')}"}
+
+        alice_statuses = [
+            (await client.get("/api/v1/tasks/", headers=alice)).status_code
+            for _ in range(4)
+        ]
+        bob_status = (await client.get("/api/v1/tasks/", headers=bob)).status_code
+
+        assert alice_statuses == [200, 200, 200, 429]
+        assert bob_status == 200
+
+
+class TestClientAddress:
+    """X-Forwarded-For must only be believed from trusted proxies."""
+
+    def test_ignores_forwarded_header_from_untrusted_peer(self):
+        limiter = RateLimiter(MemoryStorage(), None, None, ["10.0.0.0/8"])
+
+        assert limiter.client_address(_scope("203.0.113.9", "1.2.3.4")) == "203.0.113.9"
+
+    def test_uses_rightmost_untrusted_forwarded_address(self):
+        limiter = RateLimiter(MemoryStorage(), None, None, ["10.0.0.0/8"])
+        scope = _scope("10.0.0.1", "6.6.6.6, 198.51.100.7, 10.0.0.2")
+
+        assert limiter.client_address(scope) == "198.51.100.7"
+
+    def test_accepts_proxy_network_with_host_bits_set(self):
+        limiter = RateLimiter(MemoryStorage(), None, None, ["10.0.0.1/8"])
+
+        assert limiter.client_address(_scope("10.9.9.9", "198.51.100.7")) == (
+            "198.51.100.7"
+        )
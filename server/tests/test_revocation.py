@@ -0,0 +1,123 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import DatabaseSessionManager
+from app.core.migrations import migrate
+from app.core.revocation import SYNC_OVERLAP, RevocationStore
+from app.models import RevokedToken
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path}/app.db"
+    await migrate(url)
+    manager = DatabaseSessionManager(url)
+    yield manager
+    await manager.close()
+
+
+async def _insert(manager: DatabaseSessionManager, jti: str, revoked_at) -> None:
+    """A revocation as another worker would have written it."""
+    async with manager.connect() as connection:
+        await connection.execute(
+            insert(RevokedToken).values(
+                jti=jti,
+                expires_at=datetime.now(UTC) + timedelta(hours=1),
+                revoked_at=revoked_at,
+            )
+        )
+
+
+async def _stored(manager: DatabaseSessionManager) -> int:
+    async with manager.session(read_only=True) as session:
+        return await session.scalar(select(func.count()).select_from(RevokedToken))
+
+
+class TestRevocationStore:
+    """Tests for the database-backed token revocation store."""
+
+    async def test_revocations_reach_other_workers(
+        self, manager: DatabaseSessionManager
+    ):
+        """A logout on one process must be seen by the others after a sync."""
+        worker_a, worker_b = RevocationStore(manager), RevocationStore(manager)
+
+        async with manager.session() as session:
+            await worker_a.revoke(session, "jti-1", time.time() + 60)
+
+        assert worker_a.is_revoked("jti-1")
+        assert not worker_b.is_revoked("jti-1")
+        await worker_b.sync()
+        assert worker_b.is_revoked("jti-1")
+
+    async def test_revocations_after_purge_reach_other_workers(
+        self, manager: DatabaseSessionManager
+    ):
+        """Ids freed by a purge are reused, so they cannot be a sync cursor."""
+        worker_a, worker_b = RevocationStore(manager), RevocationStore(manager)
+        async with manager.session() as session:
+            await worker_a.revoke(session, "expired", time.time() - 1)
+        await worker_b.sync()
+
+        await worker_a.purge()
+        async with manager.session() as session:
+            await worker_a.revoke(session, "jti-2", time.time() + 60)
+        await worker_b.sync()
+
+        assert worker_b.is_revoked("jti-2")
+
+    async def test_later_syncs_read_only_recent_revocations(
+        self, manager: DatabaseSessionManager
+    ):
+        """After the first full load, a sync reads back only SYNC_OVERLAP."""
+        store = RevocationStore(manager)
+        await store.sync()
+
+        now = datetime.now(UTC)
+        await _insert(manager, "committed-late", now - SYNC_OVERLAP / 2)
+        await _insert(manager, "long-synced", now - 2 * SYNC_OVERLAP)
+        await store.sync()
+
+        assert store.is_revoked("committed-late")
+        assert not store.is_revoked("long-synced")
+        # A restarted worker loads everything, including rows without a time.
+        await _insert(manager, "before-revoked-at", None)
+        restarted = RevocationStore(manager)
+        await restarted.sync()
+        assert len(restarted) == 3
+
+    async def test_revocations_survive_restart(self, manager: DatabaseSessionManager):
+        async with manager.session() as session:
+            await RevocationStore(manager).revoke(session, "jti-1", time.time() + 60)
+
+        restarted = RevocationStore(manager)
+        await restarted.sync()
+
+        assert restarted.is_revoked("jti-1")
+
+    async def test_purge_drops_expired_entries(self, manager: DatabaseSessionManager):
+        store = RevocationStore(manager)
+        async with manager.session() as session:
+            await store.revoke(session, "expired", time.time() - 1)
+        async with manager.session() as session:
+            await store.revoke(session, "live", time.time() + 60)
+
+        await store.purge()
+
+        assert not store.is_revoked("expired")
+        assert store.is_revoked("live")
+        assert len(store) == 1
+        assert await _stored(manager) == 1
+
+    async def test_logout_persists_revocation(
+        self, client: AsyncClient, db: AsyncSession, auth_headers: dict[str, str]
+    ):
+        response = await client.post("/api/v1/auth/logout", headers=auth_headers)
+
+        assert response.status_code == 204
+        assert await db.scalar(select(func.count()).select_from(RevokedToken)) == 1
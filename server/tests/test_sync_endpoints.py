@@ -0,0 +1,232 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.versioning import purge_tombstones
+from app.models import User
+from app.tasks.service import TaskService
+
+
+async def _sync(client: AsyncClient, headers: dict[str, str], since: int = 0) -> dict:
+    response = await client.get(
+        "/api/v1/sync", params={"since": since}, headers=headers
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestSync:
+    """Tests for GET /sync endpoint."""
+
+    async def test_requires_auth(self, client: AsyncClient):
+        """Should reject requests without a token."""
+        response = await client.get("/api/v1/sync")
+
+        assert response.status_code == 401
+
+    async def test_initial_sync_returns_whole_board(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """since=0 should return every task and tag."""
+        task = await make_task(title="First")
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+
+        data = await _sync(client, auth_headers)
+
+        assert data["reset"] is False
+        assert data["version"] == 2
+        assert [t["id"] for t in data["tasks"]] == [task["id"]]
+        assert data["tags"] == [tag]
+        assert data["deleted_tasks"] == []
+
+    async def test_returns_only_changes_since_version(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Unchanged tasks should not be sent again."""
+        await make_task(title="Untouched")
+        changed = await make_task(title="Changed")
+        version = (await _sync(client, auth_headers))["version"]
+
+        await client.put(
+            f"/api/v1/tasks/{changed['id']}",
+            json={"title": "Renamed"},
+            headers=auth_headers,
+        )
+        data = await _sync(client, auth_headers, version)
+
+        assert data["version"] == version + 1
+        assert [t["title"] for t in data["tasks"]] == ["Renamed"]
+        assert data["tags"] == []
+
+    async def test_no_changes_returns_empty_lists(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        await make_task()
+        version = (await _sync(client, auth_headers))["version"]
+
+        data = await _sync(client, auth_headers, version)
+
+        assert data == {
+            "version": version,
+            "reset": False,
+            "tasks": [],
+            "tags": [],
+            "deleted_tasks": [],
+            "deleted_tags": [],
+        }
+
+    async def test_every_task_write_bumps_the_version(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Toggle and move should both be reported."""
+        first = await make_task(title="First")
+        second = await make_task(title="Second")
+
+        version = (await _sync(client, auth_headers))["version"]
+        await client.patch(
+            f"/api/v1/tasks/{first['id']}/complete", headers=auth_headers
+        )
+        data = await _sync(client, auth_headers, version)
+        assert [t["completed"] for t in data["tasks"]] == [True]
+
+        version = data["version"]
+        await client.post(f"/api/v1/tasks/{second['id']}/move", headers=auth_headers)
+        data = await _sync(client, auth_headers, version)
+        assert [t["id"] for t in data["tasks"]] == [second["id"]]
+        assert data["tasks"][0]["position"] < first["position"]
+
+    async def test_deletes_are_reported_as_tombstones(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        task = await make_task()
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        version = (await _sync(client, auth_headers))["version"]
+
+        await client.delete(f"/api/v1/tasks/{task['id']}", headers=auth_headers)
+        await client.delete(f"/api/v1/tags/{tag['id']}", headers=auth_headers)
+        data = await _sync(client, auth_headers, version)
+
+        assert data["deleted_tasks"] == [task["id"]]
+        assert data["deleted_tags"] == [tag["id"]]
+        assert data["tasks"] == []
+
+    async def test_missing_delete_does_not_bump_the_version(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        version = (await _sync(client, auth_headers))["version"]
+
+        response = await client.delete("/api/v1/tasks/999999", headers=auth_headers)
+
+        assert response.status_code == 404
+        assert (await _sync(client, auth_headers, version))["version"] == version
+
+    async def test_tag_changes_resend_tagged_tasks(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Tasks embed their tags, so linking and renaming must resend them."""
+        task = await make_task()
+        await make_task(title="Untagged")
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        version = (await _sync(client, auth_headers))["version"]
+
+        await client.post(
+            f"/api/v1/tasks/{task['id']}/tags/{tag['id']}", headers=auth_headers
+        )
+        data = await _sync(client, auth_headers, version)
+        assert [t["tags"] for t in data["tasks"]] == [[tag]]
+
+        await client.put(f"/api/v1/tags/{tag['id']}?name=office", headers=auth_headers)
+        data = await _sync(client, auth_headers, data["version"])
+        assert data["tags"] == [{"id": tag["id"], "name": "office"}]
+        assert [t["tags"] for t in data["tasks"]] == [[data["tags"][0]]]
+
+        await client.delete(f"/api/v1/tags/{tag['id']}", headers=auth_headers)
+        data = await _sync(client, auth_headers, data["version"])
+        assert [t["tags"] for t in data["tasks"]] == [[]]
+        assert data["deleted_tags"] == [tag["id"]]
+
+    async def test_merging_tags_reports_the_old_tag_deleted(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        task = await make_task()
+        old = (await client.post("/api/v1/tags/?name=old", headers=auth_headers)).json()
+        new = (await client.post("/api/v1/tags/?name=new", headers=auth_headers)).json()
+        await client.post(
+            f"/api/v1/tasks/{task['id']}/tags/{old['id']}", headers=auth_headers
+        )
+        version = (await _sync(client, auth_headers))["version"]
+
+        await client.put(f"/api/v1/tags/{old['id']}?name=new", headers=auth_headers)
+        data = await _sync(client, auth_headers, version)
+
+        assert data["deleted_tags"] == [old["id"]]
+        assert [t["tags"] for t in data["tasks"]] == [[new]]
+
+    async def test_changes_are_scoped_to_the_user(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_user, make_task
+    ):
+        other = {"Authorization": f"Bearer {await make_user('other')}"}
+        await make_task()
+
+        data = await _sync(client, other)
+
+        assert data["version"] == 0
+        assert data["tasks"] == []
+
+    async def test_version_ahead_of_server_resets(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """A client ahead of the server (e.g. after a restore) gets the board."""
+        await make_task()
+
+        data = await _sync(client, auth_headers, 1000)
+
+        assert data["reset"] is True
+        assert len(data["tasks"]) == 1
+
+    async def test_since_before_purge_resets(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        auth_headers: dict[str, str],
+        make_task,
+    ):
+        """Purged tombstones can't be replayed, so older clients start over."""
+        kept = await make_task(title="Kept")
+        gone = await make_task(title="Gone")
+        await client.delete(f"/api/v1/tasks/{gone['id']}", headers=auth_headers)
+        version = (await _sync(client, auth_headers))["version"]
+
+        connection = await db.connection()
+        await purge_tombstones(connection, datetime.now(UTC) + timedelta(1))
+
+        stale = await _sync(client, auth_headers, version - 1)
+        assert stale["reset"] is True
+        assert [t["id"] for t in stale["tasks"]] == [kept["id"]]
+        assert stale["deleted_tasks"] == []
+
+        current = await _sync(client, auth_headers, version)
+        assert current["reset"] is False
+
+    async def test_changed_tasks_use_the_version_index(self, db: AsyncSession):
+        """An incremental sync is a range scan, not a pass over the board."""
+        if db.bind.dialect.name != "sqlite":
+            pytest.skip("EXPLAIN QUERY PLAN output is SQLite specific")
+        stmt = TaskService(db)._changed_query(
+            User(id=1, username="plan", password_hash=""), 10
+        )
+        sql = str(stmt.compile(db.bind, compile_kwargs={"literal_binds": True}))
+        rows = await db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        plan = " ".join(row.detail for row in rows)
+
+        assert "ix_tasks_user_id_version (user_id=? AND version>?)" in plan
+        assert "TEMP B-TREE" not in plan
@@ -28,6 +28,22 @@ class TestListTags:
         assert "work" in tag_names
         assert "personal" in tag_names
 
+    async def test_unchanged_list_is_not_modified(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        """The ETag holds until the user's tags change."""
+        await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        etag = (await client.get("/api/v1/tags/", headers=auth_headers)).headers["ETag"]
+        conditional = {**auth_headers, "If-None-Match": etag}
+
+        response = await client.get("/api/v1/tags/", headers=conditional)
+        assert response.status_code == 304
+
+        await client.post("/api/v1/tags/?name=home", headers=auth_headers)
+        response = await client.get("/api/v1/tags/", headers=conditional)
+        assert response.status_code == 200
+        assert [t["name"] for t in response.json()] == ["work", "home"]
+
 
 class TestCreateTag:
     """Tests for POST /tags/ endpoint."""
@@ -112,6 +128,26 @@ class TestRenameTag:
         assert len(tags) == 1
         assert tags[0]["name"] == "tag1"
 
+    async def test_merge_moves_links_without_duplicates(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Tasks on both tags keep one link; tasks on the old tag move over."""
+        old = (await client.post("/api/v1/tags/?name=old", headers=auth_headers)).json()
+        new = (await client.post("/api/v1/tags/?name=new", headers=auth_headers)).json()
+        both, only_old = await make_task(title="both"), await make_task(title="old")
+        for task, tag in [(both, old), (both, new), (only_old, old)]:
+            await client.post(
+                f"/api/v1/tasks/{task['id']}/tags/{tag['id']}", headers=auth_headers
+            )
+
+        response = await client.put(
+            f"/api/v1/tags/{old['id']}?name=new", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        tasks = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert {t["title"]: t["tags"] for t in tasks} == {"both": [new], "old": [new]}
+
     async def test_rename_nonexistent_tag(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ):
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+from sqlalchemy import delete, select
+from sqlmodel import SQLModel
+
+from app.config import get_settings
+from app.core.database import DatabaseSessionManager
+from app.models import Task, TaskCreate, User
+from app.tasks.service import TaskService
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+async def manager(engine, tmp_path):
+    """A real pooled manager, so creates race on separate connections."""
+    if engine.dialect.name == "sqlite":
+        manager = DatabaseSessionManager(
+            f"sqlite+aiosqlite:///{tmp_path}/test.db",
+            engine_kwargs=get_settings().app.engine_kwargs,
+            sqlite_pragmas=get_settings().app.sqlite_pragmas,
+        )
+        async with manager.connect() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+    else:
+        manager = DatabaseSessionManager(
+            TEST_DATABASE_URL, engine_kwargs={"pool_size": 20, "max_overflow": 0}
+        )
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+async def user(manager: DatabaseSessionManager):
+    async with manager.session() as session:
+        user = User(username="racer", password_hash="x")
+        session.add(user)
+        await session.commit()
+    yield user
+    async with manager.connect() as connection:
+        await connection.execute(delete(Task).where(Task.user_id == user.id))
+        await connection.execute(delete(User).where(User.id == user.id))
+
+
+class TestConcurrentCreate:
+    """Position assignment must hold up under parallel creates."""
+
+    async def test_parallel_creates_get_unique_positions(
+        self, manager: DatabaseSessionManager, user: User
+    ):
+        async def create(i: int) -> float:
+            async with manager.session() as session:
+                task = await TaskService(session).create(
+                    user, TaskCreate(title=f"task {i}"), prepend=i % 2 == 1
+                )
+                return task.position
+
+        returned = await asyncio.gather(*(create(i) for i in range(1000)))
+
+        async with manager.session(read_only=True) as session:
+            stored = (
+                await session.scalars(
+                    select(Task.position).where(Task.user_id == user.id)
+                )
+            ).all()
+
+        assert len(stored) == 1000
+        assert len(set(stored)) == 1000
+        assert sorted(returned) == sorted(stored)
@@ -1,5 +1,11 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import encode_cursor
+from app.models import TaskFilter, User
+from app.tasks.service import SORT_ORDERS, TaskService
 
 
 class TestListTasks:
@@ -27,6 +33,496 @@ class TestListTasks:
         assert any(t["id"] == task1["id"] for t in tasks)
         assert any(t["id"] == task2["id"] for t in tasks)
 
+    async def test_lists_tasks_with_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Listed tasks should carry all TaskRead fields and their tags."""
+        tagged = await make_task(title="Tagged", deadline="2026-01-31")
+        untagged = await make_task(title="Untagged")
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        await client.post(
+            f"/api/v1/tasks/{tagged['id']}/tags/{tag['id']}", headers=auth_headers
+        )
+        await client.patch(
+            f"/api/v1/tasks/{tagged['id']}/complete", headers=auth_headers
+        )
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        first, second = response.json()
+        assert first["id"] == tagged["id"]
+        assert first["tags"] == [{"id": tag["id"], "name": "work"}]
+        assert first["completed"] is True
+        assert first["completed_at"] is not None
+        assert first["deadline"] == "2026-01-31"
+        assert second == {**untagged, "tags": []}
+
+
+class TestListTasksPages:
+    """Tests for keyset pagination of GET /api/v1/tasks/."""
+
+    async def _pages(self, client, headers, limit: int, cursor: str | None = None):
+        """Yield the ids on each page, following X-Next-Cursor to the end."""
+        while True:
+            params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+            response = await client.get(
+                "/api/v1/tasks/", params=params, headers=headers
+            )
+            assert response.status_code == 200
+            yield [t["id"] for t in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return
+
+    async def test_pages_cover_list_in_order(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        ids = [(await make_task(title=f"Task {i}"))["id"] for i in range(7)]
+        statements.clear()
+
+        pages = [page async for page in self._pages(client, auth_headers, limit=3)]
+
+        assert pages == [ids[:3], ids[3:6], ids[6:]]
+        # Later pages seek past the cursor key instead of skipping rows.
+        keyset = [sql for sql in statements if "tasks.position >=" in sql]
+        assert len(keyset) == 2
+
+    async def test_unpaged_list_has_no_cursor(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        await make_task()
+
+        response = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_cursor_is_stable_across_moves_and_deletes(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Tasks not yet seen are neither skipped nor repeated after edits."""
+        ids = [(await make_task(title=f"Task {i}"))["id"] for i in range(8)]
+        response = await client.get(
+            "/api/v1/tasks/", params={"limit": 3}, headers=auth_headers
+        )
+        assert [t["id"] for t in response.json()] == ids[:3]
+        cursor = response.headers["X-Next-Cursor"]
+
+        # Moving a seen task down keeps the cursor's own key valid, and the
+        # task it points past need not exist any more.
+        await client.post(
+            f"/api/v1/tasks/{ids[1]}/move?after_id={ids[7]}", headers=auth_headers
+        )
+        await client.post(f"/api/v1/tasks/{ids[6]}/move", headers=auth_headers)
+        await client.delete(f"/api/v1/tasks/{ids[2]}", headers=auth_headers)
+        await client.delete(f"/api/v1/tasks/{ids[3]}", headers=auth_headers)
+
+        pages = [
+            page
+            async for page in self._pages(client, auth_headers, limit=3, cursor=cursor)
+        ]
+
+        assert pages == [[ids[4], ids[5], ids[7]], [ids[1]]]
+
+    async def test_rejects_malformed_cursor(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        for cursor in ("not-a-cursor", "WzFd", "WyJhIiwiYiJd"):
+            response = await client.get(
+                "/api/v1/tasks/", params={"cursor": cursor}, headers=auth_headers
+            )
+            assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "sort,key",
+        [
+            ("manual", ("manual", 1.0, 10**30)),
+            ("manual", ("manual", 10**400, 1)),
+            ("manual", ("manual", 1.0, "10")),
+            ("title", ("title", ["a"], 1)),
+            ("title", ("title", {"a": 1}, 1)),
+        ],
+    )
+    async def test_rejects_cursor_with_unusable_key(
+        self, client: AsyncClient, auth_headers: dict[str, str], sort, key
+    ):
+        """Out-of-range or mistyped parts are a bad cursor, not a 500."""
+        response = await client.get(
+            "/api/v1/tasks/",
+            params={"sort": sort, "cursor": encode_cursor(key)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    async def test_rejects_oversized_limit(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        response = await client.get(
+            "/api/v1/tasks/", params={"limit": 10_000}, headers=auth_headers
+        )
+        assert response.status_code == 422
+
+
+async def _list_plan(db: AsyncSession, filters, sort, after) -> str:
+    """SQLite's query plan for one page of the task list."""
+    if db.bind.dialect.name != "sqlite":
+        pytest.skip("EXPLAIN QUERY PLAN output is SQLite specific")
+    stmt = TaskService(db)._list_query(
+        User(id=1, username="plan", password_hash=""),
+        filters,
+        sort,
+        limit=50,
+        after=after,
+    )
+    sql = str(stmt.compile(db.bind, compile_kwargs={"literal_binds": True}))
+    rows = await db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return " ".join(row.detail for row in rows)
+
+
+class TestListTasksConditional:
+    """Tests for ETag / If-None-Match on GET /api/v1/tasks/."""
+
+    async def test_unchanged_list_is_not_modified(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        """A matching If-None-Match costs one lookup and sends no body."""
+        await make_task()
+        first = await client.get("/api/v1/tasks/", headers=auth_headers)
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        statements.clear()
+
+        response = await client.get(
+            "/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert len(statements) == 1
+        assert not any("FROM tasks" in s for s in statements)
+
+    async def test_write_changes_the_etag(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        task = await make_task()
+        etag = (await client.get("/api/v1/tasks/", headers=auth_headers)).headers[
+            "ETag"
+        ]
+
+        await client.patch(f"/api/v1/tasks/{task['id']}/complete", headers=auth_headers)
+        response = await client.get(
+            "/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["completed"] is True
+
+    async def test_etag_depends_on_query_and_user(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_user
+    ):
+        async def etag(headers, **params) -> str:
+            response = await client.get(
+                "/api/v1/tasks/", params=params, headers=headers
+            )
+            return response.headers["ETag"]
+
+        other = {"Authorization": f"Bearer {await make_user('other')}"}
+
+        assert await etag(auth_headers) == await etag(auth_headers)
+        assert await etag(auth_headers) != await etag(auth_headers, completed=True)
+        assert await etag(auth_headers) != await etag(other)
+
+    @pytest.mark.parametrize("header", ["W/{etag}", '"stale", {etag}', "*"])
+    async def test_if_none_match_forms(
+        self, client: AsyncClient, auth_headers: dict[str, str], header: str
+    ):
+        etag = (await client.get("/api/v1/tasks/", headers=auth_headers)).headers[
+            "ETag"
+        ]
+
+        response = await client.get(
+            "/api/v1/tasks/",
+            headers={**auth_headers, "If-None-Match": header.format(etag=etag)},
+        )
+
+        assert response.status_code == 304
+
+
+class TestListTasksFilters:
+    """Tests for filtering GET /api/v1/tasks/ in SQL."""
+
+    async def _ids(self, client, headers, **params) -> list[int]:
+        response = await client.get("/api/v1/tasks/", params=params, headers=headers)
+        assert response.status_code == 200
+        return [t["id"] for t in response.json()]
+
+    async def test_filters_by_completed(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        done = await make_task(title="Done")
+        todo = await make_task(title="Todo")
+        await client.patch(f"/api/v1/tasks/{done['id']}/complete", headers=auth_headers)
+
+        assert await self._ids(client, auth_headers, completed=True) == [done["id"]]
+        assert await self._ids(client, auth_headers, completed=False) == [todo["id"]]
+
+    async def test_filters_by_substring(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Matches title or description case-insensitively, LIKE wildcards literally."""
+        by_title = await make_task(title="Buy MILK", description="")
+        by_description = await make_task(title="Errand", description="milk and eggs")
+        await make_task(title="Other", description="bread")
+        percent = await make_task(title="Save 100% of it", description="")
+
+        assert await self._ids(client, auth_headers, q="milk") == [
+            by_title["id"],
+            by_description["id"],
+        ]
+        assert await self._ids(client, auth_headers, q="0%") == [percent["id"]]
+
+    async def test_filters_by_deadline_range(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        early = await make_task(title="Early", deadline="2026-01-01")
+        middle = await make_task(title="Middle", deadline="2026-02-01")
+        late = await make_task(title="Late", deadline="2026-03-01")
+        await make_task(title="Someday")
+
+        assert await self._ids(
+            client,
+            auth_headers,
+            deadline_after="2026-01-01",
+            deadline_before="2026-02-01",
+        ) == [early["id"], middle["id"]]
+        assert await self._ids(client, auth_headers, deadline_after="2026-02-02") == [
+            late["id"]
+        ]
+
+    async def test_filters_apply_to_every_page(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        ids = [(await make_task(title=f"Task {i}"))["id"] for i in range(6)]
+        for task_id in ids[::2]:
+            await client.patch(
+                f"/api/v1/tasks/{task_id}/complete", headers=auth_headers
+            )
+
+        first = await client.get(
+            "/api/v1/tasks/",
+            params={"completed": False, "limit": 2},
+            headers=auth_headers,
+        )
+        rest = await self._ids(
+            client,
+            auth_headers,
+            completed=False,
+            limit=2,
+            cursor=first.headers["X-Next-Cursor"],
+        )
+
+        assert [t["id"] for t in first.json()] == [ids[1], ids[3]]
+        assert rest == [ids[5]]
+
+    async def test_completed_filter_uses_composite_index(self, db: AsyncSession):
+        plan = await _list_plan(db, TaskFilter(completed=False), "manual", (10.0, 10))
+
+        assert "ix_tasks_user_id_completed_position" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestListTasksSort:
+    """Tests for the sort orders of GET /api/v1/tasks/."""
+
+    async def _ids(self, client, headers, sort: str, limit: int | None = None):
+        """Ids in ``sort`` order, following cursors when ``limit`` is set."""
+        ids, cursor = [], None
+        while True:
+            params = {"sort": sort}
+            if limit:
+                params["limit"] = limit
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/api/v1/tasks/", params=params, headers=headers
+            )
+            assert response.status_code == 200
+            ids += [t["id"] for t in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return ids
+
+    @pytest.fixture
+    async def tasks(self, client, auth_headers, make_task) -> dict[str, int]:
+        """Tasks with duplicate and missing sort values, by title."""
+        specs = [
+            ("banana", "2026-03-01"),
+            ("Apple", None),
+            ("cherry", "2026-01-01"),
+            ("apple", "2026-03-01"),
+            ("Date", None),
+        ]
+        ids = {}
+        for title, deadline in specs:
+            ids[title] = (await make_task(title=title, deadline=deadline))["id"]
+        for title in ("cherry", "Apple", "banana"):
+            await client.patch(
+                f"/api/v1/tasks/{ids[title]}/complete", headers=auth_headers
+            )
+        return ids
+
+    @pytest.mark.parametrize("limit", [None, 2])
+    @pytest.mark.parametrize(
+        "sort,expected",
+        [
+            ("manual", ["banana", "Apple", "cherry", "apple", "Date"]),
+            ("deadline", ["cherry", "banana", "apple", "Apple", "Date"]),
+            ("title", ["Apple", "apple", "banana", "cherry", "Date"]),
+            # Most recent first; uncompleted tasks last, by id descending.
+            ("completed_at", ["banana", "Apple", "cherry", "Date", "apple"]),
+        ],
+    )
+    async def test_sort_orders(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        tasks: dict[str, int],
+        sort: str,
+        expected: list[str],
+        limit: int | None,
+    ):
+        """Ties and missing values fall back to id; pages match the full list."""
+        ids = await self._ids(client, auth_headers, sort, limit)
+
+        assert ids == [tasks[title] for title in expected]
+
+    async def test_rejects_cursor_from_another_sort(
+        self, client: AsyncClient, auth_headers: dict[str, str], tasks
+    ):
+        response = await client.get(
+            "/api/v1/tasks/", params={"sort": "title", "limit": 2}, headers=auth_headers
+        )
+
+        response = await client.get(
+            "/api/v1/tasks/",
+            params={"sort": "deadline", "cursor": response.headers["X-Next-Cursor"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("sort", list(SORT_ORDERS))
+    async def test_every_sort_is_served_by_an_index(self, db: AsyncSession, sort):
+        value = {"manual": 1.0, "deadline": None, "title": "m", "completed_at": None}
+        plan = await _list_plan(db, TaskFilter(), sort, (value[sort], 10))
+
+        assert "USING INDEX" in plan or "USING COVERING INDEX" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestSearchTasks:
+    """Tests for GET /api/v1/tasks/search endpoint."""
+
+    async def _search(self, client, headers, q: str, **params) -> list[int]:
+        response = await client.get(
+            "/api/v1/tasks/search", params={"q": q, **params}, headers=headers
+        )
+        assert response.status_code == 200
+        return [t["id"] for t in response.json()]
+
+    async def test_matches_word_prefixes_ranking_titles_first(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        in_description = await make_task(title="Errands", description="buy milk")
+        in_title = await make_task(title="Milk the cow", description="")
+        await make_task(title="Unrelated", description="semolina")
+
+        assert await self._search(client, auth_headers, "mil") == [
+            in_title["id"],
+            in_description["id"],
+        ]
+        assert await self._search(client, auth_headers, "buy MILK") == [
+            in_description["id"]
+        ]
+
+    async def test_only_searches_own_tasks(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, make_user
+    ):
+        mine = await make_task(title="Shared word")
+        other = {"Authorization": f"Bearer {await make_user('other')}"}
+        await client.post(
+            "/api/v1/tasks/", json={"title": "Shared word"}, headers=other
+        )
+
+        assert await self._search(client, auth_headers, "shared") == [mine["id"]]
+
+    async def test_terms_do_not_match_the_owner_id(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """The indexed user_id scopes a search but is not searchable text."""
+        await make_task(title="Errands")
+
+        for digit in "123456789":
+            assert await self._search(client, auth_headers, digit) == []
+
+    async def test_follows_updates_and_deletes(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        renamed = await make_task(title="Old name")
+        deleted = await make_task(title="Old news")
+
+        await client.put(
+            f"/api/v1/tasks/{renamed['id']}",
+            json={"title": "New name"},
+            headers=auth_headers,
+        )
+        await client.delete(f"/api/v1/tasks/{deleted['id']}", headers=auth_headers)
+
+        assert await self._search(client, auth_headers, "old") == []
+        assert await self._search(client, auth_headers, "new") == [renamed["id"]]
+
+    async def test_pages_through_results(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        ids = {(await make_task(title=f"Report {i}"))["id"] for i in range(5)}
+
+        seen, cursor = [], None
+        while True:
+            params = {"q": "report", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/api/v1/tasks/search", params=params, headers=auth_headers
+            )
+            seen += [t["id"] for t in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(ids)
+
+    async def test_rejects_cursor_with_out_of_range_id(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        response = await client.get(
+            "/api/v1/tasks/search",
+            params={"q": "milk", "cursor": encode_cursor((1.0, 10**30))},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("q", ['"', "milk OR", "NEAR(a b)", "*", "a:* & !b"])
+    async def test_query_syntax_is_not_interpreted(
+        self, client: AsyncClient, auth_headers: dict[str, str], q: str
+    ):
+        response = await client.get(
+            "/api/v1/tasks/search", params={"q": q}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
 
 class TestCreateTask:
     """Tests for POST /api/v1/tasks/ endpoint."""
@@ -48,6 +544,67 @@ class TestCreateTask:
         assert task["description"] == "Cover all endpoints"
         assert task["completed"] is False
 
+    async def test_appends_and_prepends(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """New tasks go to the end by default and to the top with prepend."""
+        first = await make_task(title="First")
+        last = await make_task(title="Last")
+        response = await client.post(
+            "/api/v1/tasks/",
+            params={"prepend": True},
+            json={"title": "Top"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        top = response.json()
+        assert first["position"] < last["position"]
+        assert top["position"] < first["position"]
+
+        listed = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert [t["title"] for t in listed] == ["Top", "First", "Last"]
+
+    async def test_creates_task_with_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        work = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        home = (
+            await client.post("/api/v1/tags/?name=home", headers=auth_headers)
+        ).json()
+
+        response = await client.post(
+            "/api/v1/tasks/",
+            json={"title": "Tagged", "tag_ids": [home["id"], work["id"], home["id"]]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["tags"] == [work, home]
+        listed = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert sorted(listed[0]["tags"], key=lambda t: t["id"]) == [work, home]
+
+    async def test_unknown_tag_creates_nothing(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_user
+    ):
+        """Tags of another user are as unknown as ids that don't exist."""
+        other = {"Authorization": f"Bearer {await make_user('other')}"}
+        foreign = (await client.post("/api/v1/tags/?name=theirs", headers=other)).json()
+
+        for tag_id in (foreign["id"], 999999):
+            response = await client.post(
+                "/api/v1/tasks/",
+                json={"title": "Tagged", "tag_ids": [tag_id]},
+                headers=auth_headers,
+            )
+            assert response.status_code == 404
+            assert response.json()["detail"] == "Tag not found"
+
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert listed.json() == []
+
     async def test_validates_required_fields(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ):
@@ -73,6 +630,137 @@ class TestCreateTask:
         assert response.status_code == 422
 
 
+class TestTaskBatch:
+    """Tests for POST /tasks/batch endpoint."""
+
+    async def _batch(self, client, headers, *operations):
+        return await client.post(
+            "/api/v1/tasks/batch", json={"operations": operations}, headers=headers
+        )
+
+    async def test_applies_operations_in_order(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        """Later operations can refer to tasks created earlier by ref."""
+        existing = await make_task(title="Existing")
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+
+        response = await self._batch(
+            client,
+            auth_headers,
+            {"op": "create", "ref": "new", "task": {"title": "Draft"}},
+            {"op": "update", "task_id": "new", "changes": {"title": "Final"}},
+            {"op": "add_tag", "task_id": "new", "tag_id": tag["id"]},
+            {"op": "move", "task_id": existing["id"], "after_id": "new"},
+            {"op": "toggle", "task_id": existing["id"]},
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        created = results[0]["task_id"]
+        assert [r["task_id"] for r in results] == [created] * 3 + [existing["id"]] * 2
+        assert results[1]["task"]["title"] == "Final"
+        assert results[2]["task"]["tags"] == [tag]
+        assert results[4]["task"]["completed"] is True
+
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert [t["id"] for t in listed.json()] == [created, existing["id"]]
+
+    async def test_delete_and_remove_tag(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        kept = await make_task(title="Kept")
+        gone = await make_task(title="Gone")
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        await client.post(
+            f"/api/v1/tasks/{kept['id']}/tags/{tag['id']}", headers=auth_headers
+        )
+
+        response = await self._batch(
+            client,
+            auth_headers,
+            {"op": "remove_tag", "task_id": kept["id"], "tag_id": tag["id"]},
+            {"op": "delete", "task_id": gone["id"]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()[0]["task"]["tags"] == []
+        assert response.json()[1] == {"task_id": gone["id"], "task": None}
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert [t["id"] for t in listed.json()] == [kept["id"]]
+
+    async def test_failure_rolls_back_the_whole_batch(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        response = await self._batch(
+            client,
+            auth_headers,
+            {"op": "create", "task": {"title": "Rolled back"}},
+            {"op": "toggle", "task_id": 999999},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == {
+            "operation": 1,
+            "message": "Task not found",
+        }
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert listed.json() == []
+
+    async def test_cannot_touch_other_users_tasks(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_user, make_task
+    ):
+        task = await make_task()
+        other = {"Authorization": f"Bearer {await make_user('other')}"}
+
+        response = await self._batch(
+            client, other, {"op": "delete", "task_id": task["id"]}
+        )
+
+        assert response.status_code == 404
+
+    async def test_unknown_tag_names_the_operation(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        response = await self._batch(
+            client,
+            auth_headers,
+            {"op": "create", "ref": "new", "task": {"title": "Draft"}},
+            {"op": "update", "task_id": "new", "changes": {"tag_ids": [999999]}},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == {
+            "operation": 1,
+            "message": "Tag not found",
+        }
+
+    @pytest.mark.parametrize(
+        "operations",
+        [
+            [{"op": "toggle", "task_id": "later"}],
+            [
+                {"op": "create", "ref": "a", "task": {"title": "One"}},
+                {"op": "create", "ref": "a", "task": {"title": "Two"}},
+            ],
+            [{"op": "rename", "task_id": 1}],
+            [],
+            [{"op": "toggle", "task_id": 1}] * 101,
+        ],
+        ids=["undefined ref", "duplicate ref", "unknown op", "empty", "too many"],
+    )
+    async def test_rejects_invalid_batches(
+        self, client: AsyncClient, auth_headers: dict[str, str], operations
+    ):
+        response = await self._batch(client, auth_headers, *operations)
+
+        assert response.status_code == 422
+
+
 class TestUpdateTask:
     """Tests for PUT /api/v1/tasks/{id} endpoint."""
 
@@ -96,6 +784,22 @@ class TestUpdateTask:
         assert data["completed"] is False
         assert "tags" in data
 
+    async def test_update_uses_single_returning_statement(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        """Update should be one UPDATE ... RETURNING plus the tag lookup."""
+        task = await make_task(title="Old Title")
+        statements.clear()
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}", json={"title": "New"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        # UPDATE ... RETURNING, tag lookup; the user comes from the principal cache.
+        assert len(statements) == 2
+        assert statements[0].lstrip().startswith("UPDATE")
+
     async def test_update_nonexistent_task(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ):
@@ -106,6 +810,125 @@ class TestUpdateTask:
 
         assert response.status_code == 404
 
+    async def test_tag_ids_replace_the_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        """Kept links stay, dropped ones go, new ones are added."""
+        tags = [
+            (
+                await client.post(f"/api/v1/tags/?name={name}", headers=auth_headers)
+            ).json()
+            for name in ("kept", "dropped", "added")
+        ]
+        kept, dropped, added = tags
+        task = await make_task()
+        for tag in (kept, dropped):
+            await client.post(
+                f"/api/v1/tasks/{task['id']}/tags/{tag['id']}", headers=auth_headers
+            )
+        statements.clear()
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}",
+            json={"title": "Retagged", "tag_ids": [added["id"], kept["id"]]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Retagged"
+        assert response.json()["tags"] == [kept, added]
+        # Version, tag lookup, UPDATE, stale link DELETE, link INSERT.
+        assert len(statements) == 5
+        listed = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert sorted(listed[0]["tags"], key=lambda t: t["id"]) == [kept, added]
+
+    async def test_tag_ids_left_out_keep_the_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        tag = (
+            await client.post("/api/v1/tags/?name=work", headers=auth_headers)
+        ).json()
+        task = await make_task()
+        await client.post(
+            f"/api/v1/tasks/{task['id']}/tags/{tag['id']}", headers=auth_headers
+        )
+
+        for body in ({"title": "Renamed"}, {"tag_ids": None}):
+            response = await client.put(
+                f"/api/v1/tasks/{task['id']}", json=body, headers=auth_headers
+            )
+            assert response.json()["tags"] == [tag]
+
+    async def test_unknown_tag_leaves_the_task_unchanged(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        task = await make_task(title="Before")
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}",
+            json={"title": "After", "tag_ids": [999999]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+        listed = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert [t["title"] for t in listed] == ["Before"]
+
+
+class TestReplaceTaskTags:
+    """Tests for PUT /api/v1/tasks/{id}/tags endpoint."""
+
+    async def test_replaces_and_clears_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        old = (await client.post("/api/v1/tags/?name=old", headers=auth_headers)).json()
+        new = (await client.post("/api/v1/tags/?name=new", headers=auth_headers)).json()
+        task = await make_task(title="Keep title")
+        await client.post(
+            f"/api/v1/tasks/{task['id']}/tags/{old['id']}", headers=auth_headers
+        )
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}/tags",
+            json={"tag_ids": [new["id"]]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Keep title"
+        assert response.json()["tags"] == [new]
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}/tags",
+            json={"tag_ids": []},
+            headers=auth_headers,
+        )
+        assert response.json()["tags"] == []
+        listed = (await client.get("/api/v1/tasks/", headers=auth_headers)).json()
+        assert listed[0]["tags"] == []
+
+    async def test_replace_tags_of_nonexistent_task(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ):
+        response = await client.put(
+            "/api/v1/tasks/999999/tags", json={"tag_ids": []}, headers=auth_headers
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Task not found"
+
+    async def test_rejects_too_many_tags(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task
+    ):
+        task = await make_task()
+
+        response = await client.put(
+            f"/api/v1/tasks/{task['id']}/tags",
+            json={"tag_ids": list(range(1, 102))},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
 
 class TestCompleteTask:
     """Tests for PATCH /tasks/{id}/complete endpoint."""
@@ -128,6 +951,22 @@ class TestCompleteTask:
         )
         assert r2.status_code == 200
         assert r2.json()["completed"] is False
+        assert r2.json()["completed_at"] is None
+
+    async def test_toggle_query_count(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        """Toggling should cost one UPDATE and one tag SELECT."""
+        task = await make_task(title="Toggle Task")
+        statements.clear()
+
+        response = await client.patch(
+            f"/api/v1/tasks/{task['id']}/complete", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["completed_at"] is not None
+        assert len(statements) == 2
 
     async def test_complete_nonexistent_task(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -156,6 +995,20 @@ class TestDeleteTask:
         tasks = list_response.json()
         assert not any(t["id"] == task_id for t in tasks)
 
+    async def test_delete_does_not_load_task(
+        self, client: AsyncClient, auth_headers: dict[str, str], make_task, statements
+    ):
+        """Delete should not SELECT the task before removing it."""
+        task = await make_task(title="Delete Me")
+        statements.clear()
+
+        response = await client.delete(
+            f"/api/v1/tasks/{task['id']}", headers=auth_headers
+        )
+
+        assert response.status_code == 204
+        assert not any(s.lstrip().startswith("SELECT tasks") for s in statements)
+
     async def test_delete_nonexistent_task(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ):
@@ -3,6 +3,16 @@ import type { paths } from "./v1";
 
 const client = createClient<paths>({});
 
+// Last response to each GET that carried an ETag. Polls send it back in
+// If-None-Match, and a 304 Not Modified is answered from here, so an
+// unchanged list costs the server one lookup and no body.
+interface CachedResponse {
+  etag: string;
+  body: string;
+  headers: Headers;
+}
+const conditionalCache = new Map<string, CachedResponse>();
+
 // Add auth token to all requests
 client.use({
   onRequest({ request }) {
@@ -10,13 +20,18 @@ client.use({
     if (token) {
       request.headers.set("Authorization", `Bearer ${token}`);
     }
+    const cached = request.method === "GET" && conditionalCache.get(request.url);
+    if (cached) {
+      request.headers.set("If-None-Match", cached.etag);
+    }
     return request;
   },
-  onResponse({ response }) {
+  async onResponse({ request, response }) {
     // Handle 401 Unauthorized - auto logout
     if (response.status === 401) {
       localStorage.removeItem("auth_token");
       localStorage.removeItem("username");
+      conditionalCache.clear();
 
       // Only redirect if not already on login page
       if (
@@ -26,6 +41,18 @@ client.use({
         window.location.href = "/login";
       }
     }
+
+    if (request.method !== "GET") return response;
+
+    const cached = conditionalCache.get(request.url);
+    if (response.status === 304 && cached) {
+      return new Response(cached.body, { status: 200, headers: cached.headers });
+    }
+    const etag = response.headers.get("ETag");
+    if (response.ok && etag) {
+      const body = await response.clone().text();
+      conditionalCache.set(request.url, { etag, body, headers: response.headers });
+    }
     return response;
   },
 });
@@ -88,6 +88,46 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/tasks/batch": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Apply Batch
+         * @description Apply create/update/toggle/move/delete/add_tag/remove_tag operations in order.
+         */
+        post: operations["apply_batch_api_v1_tasks_batch_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/tasks/search": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Search Tasks
+         * @description Search the current user's task titles and descriptions, best match first.
+         */
+        get: operations["search_tasks_api_v1_tasks_search_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/tasks/{task_id}": {
         parameters: {
             query?: never;
@@ -152,6 +192,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/tasks/{task_id}/tags": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        /**
+         * Replace Task Tags
+         * @description Replace a task's tags with ``tag_ids``; an empty list removes them all.
+         */
+        put: operations["replace_task_tags_api_v1_tasks__task_id__tags_put"];
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/tasks/{task_id}/tags/{tag_id}": {
         parameters: {
             query?: never;
@@ -224,15 +284,94 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/sync": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Sync
+         * @description Return the tasks and tags changed, and the ids deleted, after ``since``.
+         */
+        get: operations["sync_api_v1_sync_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
 }
 export type webhooks = Record<string, never>;
 export interface components {
     schemas: {
+        /** BatchResult */
+        BatchResult: {
+            /** Task Id */
+            task_id: number;
+            task: components["schemas"]["TaskRead"] | null;
+        };
+        /** CreateOperation */
+        CreateOperation: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "create";
+            /** Ref */
+            ref?: string | null;
+            task: components["schemas"]["TaskCreate"];
+            /**
+             * Prepend
+             * @default false
+             */
+            prepend?: boolean;
+        };
+        /** DeleteOperation */
+        DeleteOperation: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "delete";
+            /** Task Id */
+            task_id: number | string;
+        };
         /** HTTPValidationError */
         HTTPValidationError: {
             /** Detail */
             detail?: components["schemas"]["ValidationError"][];
         };
+        /** MoveOperation */
+        MoveOperation: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "move";
+            /** Task Id */
+            task_id: number | string;
+            /** After Id */
+            after_id?: number | string | null;
+        };
+        /** SyncRead */
+        SyncRead: {
+            /** Version */
+            version: number;
+            /** Reset */
+            reset: boolean;
+            /** Tasks */
+            tasks: components["schemas"]["TaskRead"][];
+            /** Tags */
+            tags: components["schemas"]["TagRead"][];
+            /** Deleted Tasks */
+            deleted_tasks: number[];
+            /** Deleted Tags */
+            deleted_tags: number[];
+        };
         /** TagRead */
         TagRead: {
             /** Id */
@@ -240,6 +379,30 @@ export interface components {
             /** Name */
             name: string;
         };
+        /** TagOperation */
+        TagOperation: {
+            /**
+             * Op
+             * @enum {string}
+             */
+            op: "add_tag" | "remove_tag";
+            /** Task Id */
+            task_id: number | string;
+            /** Tag Id */
+            tag_id: number;
+        };
+        /** TaskBatch */
+        TaskBatch: {
+            /** Operations */
+            operations: (
+                | components["schemas"]["CreateOperation"]
+                | components["schemas"]["UpdateOperation"]
+                | components["schemas"]["ToggleOperation"]
+                | components["schemas"]["MoveOperation"]
+                | components["schemas"]["DeleteOperation"]
+                | components["schemas"]["TagOperation"]
+            )[];
+        };
         /** TaskCreate */
         TaskCreate: {
             /** Title */
@@ -251,6 +414,8 @@ export interface components {
             description: string;
             /** Deadline (ISO date string e.g. 2026-05-01) */
             deadline?: string | null;
+            /** Tag Ids */
+            tag_ids?: number[];
         };
         /** TaskRead */
         TaskRead: {
@@ -271,6 +436,11 @@ export interface components {
             /** Tags */
             tags: components["schemas"]["TagRead"][];
         };
+        /** TaskTagsUpdate */
+        TaskTagsUpdate: {
+            /** Tag Ids */
+            tag_ids: number[];
+        };
         /** TaskUpdate */
         TaskUpdate: {
             /** Title */
@@ -279,12 +449,35 @@ export interface components {
             description?: string | null;
             /** Deadline */
             deadline?: string | null;
+            /** Tag Ids */
+            tag_ids?: number[] | null;
+        };
+        /** ToggleOperation */
+        ToggleOperation: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "toggle";
+            /** Task Id */
+            task_id: number | string;
         };
         /** TokenOut */
         TokenOut: {
             /** Token */
             token: string;
         };
+        /** UpdateOperation */
+        UpdateOperation: {
+            /**
+             * Op
+             * @constant
+             */
+            op: "update";
+            /** Task Id */
+            task_id: number | string;
+            changes: components["schemas"]["TaskUpdate"];
+        };
         /** UserLogin */
         UserLogin: {
             /** Username */
@@ -386,7 +579,18 @@ export interface operations {
     };
     list_tasks_api_v1_tasks__get: {
         parameters: {
-            query?: never;
+            query?: {
+                completed?: boolean | null;
+                /** @description Case-insensitive substring of the title or description */
+                q?: string | null;
+                /** @description Only tasks due on or after this date */
+                deadline_after?: string | null;
+                /** @description Only tasks due on or before this date */
+                deadline_before?: string | null;
+                sort?: "manual" | "deadline" | "title" | "completed_at";
+                limit?: number | null;
+                cursor?: string | null;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -400,11 +604,49 @@ export interface operations {
                     "application/json": components["schemas"]["TaskRead"][];
                 };
             };
+            /** @description Validation Error */
+            422: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    search_tasks_api_v1_tasks_search_get: {
+        parameters: {
+            query: {
+                q: string;
+                limit?: number;
+                cursor?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["TaskRead"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     create_task_api_v1_tasks__post: {
         parameters: {
-            query?: never;
+            query?: {
+                prepend?: boolean;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -431,6 +673,35 @@ export interface operations {
             };
         };
     };
+    apply_batch_api_v1_tasks_batch_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["TaskBatch"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["BatchResult"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     update_task_api_v1_tasks__task_id__put: {
         parameters: {
             query?: never;
@@ -460,6 +731,35 @@ export interface operations {
             };
         };
     };
+    replace_task_tags_api_v1_tasks__task_id__tags_put: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: { task_id: number };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["TaskTagsUpdate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["TaskRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     delete_task_api_v1_tasks__task_id__delete: {
         parameters: {
             query?: never;
@@ -680,4 +980,31 @@ export interface operations {
             };
         };
     };
+    sync_api_v1_sync_get: {
+        parameters: {
+            query?: {
+                since?: number;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["SyncRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: { [name: string]: unknown };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
 }
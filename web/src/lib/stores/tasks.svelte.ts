@@ -4,7 +4,7 @@ import client from "$lib/api/client";
 type Task = components["schemas"]["TaskRead"];
 type TaskCreate = components["schemas"]["TaskCreate"];
 type TaskUpdate = components["schemas"]["TaskUpdate"];
-type Tag = components["schemas"]["TagRead"];
+type SyncRead = components["schemas"]["SyncRead"];
 
 export type SortOption = "manual" | "alpha-asc" | "alpha-desc";
 
@@ -31,6 +31,9 @@ class TasksStore {
     sortBy: "manual",
   });
 
+  // Server change version the task list reflects; 0 until the first load.
+  private version = 0;
+
   get tasks() { return this.state.tasks; }
   get isLoading() { return this.state.isLoading; }
   get isSaving() { return this.state.isSaving; }
@@ -70,13 +73,34 @@ class TasksStore {
     this.state.tasks.splice(afterIndex + 1, 0, task);
   }
 
-  async fetchTasks() {
+  private applyChanges(changes: SyncRead) {
+    if (changes.reset || this.version === 0) {
+      this.state.tasks = changes.tasks;
+    } else if (changes.tasks.length > 0 || changes.deleted_tasks.length > 0) {
+      const changed = new Map(changes.tasks.map((task) => [task.id, task]));
+      const deleted = new Set(changes.deleted_tasks);
+      const kept = this.state.tasks.filter(
+        (task) => !changed.has(task.id) && !deleted.has(task.id),
+      );
+      this.state.tasks = [...kept, ...changed.values()].sort(
+        (a, b) => a.position - b.position || a.id - b.id,
+      );
+    }
+    this.version = changes.version;
+  }
+
+  // Loads only what changed since the last call; `full` reloads the whole
+  // board, e.g. when another user may have been signed in before.
+  async fetchTasks(full = false) {
     this.state.isLoading = true;
     this.state.error = null;
+    if (full) this.version = 0;
     try {
-      const { data, error } = await client.GET("/api/v1/tasks/");
+      const { data, error } = await client.GET("/api/v1/sync", {
+        params: { query: { since: this.version } },
+      });
       if (error || !data) { this.state.error = "Failed to load tasks"; return; }
-      this.state.tasks = data;
+      this.applyChanges(data);
     } catch (err) {
       this.state.error = "Failed to load tasks";
       console.error("Fetch tasks error:", err);
@@ -93,44 +117,14 @@ class TasksStore {
     this.state.isSaving = true;
     this.state.error = null;
     try {
-      const { data, error } = await client.POST("/api/v1/tasks/", { body: taskData });
-      if (error || !data) { this.state.error = "Failed to create task"; return null; }
-
-      if (tagIds.length > 0) {
-        const tagResponses = await Promise.all(
-          tagIds.map((tagId) =>
-            client.POST("/api/v1/tasks/{task_id}/tags/{tag_id}", {
-              params: { path: { task_id: data.id, tag_id: tagId } },
-            }),
-          ),
-        );
-
-        if (tagResponses.some(({ error }) => error)) {
-          await this.fetchTasks();
-          this.state.error = "Failed to create task";
-          return null;
-        }
-      }
-
-      if (addToTop) {
-        const { error: moveError } = await client.POST("/api/v1/tasks/{task_id}/move", {
-          params: { path: { task_id: data.id }, query: { after_id: null } },
-        });
-
-        if (moveError) {
-          await this.fetchTasks();
-          this.state.error = "Failed to create task";
-          return null;
-        }
-      }
-
-      if (tagIds.length > 0 || addToTop) {
-        await this.fetchTasks();
-        return this.state.tasks.find((task) => task.id === data.id) ?? data;
-      }
+      const { data: task, error } = await client.POST("/api/v1/tasks/", {
+        params: { query: { prepend: addToTop } },
+        body: { ...taskData, tag_ids: tagIds },
+      });
+      if (error || !task) { this.state.error = "Failed to create task"; return null; }
 
-      this.state.tasks = [...this.state.tasks, data];
-      return data;
+      this.state.tasks = addToTop ? [task, ...this.state.tasks] : [...this.state.tasks, task];
+      return task;
     } catch (err) {
       this.state.error = "Failed to create task";
       console.error("Create task error:", err);
@@ -148,63 +142,13 @@ class TasksStore {
     this.state.isSaving = true;
     this.state.error = null;
     try {
-      const { data, error } = await client.PUT("/api/v1/tasks/{task_id}", {
+      const { data: task, error } = await client.PUT("/api/v1/tasks/{task_id}", {
         params: { path: { task_id: taskId } },
-        body: updates,
+        body: { ...updates, tag_ids: tagIds },
       });
-      if (error || !data) { this.state.error = "Failed to update task"; return false; }
-
-      const currentTask = this.state.tasks.find((t) => t.id === taskId);
-      const currentTagIds = currentTask?.tags.map((t) => t.id) ?? [];
-
-      const tagsToRemove = currentTagIds.filter((id) => !tagIds.includes(id));
-      const removeResponses = await Promise.all(
-        tagsToRemove.map((tagId) =>
-          client.DELETE("/api/v1/tasks/{task_id}/tags/{tag_id}", {
-            params: { path: { task_id: taskId, tag_id: tagId } },
-          }),
-        ),
-      );
-
-      const tagsToAdd = tagIds.filter((id) => !currentTagIds.includes(id));
-      const addResponses = await Promise.all(
-        tagsToAdd.map((tagId) =>
-          client.POST("/api/v1/tasks/{task_id}/tags/{tag_id}", {
-            params: { path: { task_id: taskId, tag_id: tagId } },
-          }),
-        ),
-      );
-
-      if (
-        removeResponses.some(({ error }) => error) ||
-        addResponses.some(({ error }) => error)
-      ) {
-        await this.fetchTasks();
-        this.state.error = "Failed to update task";
-        return false;
-      }
-
-      const tags = currentTask?.tags
-        ? currentTask.tags
-            .filter((tag) => tagIds.includes(tag.id))
-            .map((tag) => ({ ...tag }))
-        : [];
-
-      const knownTagNames = new Map<number, string>(tags.map((tag) => [tag.id, tag.name]));
-      for (const response of addResponses) {
-        if (response.data) {
-          knownTagNames.set(response.data.id, response.data.name);
-        }
-      }
-
-      const nextTags: Tag[] = tagIds
-        .map((tagId) => {
-          const name = knownTagNames.get(tagId);
-          return name ? { id: tagId, name } : null;
-        })
-        .filter((tag): tag is Tag => tag !== null);
+      if (error || !task) { this.state.error = "Failed to update task"; return false; }
 
-      this.replaceTask({ ...data, tags: nextTags });
+      this.replaceTask(task);
       return true;
     } catch (err) {
       this.state.error = "Failed to update task";